@@ -30,6 +30,7 @@ setup(name='fpinpy',
       package_dir={'': 'src/main'},
       packages=find_packages(where='src/main', exclude=()),
       install_requires=[''],
+      extras_require={'numpy': ['numpy']},
       setup_requires=['wheel'],
       tests_require=['pytest', 'pyhamcrest'],
      )
@@ -20,6 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 #
-from .result import Result, Success, Failure, Empty
+from .result import Result, Success, Failure, Empty, Validation
 from .readers import IniConfigReader
-from .collections import MapUtilities, SinglyLinkedList, Nil, Cons
+from .collections import MapUtilities, SinglyLinkedList, Nil, Cons, Stream, ChunkedList, PersistentVector, PersistentHashMap, NumericList, RandomAccessList
+from .tailcall import TailCall, trampoline
+
+import os
+if os.environ.get("FPINPY_INSTRUMENTATION", "") not in ("", "0"):
+    from . import instrumentation # enables itself, see fpinpy.instrumentation
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Micro-benchmark registry, runner and baseline comparison.
+
+    Cases register with the benchmark decorator. A case function
+    receives the size and returns the zero-argument callable to time,
+    so setup work stays out of the measurement. The standard cases
+    live in fpinpy.bench.cases; run them with
+
+    python -m fpinpy.bench [--baseline FILE] [--output FILE]
+
+    or make bench. Results map case ids such as
+    "SinglyLinkedList.map[10000]" to the best time per call in
+    seconds. compare() reports every case that is slower than its
+    baseline by more than the threshold.
+"""
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+# Each measurement loops the case until it takes at least this long.
+MIN_MEASUREMENT_SECONDS = 0.01
+
+class Benchmark(NamedTuple):
+    name: str
+    size: Optional[int]
+    setup: Callable
+
+    @property
+    def id(self) -> str:
+        return self.name if self.size is None else f"{self.name}[{self.size}]"
+
+class Regression(NamedTuple):
+    id: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+BENCHMARKS: List[Benchmark] = []
+
+def benchmark(name: str, sizes: Iterable[Optional[int]]=DEFAULT_SIZES):
+    """ Registers the decorated setup function once per size.
+
+        Usage:
+
+        @benchmark("SinglyLinkedList.reverse")
+        def _(size):
+            aList = SinglyLinkedList.fromIterable(range(size))
+            return aList.reverse
+    """
+    def register(setup: Callable):
+        for size in sizes:
+            BENCHMARKS.append(Benchmark(name, size, setup))
+        return setup
+    return register
+
+def select(patterns: Iterable[str]=(), maxSize: Optional[int]=None) -> List[Benchmark]:
+    """ Registered cases whose id equals or matches (fnmatch) any pattern; all when none are given. """
+    patterns = list(patterns)
+    return [case for case in BENCHMARKS
+            if (not patterns or any(case.id == pattern or fnmatch.fnmatchcase(case.id, pattern) for pattern in patterns))
+            and (maxSize is None or case.size is None or case.size <= maxSize)]
+
+def measure(function: Callable, repeat: int=DEFAULT_REPEAT) -> Dict[str, float]:
+    """ Best and median seconds per call over repeat measurements. """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        seconds = timer.timeit(number)
+        if seconds >= MIN_MEASUREMENT_SECONDS:
+            break
+        number *= 10 if seconds < MIN_MEASUREMENT_SECONDS / 10 else 2
+    timings = [seconds / number for seconds in timer.repeat(repeat, number)]
+    return {"min": min(timings), "median": statistics.median(timings), "number": number}
+
+def run(cases: Iterable[Benchmark], repeat: int=DEFAULT_REPEAT, report: Optional[Callable[[str, Dict[str, float]], None]]=None) -> Dict[str, Dict[str, float]]:
+    """ Times every case. report, if given, is called after each one. """
+    results = {}
+    for case in cases:
+        results[case.id] = measure(case.setup(case.size), repeat)
+        if report is not None:
+            report(case.id, results[case.id])
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float=DEFAULT_THRESHOLD) -> List[Regression]:
+    """ Cases whose best time exceeds the baseline's by more than threshold (0.25 = 25 %).
+
+        Cases missing from either side are ignored.
+    """
+    regressions = []
+    for id, current in results.items():
+        previous = baseline.get(id)
+        if previous is not None and current["min"] > previous["min"] * (1 + threshold):
+            regressions.append(Regression(id, previous["min"], current["min"]))
+    return regressions
+
+def save(results: Dict[str, Dict[str, float]], path: str) -> None:
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def load(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path) as file:
+        return json.load(file)["results"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Command line entry point: python -m fpinpy.bench --help"""
+import argparse
+import os
+import sys
+
+from fpinpy import bench
+from fpinpy.bench import cases # registers the standard cases
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m fpinpy.bench", description="Runs the fpinpy micro-benchmarks.")
+    parser.add_argument("patterns", nargs="*", help="fnmatch patterns on case ids, e.g. 'SinglyLinkedList.*'")
+    parser.add_argument("--list", action="store_true", help="list the selected cases and exit")
+    parser.add_argument("--max-size", type=int, help="skip cases larger than this size")
+    parser.add_argument("--repeat", type=int, default=bench.DEFAULT_REPEAT, help="measurements per case (default %(default)s)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=bench.DEFAULT_THRESHOLD,
+                        help="allowed slowdown against the baseline (default %(default)s = 25%%)")
+    args = parser.parse_args(argv)
+
+    selected = bench.select(args.patterns, args.max_size)
+    if args.list:
+        for case in selected:
+            print(case.id)
+        return 0
+    if args.baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --output (make bench-baseline).", file=sys.stderr)
+        return 2
+    baseline = bench.load(args.baseline) if args.baseline else {}
+
+    width = max((len(case.id) for case in selected), default=10)
+    print(f"{'case':<{width}}{'best':>12}{'median':>12}{'baseline':>12}{'ratio':>8}")
+    def report(id, result):
+        previous = baseline.get(id)
+        ratio = f"{result['min'] / previous['min']:>8.2f}" if previous else f"{'':>8}"
+        before = f"{_format(previous['min']):>12}" if previous else f"{'':>12}"
+        print(f"{id:<{width}}{_format(result['min']):>12}{_format(result['median']):>12}{before}{ratio}", flush=True)
+    results = bench.run(selected, args.repeat, report)
+
+    if args.output:
+        bench.save(results, args.output)
+    regressions = bench.compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression.id}: {_format(regression.baseline)} -> {_format(regression.current)} "
+              f"({regression.ratio:.2f}x, threshold {1 + args.threshold:.2f}x)", file=sys.stderr)
+    return 1 if regressions else 0
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Standard cases: SinglyLinkedList, both Result implementations, traverse/sequence, TailCall and IniConfigReader.
+
+    Sizes span two orders of magnitude so that superlinear behaviour
+    shows up as a growing time per element, not only as a slow case.
+"""
+import operator
+
+from fpinpy.bench import benchmark
+from fpinpy.collections import SinglyLinkedList, ListBuilder
+from fpinpy.readers import IniConfigReader
+from fpinpy.result import result_using_bool_distinguisher, result_using_subclass_distinguisher, Validation
+from fpinpy.tailcall import TailCall, trampoline
+
+CHAIN_SIZES = (100, 1_000, 10_000)
+CONFIG_SIZES = (10, 100, 1_000)
+
+def _increment(x):
+    return x + 1
+
+def _is_even(x):
+    return x % 2 == 0
+
+def _pair(x):
+    return SinglyLinkedList.list(x, -x)
+
+def _add(accumulator):
+    return lambda x: accumulator + x
+
+def _range_list(size: int):
+    return SinglyLinkedList.fromIterable(range(size))
+
+# SinglyLinkedList construction
+
+@benchmark("SinglyLinkedList.list")
+def _(size):
+    values = tuple(range(size))
+    return lambda: SinglyLinkedList.list(*values)
+
+@benchmark("SinglyLinkedList.fromIterable.sequence")
+def _(size):
+    values = list(range(size))
+    return lambda: SinglyLinkedList.fromIterable(values)
+
+@benchmark("SinglyLinkedList.fromIterable.generator")
+def _(size):
+    return lambda: SinglyLinkedList.fromIterable(x for x in range(size))
+
+@benchmark("ListBuilder.append")
+def _(size):
+    def build():
+        builder = ListBuilder()
+        for x in range(size):
+            builder.append(x)
+        return builder.freeze()
+    return build
+
+# SinglyLinkedList conversion and combinators
+
+@benchmark("SinglyLinkedList.toPyList")
+def _(size):
+    return _range_list(size).toPyList
+
+@benchmark("SinglyLinkedList.str")
+def _(size):
+    return _range_list(size).__str__
+
+@benchmark("SinglyLinkedList.reverse")
+def _(size):
+    return _range_list(size).reverse
+
+@benchmark("SinglyLinkedList.map")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.map(_increment)
+
+@benchmark("SinglyLinkedList.filter")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.filter(_is_even)
+
+@benchmark("SinglyLinkedList.flatMap")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.flatMap(_pair)
+
+@benchmark("SinglyLinkedList.flatten")
+def _(size):
+    nested = _range_list(size).map(_pair)
+    return lambda: SinglyLinkedList.flatten(nested)
+
+@benchmark("SinglyLinkedList.concat")
+def _(size):
+    aList = _range_list(size)
+    return lambda: SinglyLinkedList.concat(aList, aList)
+
+@benchmark("SinglyLinkedList.foldLeft")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.foldLeft(0, _add)
+
+@benchmark("SinglyLinkedList.foldRight")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.foldRight(0, _add)
+
+@benchmark("SinglyLinkedList.foldl")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.foldl(0, operator.add)
+
+@benchmark("SinglyLinkedList.foldr")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.foldr(0, operator.add)
+
+@benchmark("SinglyLinkedList.drop")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.drop(size - 1)
+
+@benchmark("SinglyLinkedList.eq")
+def _(size):
+    first, second = _range_list(size), _range_list(size)
+    return lambda: first == second
+
+@benchmark("SinglyLinkedList.partition")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.partition(_is_even)
+
+@benchmark("SinglyLinkedList.sortBy")
+def _(size):
+    aList = SinglyLinkedList.fromIterable((x * 7919) % size for x in range(size))
+    return aList.sortBy
+
+@benchmark("SinglyLinkedList.view")
+def _(size):
+    aList = _range_list(size)
+    return lambda: aList.view().map(_increment).filter(_is_even).foldLeft(0, _add)
+
+# traverse / sequence
+
+@benchmark("SinglyLinkedList.traverse")
+def _(size):
+    aList = _range_list(size)
+    success = result_using_subclass_distinguisher.Result.success
+    return lambda: SinglyLinkedList.traverse(aList, success)
+
+@benchmark("SinglyLinkedList.traverse.failFast")
+def _(size):
+    aList = _range_list(size)
+    Result = result_using_subclass_distinguisher.Result
+    failAtTen = lambda x: Result.failure(ValueError(x)) if x == 10 else Result.success(x)
+    return lambda: SinglyLinkedList.traverse(aList, failAtTen, failFast=True)
+
+@benchmark("Validation.traverse")
+def _(size):
+    aList = _range_list(size)
+    Result = result_using_subclass_distinguisher.Result
+    failOdd = lambda x: Result.failure(ValueError(x)) if x % 2 else Result.success(x)
+    return lambda: Validation.traverse(aList, failOdd)
+
+@benchmark("SinglyLinkedList.sequence")
+def _(size):
+    results = _range_list(size).map(result_using_subclass_distinguisher.Result.success)
+    return lambda: SinglyLinkedList.sequence(results)
+
+# Result chains, for both implementations
+
+for _label, _Result in (("subclass", result_using_subclass_distinguisher.Result),
+                        ("bool", result_using_bool_distinguisher.Result)):
+
+    @benchmark(f"Result[{_label}].map", CHAIN_SIZES)
+    def _(size, Result=_Result):
+        def chain():
+            result = Result.success(0)
+            for _ in range(size):
+                result = result.map(_increment)
+            return result
+        return chain
+
+    @benchmark(f"Result[{_label}].flatMap", CHAIN_SIZES)
+    def _(size, Result=_Result):
+        step = lambda x: Result.success(x + 1)
+        def chain():
+            result = Result.success(0)
+            for _ in range(size):
+                result = result.flatMap(step)
+            return result
+        return chain
+
+# TailCall, against the plain loop computing the same fold
+
+@trampoline
+def _trampolined_sum(aList, accumulator):
+    if aList.isEmpty():
+        return TailCall.done(accumulator)
+    return _trampolined_sum.tailCall(aList.tail(), accumulator + aList.head())
+
+@benchmark("TailCall.loop")
+def _(size):
+    aList = _range_list(size)
+    def loop():
+        accumulator, current = 0, aList
+        while not current.isEmpty():
+            accumulator += current.head()
+            current = current.tail()
+        return accumulator
+    return loop
+
+@benchmark("TailCall.trampoline")
+def _(size):
+    aList = _range_list(size)
+    return lambda: _trampolined_sum(aList, 0)
+
+@benchmark("TailCall.flatMapResult", CHAIN_SIZES)
+def _(size):
+    Result = result_using_subclass_distinguisher.Result
+    step = lambda x: TailCall.done(Result.success(x + 1))
+    def chain():
+        tailCall = TailCall.done(Result.success(0))
+        for _ in range(size):
+            tailCall = tailCall.flatMapResult(step)
+        return tailCall.run()
+    return chain
+
+# IniConfigReader
+
+def _config_text(keys: int) -> str:
+    lines = []
+    for section in range(max(keys // 10, 1)):
+        lines.append(f"[section{section}]")
+        lines.extend(f"key{key} = value{key}" for key in range(10))
+    return "\n".join(lines)
+
+@benchmark("IniConfigReader.load", CONFIG_SIZES)
+def _(size):
+    text = _config_text(size)
+    return lambda: IniConfigReader.of(text)
+
+@benchmark("IniConfigReader.getProperty", CONFIG_SIZES)
+def _(size):
+    reader = IniConfigReader.of(_config_text(size)).getOrThrow()
+    sections = [f"section{section}" for section in range(max(size // 10, 1))]
+    def lookup():
+        for section in sections:
+            reader.getProperty(section, "key5")
+    return lookup
+
+@benchmark("IniConfigReader.getSection", CONFIG_SIZES)
+def _(size):
+    reader = IniConfigReader.of(_config_text(size)).getOrThrow()
+    sections = [f"section{section}" for section in range(max(size // 10, 1))]
+    def lookup():
+        for section in sections:
+            reader.getSection(section)
+    return lookup
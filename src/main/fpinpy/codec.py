@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Compact binary format for SinglyLinkedList, Result and plain values.
+
+    dumps/loads convert to and from bytes; dump/load write and read
+    length-prefixed frames, so several values can share one pipe or
+    file. Encoding and decoding use an explicit stack, so nesting depth
+    and list length are not limited by the recursion limit.
+
+    Lists whose elements are all int (within 64 bits) or all float are
+    stored as one raw array block. array.array values are stored the
+    same way. loads accepts bytes, bytearray or memoryview and decodes
+    such blocks straight from the buffer.
+
+    Supported values: None, bool, int, float, str, bytes, bytearray,
+    memoryview (decoded as bytes), array.array, tuple, list, dict,
+    SinglyLinkedList, Success, Failure and Empty. Anything else raises
+    TypeError.
+
+    A Failure keeps the exception class, its args and the traceback as
+    text. On decoding the class is looked up among modules already
+    imported; nothing is imported on behalf of the data. Unknown
+    classes, or args the codec cannot store, degrade to RuntimeError
+    with the original message.
+"""
+import array
+import struct
+import sys
+from itertools import chain
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from fpinpy.result import Result, Success, Failure, Empty
+from typing import Any
+
+MAGIC = b"FPC\x01"
+
+_LENGTH = struct.Struct("<I")
+_FRAME = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_SWAP = sys.byteorder != "little"
+
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+_INT = b"q"
+_BIGINT = b"I"
+_FLOAT = b"d"
+_STR = b"S"
+_BYTES = b"B"
+_ARRAY = b"a"
+_NUMERIC_LIST = b"A"
+_LIST = b"L"
+_TUPLE = b"Y"
+_PYLIST = b"P"
+_DICT = b"M"
+_SUCCESS = b"R"
+_EMPTY = b"E"
+_FAILURE = b"X"
+
+def dumps(value: Any) -> bytes:
+    """ Encodes value. Raises TypeError for unsupported types. """
+    out = bytearray(MAGIC)
+    stack = [iter((value,))]
+    while stack:
+        for item in stack[-1]:
+            children = _encode_one(item, out)
+            if children is not None:
+                stack.append(children)
+                break
+        else:
+            stack.pop()
+    return bytes(out)
+
+def loads(data) -> Any:
+    """ Decodes one value from bytes, bytearray or memoryview.
+
+        Raises ValueError on malformed or truncated data.
+    """
+    view = memoryview(data).cast("B")
+    if view[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not fpinpy.codec data: bad magic")
+    try:
+        return _decode(view, len(MAGIC))
+    except (IndexError, struct.error) as e:
+        raise ValueError("Truncated fpinpy.codec data") from e
+
+def dump(value: Any, file) -> None:
+    """ Writes value as one length-prefixed frame to a binary file. """
+    payload = dumps(value)
+    file.write(_FRAME.pack(len(payload)))
+    file.write(payload)
+
+def load(file) -> Any:
+    """ Reads one frame written by dump. Raises EOFError at end of file. """
+    header = _read_exactly(file, _FRAME.size)
+    if not header:
+        raise EOFError("No more fpinpy.codec frames")
+    (size,) = _FRAME.unpack(header)
+    payload = _read_exactly(file, size)
+    if len(payload) != size:
+        raise ValueError("Truncated fpinpy.codec frame")
+    return loads(payload)
+
+def _read_exactly(file, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = file.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+def _encode_one(item, out: bytearray):
+    """Writes item, or the header of a container.
+
+        Returns an iterator over the children still to be written, or
+        None for scalars.
+    """
+    kind = type(item)
+    if item is None:
+        out += _NONE
+    elif kind is bool:
+        out += _TRUE if item else _FALSE
+    elif kind is int:
+        if _INT64_MIN <= item <= _INT64_MAX:
+            out += _INT
+            out += _INT64.pack(item)
+        else:
+            raw = item.to_bytes((item.bit_length() + 8) // 8, "little", signed=True)
+            out += _BIGINT
+            out += _LENGTH.pack(len(raw))
+            out += raw
+    elif kind is float:
+        out += _FLOAT
+        out += _FLOAT64.pack(item)
+    elif kind is str:
+        raw = item.encode("utf-8", "surrogatepass")
+        out += _STR
+        out += _LENGTH.pack(len(raw))
+        out += raw
+    elif kind is bytes or kind is bytearray or kind is memoryview:
+        raw = memoryview(item)
+        raw = raw.cast("B") if raw.c_contiguous else memoryview(raw.tobytes())
+        out += _BYTES
+        out += _LENGTH.pack(len(raw))
+        out += raw
+    elif kind is array.array:
+        out += _ARRAY
+        _write_array(item, out)
+    elif isinstance(item, SinglyLinkedList):
+        values = item.toPyList()
+        block = _numeric_block(values)
+        if block is not None:
+            out += _NUMERIC_LIST
+            _write_array(block, out)
+            return None
+        out += _LIST
+        out += _LENGTH.pack(len(values))
+        return iter(values)
+    elif kind is tuple:
+        out += _TUPLE
+        out += _LENGTH.pack(len(item))
+        return iter(item)
+    elif kind is list:
+        out += _PYLIST
+        out += _LENGTH.pack(len(item))
+        return iter(item)
+    elif kind is dict:
+        out += _DICT
+        out += _LENGTH.pack(len(item))
+        return chain.from_iterable(item.items())
+    elif isinstance(item, Success):
+        out += _SUCCESS
+        return iter((item.successValue(),))
+    elif isinstance(item, Failure):
+        out += _FAILURE
+        return iter(_failure_fields(item))
+    elif isinstance(item, Empty):
+        out += _EMPTY
+    else:
+        raise TypeError(f"fpinpy.codec cannot encode {kind.__name__}")
+    return None
+
+def _numeric_block(values: list):
+    """An array.array holding values if they are all int64 or all float."""
+    if not values:
+        return None
+    first = type(values[0])
+    if first is int:
+        if any(type(value) is not int for value in values):
+            return None
+        try:
+            return array.array("q", values)
+        except OverflowError:
+            return None
+    if first is float:
+        if any(type(value) is not float for value in values):
+            return None
+        return array.array("d", values)
+    return None
+
+def _write_array(values: array.array, out: bytearray) -> None:
+    if _SWAP and values.itemsize > 1:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    out += values.typecode.encode("ascii")
+    out += bytes((values.itemsize,))
+    out += _LENGTH.pack(len(values))
+    out += memoryview(values).cast("B")
+
+def _read_array(view: memoryview, position: int):
+    typecode = chr(view[position])
+    itemsize = view[position + 1]
+    (count,) = _LENGTH.unpack_from(view, position + 2)
+    position += 2 + _LENGTH.size
+    try:
+        values = array.array(typecode)
+    except ValueError as e:
+        raise ValueError(f"Unknown array typecode {typecode!r}") from e
+    if values.itemsize != itemsize:
+        raise ValueError(f"Array typecode {typecode!r} has item size {values.itemsize} here, data has {itemsize}")
+    end = position + count * itemsize
+    if end > len(view):
+        raise ValueError("Truncated fpinpy.codec data")
+    values.frombytes(view[position:end])
+    if _SWAP and itemsize > 1:
+        values.byteswap()
+    return values, end
+
+def _failure_fields(failure) -> tuple:
+    exception = failure.failureValue()
+    kind = type(exception)
+    args = exception.args
+    try:
+        dumps(args)
+    except TypeError:
+        args = (str(exception),)
+    return (kind.__module__, kind.__qualname__, args, failure.tracebackText())
+
+def _make_failure(module: str, qualname: str, args: tuple, tracebackText: str):
+    kind = _find_exception_class(module, qualname)
+    try:
+        exception = kind(*args) if kind is not None else None
+    except Exception:
+        exception = None
+    if exception is None:
+        message = args[0] if len(args) == 1 else args
+        exception = RuntimeError(f"{module}.{qualname}: {message}")
+    failure = Result.failure(exception)
+    failure.exception_type = None
+    failure.exception_object = None
+    failure.exception_traceback = None
+    failure.exception_traceback_text = tracebackText
+    return failure
+
+def _find_exception_class(module: str, qualname: str):
+    target = sys.modules.get(module)
+    for name in qualname.split("."):
+        target = getattr(target, name, None)
+    if isinstance(target, type) and issubclass(target, BaseException):
+        return target
+    return None
+
+_BUILD = {
+    _LIST: SinglyLinkedList.fromIterable,
+    _TUPLE: tuple,
+    _PYLIST: lambda items: items,
+    _DICT: lambda items: dict(zip(items[::2], items[1::2])),
+    _SUCCESS: lambda items: Result.success(items[0]),
+    _FAILURE: lambda items: _make_failure(*items),
+}
+
+_CHILDREN = {_SUCCESS: 1, _FAILURE: 4}
+
+def _decode(view: memoryview, position: int):
+    # Each frame is [tag, children still missing, decoded children].
+    stack: list = []
+    while True:
+        tag = bytes(view[position:position + 1])
+        position += 1
+        if tag == _INT:
+            (value,) = _INT64.unpack_from(view, position)
+            position += _INT64.size
+        elif tag == _STR:
+            (size,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            value = str(view[position:position + size], "utf-8", "surrogatepass")
+            position += size
+        elif tag == _FLOAT:
+            (value,) = _FLOAT64.unpack_from(view, position)
+            position += _FLOAT64.size
+        elif tag == _NONE:
+            value = None
+        elif tag == _TRUE:
+            value = True
+        elif tag == _FALSE:
+            value = False
+        elif tag == _BIGINT:
+            (size,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            value = int.from_bytes(view[position:position + size], "little", signed=True)
+            position += size
+        elif tag == _BYTES:
+            (size,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            value = view[position:position + size].tobytes()
+            position += size
+        elif tag == _ARRAY:
+            value, position = _read_array(view, position)
+        elif tag == _NUMERIC_LIST:
+            values, position = _read_array(view, position)
+            value = SinglyLinkedList.fromIterable(values)
+        elif tag == _EMPTY:
+            value = Result.empty()
+        elif tag in _BUILD:
+            if tag in _CHILDREN:
+                count = _CHILDREN[tag]
+            else:
+                (count,) = _LENGTH.unpack_from(view, position)
+                position += _LENGTH.size
+                if tag == _DICT:
+                    count *= 2
+            if count:
+                stack.append([tag, count, []])
+                continue
+            value = _BUILD[tag]([])
+        elif not tag:
+            raise ValueError("Truncated fpinpy.codec data")
+        else:
+            raise ValueError(f"Unknown fpinpy.codec tag {tag!r} at offset {position - 1}")
+        # Hand the value to its parent, closing every container it completes.
+        while stack:
+            frame = stack[-1]
+            frame[2].append(value)
+            frame[1] -= 1
+            if frame[1]:
+                break
+            stack.pop()
+            value = _BUILD[frame[0]](frame[2])
+        else:
+            if position != len(view):
+                raise ValueError(f"{len(view) - position} trailing bytes after fpinpy.codec value")
+            return value
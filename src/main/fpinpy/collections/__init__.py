@@ -21,4 +21,12 @@
 # SOFTWARE.
 #
 from .map import MapUtilities
-from .singly_linked_list import SinglyLinkedList, Nil, Cons
+from .singly_linked_list import SinglyLinkedList, Nil, Cons, ListBuilder
+from .stream import Stream
+from .chunked_list import ChunkedList
+from .vector import PersistentVector, TransientVector
+from .hash_map import PersistentHashMap, TransientHashMap
+from .view import ListView
+from .intern import InternPool
+from .numeric_list import NumericList
+from .random_access_list import RandomAccessList
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import array
+from itertools import islice
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from typing import TypeVar, Generic, Any, Callable, Iterable, Optional, Tuple
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+
+DEFAULT_CHUNK_SIZE = 64
+
+class ChunkedList(Generic[T]):
+    """Persistent list storing its elements in immutable chunks.
+
+        Each node holds one chunk (a tuple, or an array.array for
+        primitive data), an offset into that chunk and the next node.
+        tail() only advances the offset, so it is O(1) and shares the
+        chunk. Bulk operations such as map and foldLeft work chunk by
+        chunk instead of chasing one pointer per element.
+
+        Chunks are never mutated after construction. Prefer the
+        factories over direct construction. The empty list is its own
+        next node, so the chain never ends in None.
+    """
+    __slots__ = ('_chunk', '_offset', '_next', '_length')
+    _next: "ChunkedList[T]"
+
+    def __init__(self, chunk, offset: int, next: Optional["ChunkedList[T]"], length: int):
+        self._chunk = chunk
+        self._offset = offset
+        self._next = self if next is None else next
+        self._length = length
+
+    @staticmethod
+    def empty():
+        return _EMPTY
+
+    @staticmethod
+    def list(*args):
+        return ChunkedList.fromIterable(args)
+
+    @staticmethod
+    def fromIterable(iterable: Iterable[T], chunkSize: int=DEFAULT_CHUNK_SIZE, typecode: Optional[str]=None):
+        """ Builds a ChunkedList from any iterable.
+
+            Input:
+            iterable: Iterable[T]
+            chunkSize: int; number of elements per chunk
+            typecode: str; if given, chunks are array.array(typecode),
+                which stores primitives unboxed (see the array module)
+        """
+        if chunkSize < 1:
+            raise ValueError(f"chunkSize must be positive but was {chunkSize}")
+        iterator = iter(iterable)
+        chunks = []
+        while True:
+            chunk: Tuple[Any, ...] = tuple(islice(iterator, chunkSize))
+            if not chunk:
+                break
+            chunks.append(array.array(typecode, chunk) if typecode is not None else chunk)
+        return _link(chunks, _EMPTY)
+
+    @staticmethod
+    def fromList(aList: SinglyLinkedList[T], chunkSize: int=DEFAULT_CHUNK_SIZE, typecode: Optional[str]=None):
+        """ Converts a SinglyLinkedList in one pass. """
+        return ChunkedList.fromIterable(aList, chunkSize, typecode)
+
+    def cons(self, head: T):
+        """ Prepends one element as a chunk of its own. """
+        return ChunkedList((head,), 0, self, self._length + 1)
+
+    def head(self) -> T:
+        if not self._length:
+            raise RuntimeError("head called on empty list")
+        return self._chunk[self._offset]
+
+    def tail(self):# -> ChunkedList[T]
+        if not self._length:
+            raise RuntimeError("tail called on empty list")
+        offset = self._offset + 1
+        if offset == len(self._chunk):
+            return self._next
+        return ChunkedList(self._chunk, offset, self._next, self._length - 1)
+
+    def isEmpty(self) -> bool:
+        return self._length == 0
+
+    def length(self) -> int:
+        return self._length
+
+    def drop(self, n: int):
+        """ Removes n elements from the front. Skips whole chunks. """
+        node = self
+        while n > 0 and node._length:
+            remaining = len(node._chunk) - node._offset
+            if n < remaining:
+                return ChunkedList(node._chunk, node._offset + n, node._next, node._length - n)
+            n -= remaining
+            node = node._next
+        return node
+
+    def chunks(self):
+        """ Iterates the chunks, the first one trimmed to the offset. """
+        node = self
+        while node._length:
+            yield node._chunk[node._offset:] if node._offset else node._chunk
+            node = node._next
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def map(self, function: Callable[[T], U]):# -> ChunkedList[U]
+        """ Maps chunk by chunk. Output chunks are tuples. """
+        return _link([tuple(map(function, chunk)) for chunk in self.chunks()], _EMPTY)
+
+    def filter(self, predicate: Callable[[T], bool]):
+        chunks = []
+        for chunk in self.chunks():
+            kept = tuple(elem for elem in chunk if predicate(elem))
+            if kept:
+                chunks.append(kept)
+        return _link(chunks, _EMPTY)
+
+    def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]) -> U:
+        accumulator = identity
+        for chunk in self.chunks():
+            for elem in chunk:
+                accumulator = function(accumulator)(elem)
+        return accumulator
+
+    def forEach(self, effect: Callable[[T], None]) -> None:
+        for chunk in self.chunks():
+            for elem in chunk:
+                effect(elem)
+        return None
+
+    def toPyList(self):
+        output: list = []
+        for chunk in self.chunks():
+            output.extend(chunk)
+        return output
+
+    def toList(self):# -> SinglyLinkedList[T]
+        return SinglyLinkedList.fromIterable(self.toPyList())
+
+    def __str__(self):
+        return f"[{''.join(f'{elem}, ' for elem in self)}NIL]"
+
+    def __repr__(self):
+        return f"ChunkedList({str(self)})"
+
+    def __reduce__(self):
+        """ Pickles the chunks as one flat list instead of a nested chain. """
+        return (_from_chunks, (list(self.chunks()),))
+
+def _from_chunks(chunks):
+    return _link(chunks, _EMPTY)
+
+def _link(chunks, next):
+    """Links non-empty chunks in front of next."""
+    for chunk in reversed(chunks):
+        next = ChunkedList(chunk, 0, next, len(chunk) + next._length)
+    return next
+
+_EMPTY: ChunkedList[Any] = ChunkedList((), 0, None, 0)
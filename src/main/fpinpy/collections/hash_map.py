@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+from collections import abc
+from fpinpy.result import Result
+from typing import TypeVar, Mapping, ItemsView, Iterable, Iterator, Optional, Tuple
+# Declare module-scoped type variables for generics
+K = TypeVar('K')
+V = TypeVar('V')
+
+BITS = 5
+MASK = (1 << BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+class _SubNode:
+    """Marks a slot pair holding a child node instead of a key/value."""
+    def __repr__(self):
+        return "<node>"
+
+_NODE = _SubNode()
+
+def _hash(key) -> int:
+    return hash(key) & _HASH_MASK
+
+class _BitmapNode:
+    """Trie node with up to 32 slots.
+
+        bitmap marks the occupied slots. array holds two entries per
+        occupied slot, in slot order: key, value for a leaf, or _NODE,
+        child for a subtree.
+
+        edit is None for persistent nodes and the owning transient's
+        token for nodes that transient may mutate in place.
+    """
+    __slots__ = ('edit', 'bitmap', 'array')
+
+    def __init__(self, edit, bitmap: int, array: list):
+        self.edit = edit
+        self.bitmap = bitmap
+        self.array = array
+
+    def _editable(self, edit):
+        if edit is not None and self.edit is edit:
+            return self
+        return _BitmapNode(edit, self.bitmap, list(self.array))
+
+    def _set(self, edit, i: int, value):
+        node = self._editable(edit)
+        node.array[i] = value
+        return node
+
+    def find(self, shift: int, h: int, key, notFound):
+        bit = 1 << ((h >> shift) & MASK)
+        if not self.bitmap & bit:
+            return notFound
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k = self.array[idx]
+        if k is _NODE:
+            return self.array[idx + 1].find(shift + BITS, h, key, notFound)
+        if k is key or k == key:
+            return self.array[idx + 1]
+        return notFound
+
+    def assoc(self, edit, shift: int, h: int, key, value, added: list):
+        bit = 1 << ((h >> shift) & MASK)
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        if not self.bitmap & bit:
+            added[0] = True
+            if edit is not None and self.edit is edit:
+                self.array[idx:idx] = [key, value]
+                self.bitmap |= bit
+                return self
+            return _BitmapNode(edit, self.bitmap | bit, self.array[:idx] + [key, value] + self.array[idx:])
+        k = self.array[idx]
+        v = self.array[idx + 1]
+        if k is _NODE:
+            child = v.assoc(edit, shift + BITS, h, key, value, added)
+            return self if child is v else self._set(edit, idx + 1, child)
+        if k is key or k == key:
+            return self if v is value else self._set(edit, idx + 1, value)
+        added[0] = True
+        node = self._editable(edit)
+        node.array[idx] = _NODE
+        node.array[idx + 1] = _create_node(edit, shift + BITS, k, v, h, key, value)
+        return node
+
+    def without(self, edit, shift: int, h: int, key, removed: list):
+        """New node without key; None when the node becomes empty."""
+        bit = 1 << ((h >> shift) & MASK)
+        if not self.bitmap & bit:
+            return self
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k = self.array[idx]
+        if k is _NODE:
+            child = self.array[idx + 1]
+            new_child = child.without(edit, shift + BITS, h, key, removed)
+            if new_child is child:
+                return self
+            if new_child is not None:
+                return self._set(edit, idx + 1, new_child)
+        elif k is key or k == key:
+            removed[0] = True
+        else:
+            return self
+        if self.bitmap == bit:
+            return None
+        node = self._editable(edit)
+        del node.array[idx:idx + 2]
+        node.bitmap ^= bit
+        return node
+
+    def entries(self) -> Iterator[Tuple]:
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is _NODE:
+                yield from array[i + 1].entries()
+            else:
+                yield array[i], array[i + 1]
+
+class _CollisionNode:
+    """Leaf for keys whose full hashes are equal. array as in _BitmapNode."""
+    __slots__ = ('edit', 'hash', 'array')
+
+    def __init__(self, edit, hash: int, array: list):
+        self.edit = edit
+        self.hash = hash
+        self.array = array
+
+    def _index(self, key) -> int:
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is key or array[i] == key:
+                return i
+        return -1
+
+    def _editable(self, edit):
+        if edit is not None and self.edit is edit:
+            return self
+        return _CollisionNode(edit, self.hash, list(self.array))
+
+    def find(self, shift: int, h: int, key, notFound):
+        if h != self.hash:
+            return notFound
+        idx = self._index(key)
+        return notFound if idx < 0 else self.array[idx + 1]
+
+    def assoc(self, edit, shift: int, h: int, key, value, added: list):
+        if h != self.hash:
+            # Nest this node below a bitmap node at the current level.
+            parent = _BitmapNode(edit, 1 << ((self.hash >> shift) & MASK), [_NODE, self])
+            return parent.assoc(edit, shift, h, key, value, added)
+        idx = self._index(key)
+        node = self._editable(edit)
+        if idx < 0:
+            added[0] = True
+            node.array.extend((key, value))
+        elif self.array[idx + 1] is value:
+            return self
+        else:
+            node.array[idx + 1] = value
+        return node
+
+    def without(self, edit, shift: int, h: int, key, removed: list):
+        idx = self._index(key)
+        if idx < 0:
+            return self
+        removed[0] = True
+        if len(self.array) == 2:
+            return None
+        node = self._editable(edit)
+        del node.array[idx:idx + 2]
+        return node
+
+    def entries(self) -> Iterator[Tuple]:
+        array = self.array
+        for i in range(0, len(array), 2):
+            yield array[i], array[i + 1]
+
+def _create_node(edit, shift: int, key1, value1, h2: int, key2, value2):
+    h1 = _hash(key1)
+    if h1 == h2:
+        return _CollisionNode(edit, h1, [key1, value1, key2, value2])
+    added = [False]
+    node = _BitmapNode(edit, 0, [])
+    node = node.assoc(edit, shift, h1, key1, value1, added)
+    return node.assoc(edit, shift, h2, key2, value2, added)
+
+_EMPTY_NODE = _BitmapNode(None, 0, [])
+_NOT_FOUND = object()
+
+class PersistentHashMap(Mapping[K, V]):
+    """Persistent hash map implemented as a hash array mapped trie.
+
+        Each level of the trie consumes 5 bits of the key's hash, so
+        get, assoc and dissoc visit O(log32 n) nodes. assoc and dissoc
+        copy only that path and share the rest with the previous
+        version, instead of copying the whole map.
+
+        PersistentHashMap is a read-only Mapping, so it can be passed
+        wherever a dict is only read, e.g. MapUtilities.getMapValue.
+        For batches of updates use a TransientHashMap (see builder()
+        and transient()).
+    """
+    __slots__ = ('_count', '_root')
+
+    def __init__(self, count: int, root: _BitmapNode):
+        """ Prefer the factories over direct construction. """
+        self._count = count
+        self._root = root
+
+    @staticmethod
+    def empty():
+        return _EMPTY
+
+    @staticmethod
+    def fromIterable(pairs: Iterable[Tuple[K, V]]):
+        """ Builds a map from (key, value) pairs; later keys win. """
+        builder = PersistentHashMap.builder()
+        for key, value in pairs:
+            builder.assoc(key, value)
+        return builder.persistent()
+
+    @staticmethod
+    def fromDict(aMap: Mapping[K, V]):
+        return PersistentHashMap.fromIterable(aMap.items())
+
+    @staticmethod
+    def builder():
+        """ Returns an empty TransientHashMap. """
+        return TransientHashMap(_EMPTY)
+
+    def transient(self):
+        """ Returns a TransientHashMap with the same entries.
+
+            The transient shares structure with self and copies a node
+            only the first time it writes to it.
+        """
+        return TransientHashMap(self)
+
+    def __getitem__(self, key: K) -> V:
+        value = self._root.find(0, _hash(key), key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._root.find(0, _hash(key), key, _NOT_FOUND)
+        return default if value is _NOT_FOUND else value
+
+    def __contains__(self, key) -> bool:
+        return self._root.find(0, _hash(key), key, _NOT_FOUND) is not _NOT_FOUND
+
+    def getOrFailure(self, key: K) -> Result:
+        """ Safe lookup: Result[V] like MapUtilities.getMapValue.
+
+            The failure message names only the missing key, so a miss
+            does not format the whole map.
+        """
+        value = self._root.find(0, _hash(key), key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            return Result.failure("Could not find key {}".format(repr(key)))
+        return Result.success(value)
+
+    def assoc(self, key: K, value: V):
+        """ New map with key bound to value. """
+        added = [False]
+        root = self._root.assoc(None, 0, _hash(key), key, value, added)
+        if root is self._root:
+            return self
+        return PersistentHashMap(self._count + 1 if added[0] else self._count, root)
+
+    def dissoc(self, key: K):
+        """ New map without key. """
+        root = self._root.without(None, 0, _hash(key), key, [False])
+        if root is self._root:
+            return self
+        if root is None:
+            return _EMPTY
+        return PersistentHashMap(self._count - 1, root)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def length(self) -> int:
+        return self._count
+
+    def isEmpty(self) -> bool:
+        return self._count == 0
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self._root.entries():
+            yield key
+
+    def items(self) -> ItemsView[K, V]:
+        """ View of the (key, value) pairs, iterated in trie order. """
+        return _ItemsView(self)
+
+    def toDict(self) -> dict:
+        return dict(self._root.entries())
+
+    def __repr__(self):
+        return f"PersistentHashMap({self.toDict()!r})"
+
+class _ItemsView(abc.ItemsView):
+    """ItemsView iterating the trie directly instead of looking up each key."""
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._root.entries()
+
+class TransientHashMap(Mapping[K, V]):
+    """Mutable builder for PersistentHashMap.
+
+        Writes go to nodes owned by this transient, copying a shared
+        node the first time it is touched. persistent() hands the
+        result over in O(1) and invalidates the transient.
+    """
+    __slots__ = ('_count', '_root', '_edit')
+
+    def __init__(self, aMap: PersistentHashMap[K, V]):
+        self._edit: Optional[object] = object()
+        self._count = aMap._count
+        self._root = aMap._root
+
+    def _ensure_editable(self):
+        if self._edit is None:
+            raise RuntimeError("Transient used after persistent() call")
+        return self._edit
+
+    def __getitem__(self, key: K) -> V:
+        value = self._root.find(0, _hash(key), key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self._root.entries():
+            yield key
+
+    def assoc(self, key: K, value: V):
+        """ Binds key in place. Returns self for chaining. """
+        edit = self._ensure_editable()
+        added = [False]
+        self._root = self._root.assoc(edit, 0, _hash(key), key, value, added)
+        if added[0]:
+            self._count += 1
+        return self
+
+    def dissoc(self, key: K):
+        """ Removes key in place. Returns self for chaining. """
+        edit = self._ensure_editable()
+        removed = [False]
+        root = self._root.without(edit, 0, _hash(key), key, removed)
+        self._root = _EMPTY_NODE if root is None else root
+        if removed[0]:
+            self._count -= 1
+        return self
+
+    def persistent(self) -> PersistentHashMap[K, V]:
+        """ Freezes the entries into a PersistentHashMap. """
+        self._ensure_editable()
+        self._edit = None
+        if self._count == 0:
+            return _EMPTY
+        return PersistentHashMap(self._count, self._root)
+
+_EMPTY: PersistentHashMap = PersistentHashMap(0, _EMPTY_NODE)
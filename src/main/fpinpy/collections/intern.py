@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import threading
+import weakref
+from contextvars import ContextVar
+from fpinpy.collections.singly_linked_list import SinglyLinkedList, Cons, _NIL, _extend_values
+from typing import TypeVar, Dict, Optional
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+
+class InternedCons(Cons[T]):
+    """Cons node owned by an InternPool.
+
+        Behaves exactly like Cons; the extra slot only lets the pool
+        hold it weakly.
+    """
+    __slots__ = ('__weakref__',)
+
+    def __reduce__(self):
+        """ Unpickles into the pool current at load time. """
+        return (_intern_values, (self.toTuple(),))
+
+_object_new = object.__new__
+
+def _key(head, tail) -> tuple:
+    return (type(head), head, id(tail))
+
+class InternPool:
+    """Hash-consing factory for SinglyLinkedList.
+
+        A pool hands out one shared node per distinct (head, tail)
+        pair, so structurally equal lists built through the same pool
+        are the same object: equality is an identity check and
+        repeated suffixes are stored once.
+
+        Nodes are held weakly and leave the pool when no longer
+        referenced elsewhere. Elements must be hashable and are matched
+        like dict keys, so 1, 1.0 and True share a node. Pools are
+        thread-safe.
+
+        Usage:
+
+        pool = InternPool()
+        path = pool.list('usr', 'local', 'bin')
+
+        with InternPool() as pool:
+            SinglyLinkedList.interned('usr', 'bin') # uses pool
+    """
+
+    def __init__(self):
+        # (type(head), head, id(tail)) -> node. The type keeps equal heads
+        # of different types, such as 1, 1.0 and True, apart. The node
+        # keeps its tail alive, and its entry is removed before the tail
+        # can be collected, so the id is never reused while the entry exists.
+        self._table: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _isCanonical(self, aList) -> bool:
+        return aList is _NIL or self._table.get(_key(aList._head, aList._tail)) is aList
+
+    def _cons(self, head: T, tail):
+        """Interned node; tail must already be canonical in this pool."""
+        key = _key(head, tail)
+        with self._lock:
+            node = self._table.get(key)
+            if node is not None:
+                self._hits += 1
+                return node
+            self._misses += 1
+            node = _object_new(InternedCons)
+            node._head = head
+            node._tail = tail
+            node._length = tail._length + 1
+            node._hash = None
+            self._table[key] = node
+            return node
+
+    def cons(self, head: T, tail):# -> SinglyLinkedList[T]
+        """ Interned cons. A tail from outside the pool is interned first. """
+        if not self._isCanonical(tail):
+            tail = self.intern(tail)
+        return self._cons(head, tail)
+
+    def list(self, *args):# -> SinglyLinkedList[T]
+        output = _NIL
+        for elem in reversed(args):
+            output = self._cons(elem, output)
+        return output
+
+    def intern(self, aList):# -> SinglyLinkedList[T]
+        """ Canonical copy of aList in this pool. """
+        if self._isCanonical(aList):
+            return aList
+        return self.list(*_extend_values([], aList))
+
+    def stats(self) -> Dict[str, int]:
+        """ Snapshot: hits, misses and live (nodes currently pooled). """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "live": len(self._table)}
+
+    def clear(self) -> None:
+        """ Forgets all nodes and resets the counters.
+
+            Lists built earlier stay valid but are no longer shared
+            with lists built afterwards.
+        """
+        with self._lock:
+            self._table = weakref.WeakValueDictionary()
+            self._hits = 0
+            self._misses = 0
+
+    def __enter__(self):
+        # Tokens are kept per context, not on the pool: the same pool
+        # may be entered from several threads or tasks at once.
+        _pool_tokens.set(_pool_tokens.get() + (_current_pool.set(self),))
+        return self
+
+    def __exit__(self, *exc_info):
+        tokens = _pool_tokens.get()
+        _pool_tokens.set(tokens[:-1])
+        _current_pool.reset(tokens[-1])
+        return False
+
+    @staticmethod
+    def current():
+        """ The pool of the innermost active with-block, else the default pool. """
+        pool = _current_pool.get()
+        return pool if pool is not None else _DEFAULT_POOL
+
+def _intern_values(values: tuple):
+    return InternPool.current().list(*values)
+
+_DEFAULT_POOL = InternPool()
+_current_pool: ContextVar[Optional[InternPool]] = ContextVar("fpinpy_intern_pool", default=None)
+_pool_tokens: ContextVar[tuple] = ContextVar("fpinpy_intern_pool_tokens", default=())
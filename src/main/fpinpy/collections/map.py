@@ -21,6 +21,7 @@
 # SOFTWARE.
 #
 from fpinpy.result import Result
+from typing import Mapping
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,15 +29,15 @@ logger = logging.getLogger(__name__)
 
 class MapUtilities():
     @staticmethod
-    def getMapValue(key:str, aMap:dict):
+    def getMapValue(key:str, aMap:Mapping):
       """
       Input:
       key
-      map (datatype dict)
+      map (datatype dict, or any Mapping such as PersistentHashMap)
       Returns: Result<value>
       """
       try:
-        logger.debug("Looking for key {} in {}".format(repr(key), repr(aMap)))
+        logger.debug("Looking for key %r in %r", key, aMap)
         return Result.success(aMap[key])
       except Exception as e:
         return Result.failure("Could not find key {} in {}".format(repr(key), repr(aMap)))
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import array
+import math
+import operator
+import threading
+from itertools import chain
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from fpinpy.result import Result
+from typing import Any, Callable, Iterable, List, Optional
+
+numpy: Any
+try:
+    import numpy
+except ImportError: # optional, see extras_require in setup.py
+    numpy = None
+
+# 2-argument callables foldLeft recognises as whole-column reductions.
+# Values are (NumPy ufunc name, fallback over identity and the elements).
+_REDUCTIONS = {
+    operator.add: ("add", lambda identity, items: sum(items, identity)),
+    operator.mul: ("multiply", lambda identity, items: math.prod(items, start=identity)),
+    max: ("maximum", lambda identity, items: max(chain((identity,), items))),
+    min: ("minimum", lambda identity, items: min(chain((identity,), items))),
+}
+
+_NUMERIC_KINDS = "biufc"
+# (dtype kind, itemsize) -> array module typecode, so that both
+# backends report the same code ('q', not the platform's 'l').
+_ARRAY_TYPECODES = {
+    ("i", 1): "b", ("i", 2): "h", ("i", 4): "i", ("i", 8): "q",
+    ("u", 1): "B", ("u", 2): "H", ("u", 4): "I", ("u", 8): "Q",
+    ("f", 4): "f", ("f", 8): "d",
+}
+_MIN_SLACK = 8
+# Typecode of a list built from no elements, on either backend.
+_EMPTY_TYPECODE = 'd'
+
+class _Buffer:
+    """Storage shared by the NumericList views over it.
+
+        Slots at index front and above are taken. cons claims the free
+        slot right before front, so repeated cons on the newest list is
+        amortized O(1) without disturbing older views.
+    """
+    __slots__ = ('data', 'typecode', 'front', 'lock')
+
+    def __init__(self, data, typecode: str, front: int):
+        self.data = data
+        self.typecode = _array_typecode(data.dtype) if _is_ndarray(data) else typecode
+        self.front = front
+        self.lock = threading.Lock()
+
+class NumericList:
+    """Persistent list of ints or floats in one contiguous buffer.
+
+        Backed by a NumPy array when NumPy is installed, otherwise by
+        array.array. A list is a view (buffer, offset, length), so
+        tail, drop and take are O(1) and never copy.
+
+        map, filter and traverse take NumPy ufuncs, or any callable
+        flagged vectorized=True, and apply it to the whole column at
+        once. A vectorized callable must act elementwise: without NumPy
+        it is called once per element instead. foldLeft runs known
+        reductions (operator.add, operator.mul, max, min and binary
+        ufuncs) natively; other functions are curried as in
+        SinglyLinkedList.
+
+        Native reductions follow NumPy arithmetic: int64 sums wrap on
+        overflow and float sums use pairwise summation.
+
+        Usage:
+
+        prices = NumericList.fromIterable(rows, typecode='d')
+        total = prices.map(numpy.log1p).foldLeft(0.0, operator.add)
+    """
+    __slots__ = ('_buffer', '_offset', '_length')
+
+    def __init__(self, buffer: _Buffer, offset: int, length: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    @staticmethod
+    def backend() -> str:
+        """ "numpy" or "array", whichever new lists are stored in. """
+        return "numpy" if numpy is not None else "array"
+
+    @staticmethod
+    def empty(typecode: str='d'):
+        return NumericList.fromIterable((), typecode)
+
+    @staticmethod
+    def list(*args):
+        return NumericList.fromIterable(args)
+
+    @staticmethod
+    def fromIterable(iterable: Iterable, typecode: Optional[str]=None):
+        """ Copies iterable into a new buffer.
+
+            typecode: str; an array module typecode such as 'q' or 'd'.
+                Inferred when None: 'q' for ints, 'd' once a float
+                appears or when there are no elements. Raises
+                TypeError for non-numeric elements.
+        """
+        data, typecode = _storage(list(iterable), typecode)
+        return NumericList(_Buffer(data, typecode, 0), 0, len(data))
+
+    @staticmethod
+    def fromList(aList: SinglyLinkedList, typecode: Optional[str]=None):
+        return NumericList.fromIterable(aList.toPyList(), typecode)
+
+    @staticmethod
+    def fromArray(values, copy: bool=True):
+        """ Wraps a 1-dimensional NumPy array or an array.array.
+
+            With copy=False the buffer is shared; the caller must not
+            modify values afterwards.
+        """
+        if isinstance(values, array.array):
+            typecode = values.typecode
+            data = array.array(typecode, values) if copy else values
+            if numpy is not None:
+                data = numpy.frombuffer(data, dtype=typecode) if not copy else numpy.array(data, dtype=typecode)
+        elif numpy is not None and isinstance(values, numpy.ndarray):
+            if values.ndim != 1 or values.dtype.kind not in _NUMERIC_KINDS:
+                raise TypeError(f"NumericList needs a 1-dimensional numeric array, got {values.dtype} with shape {values.shape}")
+            data = values.copy() if copy else values
+            typecode = data.dtype.char
+        else:
+            raise TypeError(f"fromArray takes numpy.ndarray or array.array, got {type(values).__name__}")
+        return NumericList(_Buffer(data, typecode, 0), 0, len(data))
+
+    def typecode(self) -> str:
+        """ array module typecode of the elements, e.g. 'q' or 'd', whatever the backend.
+
+            NumPy types array.array lacks (bool, complex, half) report
+            their NumPy character code.
+        """
+        return self._buffer.typecode
+
+    def head(self):
+        if not self._length:
+            raise RuntimeError("head called on empty list")
+        value = self._buffer.data[self._offset]
+        return value.item() if _is_ndarray(self._buffer.data) else value
+
+    def tail(self):# -> NumericList
+        if not self._length:
+            raise RuntimeError("tail called on empty list")
+        return NumericList(self._buffer, self._offset + 1, self._length - 1)
+
+    def drop(self, n: int):# -> NumericList
+        n = min(max(n, 0), self._length)
+        return NumericList(self._buffer, self._offset + n, self._length - n) if n else self
+
+    def take(self, n: int):# -> NumericList
+        n = min(max(n, 0), self._length)
+        return NumericList(self._buffer, self._offset, n) if n != self._length else self
+
+    def isEmpty(self) -> bool:
+        return self._length == 0
+
+    def length(self) -> int:
+        return self._length
+
+    def cons(self, head):# -> NumericList
+        """ Prepends head; amortized O(1) when self is the newest list
+            built on its buffer, a copy with room in front otherwise.
+
+            Raises TypeError if head does not fit the typecode.
+        """
+        buffer = self._buffer
+        offset = self._offset
+        with buffer.lock:
+            if offset == buffer.front and offset > 0:
+                _store(buffer.data, offset - 1, head)
+                buffer.front = offset - 1
+                return NumericList(buffer, offset - 1, self._length + 1)
+        slack = max(self._length, _MIN_SLACK)
+        data = _with_slack(buffer.data, buffer.typecode, self._view(), slack)
+        _store(data, slack - 1, head)
+        return NumericList(_Buffer(data, buffer.typecode, slack - 1), slack - 1, self._length + 1)
+
+    def map(self, function: Callable, vectorized: bool=False):# -> NumericList
+        """ Applies function to every element.
+
+            ufuncs and vectorized callables get the whole column. Other
+            callables get one element at a time. Raises TypeError if
+            the results are not numeric.
+        """
+        if self._isColumnar(function, vectorized):
+            return _from_column(function(self._view()), self._length)
+        return NumericList.fromIterable([function(elem) for elem in self._items()])
+
+    def filter(self, predicate: Callable, vectorized: bool=False):# -> NumericList
+        if self._isColumnar(predicate, vectorized):
+            mask = numpy.asarray(predicate(self._view()), dtype=bool)
+            kept = self._view()[mask]
+            if len(kept) == self._length:
+                return self
+            return NumericList(_Buffer(kept, self._buffer.typecode, 0), 0, len(kept))
+        kept = [elem for elem in self._items() if predicate(elem)]
+        if len(kept) == self._length:
+            return self
+        return NumericList.fromIterable(kept, self._buffer.typecode)
+
+    def foldLeft(self, identity, function: Callable):
+        """ Left fold.
+
+            Input:
+            identity: the start value
+            function: a known reduction (operator.add, operator.mul,
+                max, min or a binary ufunc), which runs over the whole
+                column; or a curried U -> T -> U as in SinglyLinkedList
+        """
+        reduction = _REDUCTIONS.get(function)
+        if _is_ndarray(self._buffer.data):
+            ufunc = getattr(numpy, reduction[0]) if reduction is not None else function
+            if isinstance(ufunc, numpy.ufunc) and ufunc.nin == 2:
+                result = ufunc.reduce(self._view(), initial=identity)
+                return result.item() if isinstance(result, numpy.generic) else result
+        elif reduction is not None:
+            return reduction[1](identity, self._view())
+        accumulator = identity
+        for elem in self._items():
+            accumulator = function(accumulator)(elem)
+        return accumulator
+
+    def traverse(self, function: Callable, vectorized: bool=False):# -> Result[NumericList]
+        """ Maps function over the list, collecting the outcome in a Result.
+
+            ufuncs and vectorized callables signal failure by raising;
+            with NumPy, floating point errors (invalid, divide by zero,
+            overflow) raise too. Other callables return a Result per
+            element. The first Failure (or Empty) is returned as the
+            overall Failure.
+        """
+        if self._isColumnar(function, vectorized):
+            try:
+                with numpy.errstate(all="raise"):
+                    return Result.success(_from_column(function(self._view()), self._length))
+            except Exception as e:
+                return Result.failure(e)
+        values = []
+        for elem in self._items():
+            if vectorized:
+                try:
+                    values.append(function(elem))
+                except Exception as e:
+                    return Result.failure(e)
+                continue
+            result = function(elem)
+            if not result.isSuccess():
+                return result if result.isFailure() else Result.failure(RuntimeError("Empty was considered Failure."))
+            values.append(result.getOrElse(None))
+        try:
+            return Result.success(NumericList.fromIterable(values))
+        except TypeError as e:
+            return Result.failure(e)
+
+    def forEach(self, effect: Callable) -> None:
+        for elem in self._items():
+            effect(elem)
+        return None
+
+    def toArray(self):
+        """ Copy of the elements as a NumPy array, or an array.array without NumPy. """
+        view = self._view()
+        if _is_ndarray(view):
+            return view.copy()
+        output = array.array(self._buffer.typecode)
+        output.frombytes(view.cast("B"))
+        return output
+
+    def toPyList(self) -> List[Any]:
+        return self._items()
+
+    def toList(self):# -> SinglyLinkedList
+        return SinglyLinkedList.fromIterable(self._items())
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __eq__(self, other):
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self._length == other._length and self._items() == other._items()
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __str__(self):
+        return f"[{''.join(f'{elem}, ' for elem in self._items())}NIL]"
+
+    def __repr__(self):
+        return f"NumericList({str(self)})"
+
+    def __reduce__(self):
+        """ Pickles the elements as (typecode, bytes); loads into either backend. """
+        return (_from_bytes, (self._buffer.typecode, self.toArray().tobytes()))
+
+    def _view(self):
+        """ Zero-copy slice of the buffer: an ndarray or a memoryview. """
+        data = self._buffer.data
+        end = self._offset + self._length
+        if _is_ndarray(data):
+            return data[self._offset:end]
+        return memoryview(data)[self._offset:end]
+
+    def _items(self) -> List[Any]:
+        """ The elements as Python ints and floats. """
+        return self._view().tolist()
+
+    def _isColumnar(self, function, vectorized: bool) -> bool:
+        if not _is_ndarray(self._buffer.data):
+            return False
+        return vectorized or isinstance(function, numpy.ufunc)
+
+def _is_ndarray(data) -> bool:
+    return numpy is not None and isinstance(data, numpy.ndarray)
+
+def _array_typecode(dtype) -> str:
+    return _ARRAY_TYPECODES.get((dtype.kind, dtype.itemsize), dtype.char)
+
+def _from_bytes(typecode: str, data: bytes):# -> NumericList
+    """ Unpickles a NumericList; data is in native byte order, like array.tobytes. """
+    if numpy is not None:
+        values = numpy.frombuffer(data, dtype=typecode).copy()
+    else:
+        values = array.array(typecode)
+        values.frombytes(data)
+    return NumericList(_Buffer(values, typecode, 0), 0, len(values))
+
+def _infer_typecode(values: List[Any]) -> str:
+    if not values:
+        return _EMPTY_TYPECODE
+    typecode = 'q'
+    for value in values:
+        if isinstance(value, float):
+            typecode = 'd'
+        elif not isinstance(value, int):
+            raise TypeError(f"NumericList holds ints and floats, got {type(value).__name__}")
+    return typecode
+
+def _storage(values: List[Any], typecode: Optional[str]):
+    """ New backing storage for values and its typecode. """
+    if numpy is not None:
+        data = numpy.array(values) if values else numpy.array(values, dtype=typecode or _EMPTY_TYPECODE)
+        if data.ndim != 1 or data.dtype.kind not in _NUMERIC_KINDS:
+            raise TypeError(f"NumericList holds numbers, got elements of type {data.dtype}")
+        if typecode is not None:
+            data = data.astype(typecode, casting="same_kind")
+        return data, data.dtype.char
+    typecode = typecode or _infer_typecode(values)
+    try:
+        return array.array(typecode, values), typecode
+    except OverflowError as e:
+        raise TypeError(f"Elements do not fit typecode {typecode!r}: {e}") from e
+
+def _from_column(column, length: int):# -> NumericList
+    data = numpy.asarray(column)
+    if data.shape != (length,):
+        raise TypeError(f"Vectorized function returned shape {data.shape}, expected ({length},)")
+    if data.dtype.kind not in _NUMERIC_KINDS:
+        raise TypeError(f"Vectorized function returned non-numeric {data.dtype}")
+    return NumericList(_Buffer(data, data.dtype.char, 0), 0, length)
+
+def _store(data, index: int, value) -> None:
+    if _is_ndarray(data):
+        if not numpy.can_cast(numpy.min_scalar_type(value), data.dtype, "same_kind"):
+            raise TypeError(f"{value!r} does not fit a NumericList of {data.dtype}")
+        data[index] = value
+        return
+    try:
+        data[index] = value
+    except OverflowError as e:
+        raise TypeError(f"{value!r} does not fit typecode {data.typecode!r}") from e
+
+def _with_slack(data, typecode: str, view, slack: int):
+    """ Copy of view preceded by slack unused slots. """
+    if _is_ndarray(data):
+        output = numpy.empty(slack + len(view), dtype=data.dtype)
+        output[slack:] = view
+        return output
+    output = array.array(typecode, bytes(slack * data.itemsize))
+    output.frombytes(view.cast("B"))
+    return output
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+from fpinpy.result import Result
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from typing import TypeVar, Generic, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+
+# Trees are tuples (value, left, right); leaves have left = right = None.
+# A tree of size s = 2^k - 1 holds its elements in preorder.
+_Tree = Tuple[Any, Any, Any]
+
+class RandomAccessList(Generic[T]):
+    """Persistent list with O(log n) indexed access (Okasaki's skew-binary random-access list).
+
+        The list is a spine of complete binary trees whose sizes are
+        skew-binary digits: only the first two trees may have the same
+        size, every later tree is strictly larger. cons, head and tail
+        are O(1) as with Cons; get, update and drop are O(log n).
+
+        Each instance is one spine cell: the first tree, its size, the
+        rest of the spine and the total length. The empty list is its
+        own rest, so the spine never ends in None.
+    """
+    __slots__ = ('_size', '_tree', '_next', '_length')
+    _size: int
+    _tree: _Tree
+    _next: "RandomAccessList[T]"
+    _length: int
+
+    def __init__(self, size: int, tree: _Tree, next: Optional["RandomAccessList[T]"], length: int):
+        """ Prefer the factories over direct construction. next=None makes the cell its own rest. """
+        self._size = size
+        self._tree = tree
+        self._next = self if next is None else next
+        self._length = length
+
+    @staticmethod
+    def empty():
+        return _EMPTY
+
+    @staticmethod
+    def list(*args):
+        return RandomAccessList.fromIterable(args)
+
+    @staticmethod
+    def fromIterable(iterable: Iterable[T]):
+        """ Builds in O(n) by consing the elements back to front. """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        output = _EMPTY
+        for elem in reversed(values):
+            output = output.cons(elem)
+        return output
+
+    @staticmethod
+    def fromList(aList: SinglyLinkedList[T]):
+        return RandomAccessList.fromIterable(aList.toPyList())
+
+    def cons(self, head: T):
+        """ O(1): merges the first two trees when their sizes match. """
+        next = self._next
+        if self._length and next._length and self._size == next._size:
+            return RandomAccessList(2 * self._size + 1, (head, self._tree, next._tree), next._next, self._length + 1)
+        return RandomAccessList(1, (head, None, None), self, self._length + 1)
+
+    def head(self) -> T:
+        if not self._length:
+            raise RuntimeError("head called on empty list")
+        return self._tree[0]
+
+    def tail(self):# -> RandomAccessList[T]
+        """ O(1): splits the first tree into its two subtrees. """
+        if not self._length:
+            raise RuntimeError("tail called on empty list")
+        if self._size == 1:
+            return self._next
+        half = self._size >> 1
+        _, left, right = self._tree
+        length = self._length - 1
+        return RandomAccessList(half, left, RandomAccessList(half, right, self._next, length - half), length)
+
+    def isEmpty(self) -> bool:
+        return self._length == 0
+
+    def length(self) -> int:
+        return self._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _check_index(self, index: int) -> None:
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index {index} out of range for list of length {self._length}")
+
+    def get(self, index: int) -> T:
+        """ Element at index; raises IndexError when out of range. """
+        self._check_index(index)
+        spine = self
+        while index >= spine._size:
+            index -= spine._size
+            spine = spine._next
+        tree = spine._tree
+        size = spine._size
+        while index:
+            size >>= 1
+            if index <= size:
+                tree = tree[1]
+                index -= 1
+            else:
+                tree = tree[2]
+                index -= 1 + size
+        return tree[0]
+
+    def getOrFailure(self, index: int) -> Result:
+        """ Safe get: Result[T], Failure when index is out of range. """
+        if not 0 <= index < self._length:
+            return Result.failure(f"Index {index} out of range for list of length {self._length}")
+        return Result.success(self.get(index))
+
+    def __getitem__(self, index: int) -> T:
+        """ Python indexing, including negative indices. """
+        return self.get(index + self._length if index < 0 else index)
+
+    def update(self, index: int, value: T):
+        """ New list with value at index. Copies one root-to-node path
+            and the spine cells in front of its tree.
+        """
+        self._check_index(index)
+        prefix = []
+        spine = self
+        while index >= spine._size:
+            prefix.append(spine)
+            index -= spine._size
+            spine = spine._next
+        path = []
+        tree = spine._tree
+        size = spine._size
+        while index:
+            size >>= 1
+            if index <= size:
+                path.append((tree, True))
+                tree = tree[1]
+                index -= 1
+            else:
+                path.append((tree, False))
+                tree = tree[2]
+                index -= 1 + size
+        tree = (value, tree[1], tree[2])
+        for parent, wentLeft in reversed(path):
+            tree = (parent[0], tree, parent[2]) if wentLeft else (parent[0], parent[1], tree)
+        output = RandomAccessList(spine._size, tree, spine._next, spine._length)
+        for cell in reversed(prefix):
+            output = RandomAccessList(cell._size, cell._tree, output, cell._length)
+        return output
+
+    def drop(self, n: int):# -> RandomAccessList[T]
+        """ Removes n elements from the front in O(log n). """
+        if n <= 0:
+            return self
+        if n >= self._length:
+            return _EMPTY
+        spine = self
+        while n >= spine._size:
+            n -= spine._size
+            spine = spine._next
+        if not n:
+            return spine
+        # Descend into the tree, keeping the right subtrees passed on the way.
+        pending = []
+        tree = spine._tree
+        size = spine._size
+        while n:
+            size >>= 1
+            n -= 1
+            if n < size:
+                pending.append((size, tree[2]))
+                tree = tree[1]
+            else:
+                n -= size
+                tree = tree[2]
+        output = spine._next
+        for subtreeSize, subtree in pending:
+            output = RandomAccessList(subtreeSize, subtree, output, output._length + subtreeSize)
+        return RandomAccessList(size, tree, output, output._length + size)
+
+    def __iter__(self) -> Iterator[T]:
+        spine = self
+        while spine._length:
+            stack = [spine._tree]
+            while stack:
+                value, left, right = stack.pop()
+                yield value
+                if left is not None:
+                    stack.append(right)
+                    stack.append(left)
+            spine = spine._next
+
+    def map(self, function: Callable[[T], U]):# -> RandomAccessList[U]
+        return RandomAccessList.fromIterable([function(elem) for elem in self])
+
+    def filter(self, predicate: Callable[[T], bool]):# -> RandomAccessList[T]
+        return RandomAccessList.fromIterable([elem for elem in self if predicate(elem)])
+
+    def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]) -> U:
+        accumulator = identity
+        for elem in self:
+            accumulator = function(accumulator)(elem)
+        return accumulator
+
+    def foldRight(self, identity: U, function: Callable[[T], Callable[[U], U]]) -> U:
+        accumulator = identity
+        for elem in reversed(self.toPyList()):
+            accumulator = function(elem)(accumulator)
+        return accumulator
+
+    def forEach(self, effect: Callable[[T], None]) -> None:
+        for elem in self:
+            effect(elem)
+        return None
+
+    @staticmethod
+    def traverse(aList, function, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # RandomAccessList[T], Callable[[T], Result[U]] -> Result[RandomAccessList[U]]
+        """ As SinglyLinkedList.traverse, with a RandomAccessList on success. """
+        return SinglyLinkedList.traverse(aList, function, ignoreFailure, emptyIsFailure, successOfFailure) \
+            .map(RandomAccessList.fromList)
+
+    @staticmethod
+    def sequence(aList, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # RandomAccessList[Result[T]] -> Result[RandomAccessList[T]]
+        """ As SinglyLinkedList.sequence; the flags behave as in traverse. """
+        return RandomAccessList.traverse(aList, lambda x: x, ignoreFailure, emptyIsFailure, successOfFailure)
+
+    def toPyList(self) -> List[T]:
+        return [elem for elem in self]
+
+    def toList(self):# -> SinglyLinkedList[T]
+        return SinglyLinkedList.fromIterable(self.toPyList())
+
+    def __eq__(self, other):
+        if not isinstance(other, RandomAccessList):
+            return NotImplemented
+        return self is other or (self._length == other._length and self.toPyList() == other.toPyList())
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __str__(self):
+        return f"[{''.join(f'{elem}, ' for elem in self)}NIL]"
+
+    def __repr__(self):
+        return f"RandomAccessList({', '.join(repr(elem) for elem in self)})"
+
+_EMPTY: RandomAccessList[Any] = RandomAccessList(0, (None, None, None), None, 0)
@@ -21,12 +21,21 @@
 # SOFTWARE.
 #
 import abc
+import array
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cmp_to_key
+from itertools import islice, repeat
 from fpinpy.meta.decorators import overrides
 from fpinpy.result import Result
-from typing import Iterator, TypeVar, Generic, Callable, Dict
+from fpinpy.collections.hash_map import PersistentHashMap
+from typing import Iterator, TypeVar, Generic, Callable, Optional
 # Declare module-scoped type variables for generics
 T = TypeVar('T')
 U = TypeVar('U')
+K = TypeVar('K')
 
 # TODO Make this meta class work with parameter T
 class SinglyLinkedListMeta(type):
@@ -60,66 +69,176 @@ class SinglyLinkedListIterator:
     """
     def __init__(self, singly_linked_list, reverse: bool=False):
         if reverse:
-            self._state = self._make_reversed_state(singly_linked_list)
+            # Backwards, the elements are popped off a Python list
+            # snapshot; no reversed copy of the list is built.
+            self._state = _NIL
+            self._backward = _extend_values([], singly_linked_list)
         else:
             self._state = singly_linked_list
+            self._backward = []
 
     def __iter__(self):
         return self
 
+    def __length_hint__(self):
+        return self._state._length + len(self._backward)
+
     def __next__(self):
         """
             Does not return Nil
         """
-        if not self._state.isEmpty():
-            next_elem = self._state.head()
-            self._state= self._state.tail()
-            return next_elem
-        else:
-            raise StopIteration
-
-    def _make_reversed_state(self, aList):
-        """ Iterative implementation of traversing the list backwards.
+        state = self._state
+        if state._length:
+            self._state = state._tail
+            return state._head
+        if self._backward:
+            return self._backward.pop()
+        raise StopIteration
+
+class ListBuilder(Generic[T]):
+    """Builds a SinglyLinkedList front to back.
+
+        append links a new last node in O(1); the nodes are private to
+        the builder until freeze(), which fills in the node lengths in
+        one pass and returns the list. The builder cannot be used
+        after freeze().
+
+        Usage:
+
+        builder = ListBuilder()
+        for line in lines:
+            builder.append(parse(line))
+        aList = builder.freeze()
+    """
+    __slots__ = ('_first', '_last', '_count')
 
+    def __init__(self):
+        self._first = _NIL
+        self._last = None
+        self._count = 0
+
+    def append(self, elem: T):
+        """ Adds elem at the end. Returns self for chaining. """
+        if self._count < 0:
+            raise RuntimeError("ListBuilder used after freeze() call")
+        node = _object_new(Cons)
+        node._head = elem
+        node._tail = _NIL
+        node._hash = None
+        if self._last is None:
+            self._first = node
+        else:
+            self._last._tail = node
+        self._last = node
+        self._count += 1
+        return self
 
-            Recursive implementation
+    def extend(self, iterable):
+        """ Appends every element of iterable. Returns self for chaining. """
+        if self._count < 0:
+            raise RuntimeError("ListBuilder used after freeze() call")
+        last = self._last
+        count = self._count
+        for elem in iterable:
+            node = _object_new(Cons)
+            node._head = elem
+            node._tail = _NIL
+            node._hash = None
+            if last is None:
+                self._first = node
+            else:
+                last._tail = node
+            last = node
+            count += 1
+        self._last = last
+        self._count = count
+        return self
 
-            def _reversed(acc, aList):
-                if aList.isEmpty():
-                    return acc
-                else:
-                    return _reversed(SinglyLinkedList.cons(internal_state.head(), accumulator), internal_state.tail())
-            return _reversed(accumulator, aList)
-        """
-        internal_state = aList
-        stack = [] # LIFO
-        while not internal_state.isEmpty():
-            head = internal_state.head()
-            tail = internal_state.tail()
-            internal_state = internal_state.tail()
-            stack.append(head)
-        return SinglyLinkedList.list(*reversed(stack))
+    def length(self) -> int:
+        return max(self._count, 0)
+
+    def freeze(self):# -> SinglyLinkedList[T]
+        """ Returns the built list. O(n) once. """
+        if self._count < 0:
+            raise RuntimeError("ListBuilder used after freeze() call")
+        length = self._count
+        node = self._first
+        while length:
+            node._length = length
+            node = node._tail
+            length -= 1
+        first = self._first
+        self._first = _NIL
+        self._last = None
+        self._count = -1
+        return first
 
 class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCMeta (ABC)
     """The base class for singly-linked list objects
+
+        Nodes use __slots__, so no subclass instance carries a __dict__.
+        Subclasses must declare __slots__ as well to keep it that way.
     """
+    __slots__ = ()
+    # Node fields read directly by the iterative walks, which stop on
+    # _length == 0: Cons keeps them in slots, Nil defines _length and
+    # _hash on the class and never has _head or _tail read.
+    _head: T
+    _tail: "SinglyLinkedList[T]"
+    _length: int
+    _hash: Optional[int]
 
     @staticmethod
     def list(*args):
-        if len(args) == 0:
-            return SinglyLinkedList.nil()
-        else:
-            output = SinglyLinkedList.nil()
-            for i in range(len(args)-1, -1, -1):
-                output = Cons(args[i], output)
-            return output
+        return _prepend_all(args, _NIL)
+
+    @staticmethod
+    def fromIterable(iterable):# Iterable[T] -> SinglyLinkedList[T]
+        """ Builds a list in iteration order without an *args tuple.
+
+            Reversible inputs (list, tuple, range, ...) are consumed
+            back to front with no copy. Other iterables, e.g.
+            generators, go through a ListBuilder. A SinglyLinkedList is
+            returned as is.
+        """
+        if isinstance(iterable, SinglyLinkedList):
+            return iterable
+        try:
+            backwards = reversed(iterable)
+        except TypeError:
+            return ListBuilder().extend(iterable).freeze()
+        output = _NIL
+        for elem in backwards:
+            output = _cons(elem, output)
+        return output
+
+    @staticmethod
+    def fromReversedIterable(iterable):# Iterable[T] -> SinglyLinkedList[T]
+        """ Builds a list holding the elements in reverse iteration order.
+
+            One pass, no intermediate storage; works on any iterable.
+        """
+        output = _NIL
+        for elem in iterable:
+            output = _cons(elem, output)
+        return output
+
+    @staticmethod
+    def interned(*args):
+        """ Like list(), but through the current InternPool.
+
+            Structurally equal interned lists are the same object. See
+            fpinpy.collections.intern.InternPool.
+        """
+        from fpinpy.collections.intern import InternPool # intern imports this module
+        return InternPool.current().list(*args)
 
     @classmethod
     def nil(cls):
         """Returns singleton Nil.
 
         """
-        return Nil()
+        return _NIL
 
     @classmethod
     def cons(cls, head: T, tail):# Tail is Cons[T]
@@ -143,10 +262,7 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
 
             Failure or Empty will be converted into an empty list.
         """
-        tmp = []
-        for elem in aList:
-            tmp.append(elem.getOrElse(SinglyLinkedList.list()))
-        return SinglyLinkedList.list(*tmp)
+        return SinglyLinkedList.fromIterable([elem.getOrElse(_NIL) for elem in aList])
 
     @staticmethod
     def flatten(aList):
@@ -162,21 +278,23 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
         #    return identity
         #else:
         #    return function(aList.head())(SinglyLinkedList.foldRight(aList.tail(), identity, function))
-        accumulator = identity
-        tmp_list = aList.reverse()
-        while not tmp_list.isEmpty():
-            next_elem = tmp_list.head()
-            accumulator = function(next_elem)(accumulator)
-            tmp_list = tmp_list.tail()
-        return accumulator
+        return aList.foldRight(identity, function)
 
     @staticmethod
     def concat(list1, list2): # -> SinglyLinkedList
-        """ Requires  static foldRight or foldLeft """
-        return SinglyLinkedList.foldRightStatic(list1, list2, lambda x: lambda y: SinglyLinkedList.cons(x, y))
+        """ Copies list1 in front of list2, which is shared, not copied.
+
+            Equivalent definition:
+            SinglyLinkedList.foldRightStatic(list1, list2, lambda x: lambda y: SinglyLinkedList.cons(x, y))
+
+            O(list1.length()).
+        """
+        if list2.isEmpty():
+            return list1
+        return _prepend_all(_extend_values([], list1), list2)
 
     @staticmethod
-    def traverse(aList, function, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # SinglyLinkedList[T], Callable[[T], Result[U]] -> Result[List[U]]:
+    def traverse(aList, function, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False, failFast=False): # SinglyLinkedList[T], Callable[[T], Result[U]] -> Result[List[U]]:
         """ Applies function and collects Result.Success raw values.
 
             Input:
@@ -184,9 +302,17 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
             function: T -> Result[U]; a function
             ignoreFailure: Bool; any occurrance of Failure is not included in output
             emptyIsFailure: Bool; any occurance of Empty is considered a Failure 
+            failFast: Bool; return the first Failure (or Empty, when
+                emptyIsFailure, as Failure) at once, without calling
+                function on the remaining elements. Has no effect with
+                ignoreFailure; takes precedence over successOfFailure.
 
             Output:
             Result[List[U]]
+
+            successOfFailure keeps every exception. For many failures
+            see fpinpy.result.Validation.traverse, which keeps a bounded
+            summary instead.
         """
         arr = []
         failure_recognized = False
@@ -201,19 +327,140 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
             if tmp.isFailure():
                 if ignoreFailure:
                     continue
+                if failFast:
+                    return tmp
                 failure_recognized = True
                 if successOfFailure:
                     arr.append(tmp.forEachOrFail(lambda x: x).getOrElse("Failure"))
-        return Result.failure(RuntimeError(SinglyLinkedList.list(*arr))) if failure_recognized \
-            else Result.success(SinglyLinkedList.list(*arr))
+        return Result.failure(RuntimeError(SinglyLinkedList.fromIterable(arr))) if failure_recognized \
+            else Result.success(SinglyLinkedList.fromIterable(arr))
 
     @staticmethod
-    def sequence(aList, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # List[Result[T]]) -> Result[List[T]]:
+    def sequence(aList, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False, failFast=False): # List[Result[T]]) -> Result[List[T]]:
         """ Converts List[Result[T]]) into Result[List[T]]
 
             The default configuration: Any occurrance of Failure or Empty will yield Failure[List[T]]
+            The flags behave as in traverse.
         """
-        return SinglyLinkedList.traverse(aList, lambda x: x)
+        return SinglyLinkedList.traverse(aList, lambda x: x, ignoreFailure, emptyIsFailure, successOfFailure, failFast)
+
+    @staticmethod
+    def traverseIter(iterable, function, ignoreFailure=False, emptyIsFailure=True, failFast=False): # Iterable[T], Callable[[T], Result[U]] -> Iterator[Result[U]]
+        """ Lazy traverse: yields the Result of function for each element as it is pulled.
+
+            Yields the Results traverse would collect: every Success,
+            every Failure unless ignoreFailure, and Empty as Failure
+            when emptyIsFailure (otherwise Empty is skipped, as in
+            traverse). With failFast the generator ends after yielding
+            the first Failure, so function is not called on the rest.
+
+            Accepts any iterable, e.g. a Stream or a file, and holds one
+            element at a time: O(1) extra memory for any input size.
+
+            Usage:
+            for result in SinglyLinkedList.traverseIter(lines, parseRecord, failFast=True):
+                if result.isFailure():
+                    report(result)
+                else:
+                    store(result.successValue())
+        """
+        for elem in iterable:
+            result = function(elem)
+            if result.isSuccess():
+                yield result
+                continue
+            if result.isEmpty():
+                if not emptyIsFailure:
+                    continue
+                result = Result.failure(RuntimeError("Empty was considered Failure."))
+            if ignoreFailure:
+                continue
+            yield result
+            if failFast:
+                return
+
+    @staticmethod
+    async def traverseAsync(aList, function, maxConcurrency: Optional[int]=None, failFast: bool=False,
+                            ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # SinglyLinkedList[T], Callable[[T], Awaitable[Result[U]]] -> Result[List[U]]:
+        """ Concurrent traverse for coroutine functions returning Result.
+
+            At most maxConcurrency calls are in flight at once (all of
+            them when None). Results are merged in list order by
+            traverse, so the flags behave as in traverse.
+
+            failFast: Bool; on the first Failure (or Empty, when
+                emptyIsFailure), cancel the calls still running and
+                return that Failure. Has no effect with ignoreFailure.
+
+            Usage: result = await SinglyLinkedList.traverseAsync(ids, fetch, maxConcurrency=10)
+        """
+        elements = [elem for elem in aList]
+        if maxConcurrency is not None and maxConcurrency < 1:
+            raise ValueError(f"maxConcurrency must be positive but was {maxConcurrency}")
+        results: dict = {}
+        pending = iter(enumerate(elements))
+        stopOnFailure = failFast and not ignoreFailure
+
+        async def worker():
+            for index, elem in pending:
+                result = await function(elem)
+                results[index] = result
+                if stopOnFailure:
+                    if result.isFailure():
+                        raise _FailFast(result)
+                    if result.isEmpty() and emptyIsFailure:
+                        raise _FailFast(Result.failure(RuntimeError("Empty was considered Failure.")))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(maxConcurrency or len(elements), len(elements)))]
+        try:
+            await asyncio.gather(*workers)
+        except _FailFast as stop:
+            return stop.failure
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        ordered = [results[index] for index in range(len(elements))]
+        return SinglyLinkedList.traverse(ordered, lambda x: x, ignoreFailure, emptyIsFailure, successOfFailure)
+
+    @staticmethod
+    async def sequenceAsync(aList, maxConcurrency: Optional[int]=None, failFast: bool=False,
+                            ignoreFailure=False, emptyIsFailure=True, successOfFailure=False): # List[Awaitable[Result[T]]] -> Result[List[T]]:
+        """ Awaits a list of coroutines returning Result. See traverseAsync.
+
+            Coroutines never started because of failFast are closed.
+        """
+        try:
+            return await SinglyLinkedList.traverseAsync(aList, lambda x: x, maxConcurrency, failFast,
+                                                        ignoreFailure, emptyIsFailure, successOfFailure)
+        finally:
+            for elem in aList:
+                if inspect.iscoroutine(elem) and inspect.getcoroutinestate(elem) == inspect.CORO_CREATED:
+                    elem.close()
+
+    @staticmethod
+    def parTraverse(aList, function, ignoreFailure=False, emptyIsFailure=True, successOfFailure=False,
+                    chunkSize: int=1024, maxWorkers: Optional[int]=None, useThreads: bool=False,
+                    executor: Optional[Executor]=None): # SinglyLinkedList[T], Callable[[T], Result[U]] -> Result[List[U]]:
+        """ Parallel traverse. Same output as traverse for the same flags.
+
+            The list is split into chunks of chunkSize elements that run
+            on a process pool (or a thread pool with useThreads=True,
+            for work that releases the GIL). Per-element Results are
+            merged in list order by traverse itself.
+
+            Input (in addition to traverse):
+            chunkSize: int; elements per task
+            maxWorkers: int; pool size, defaults to the executor's default
+            useThreads: Bool; use a ThreadPoolExecutor instead of processes
+            executor: Executor; run on this executor instead of a new pool
+
+            With processes, function and the elements must be picklable,
+            i.e. no lambdas or closures.
+        """
+        chunks = _run_chunks(_traverse_chunk, aList, function, chunkSize, maxWorkers, useThreads, executor)
+        results = [_decode_result(encoded) for chunk in chunks for encoded in chunk]
+        return SinglyLinkedList.traverse(results, lambda x: x, ignoreFailure, emptyIsFailure, successOfFailure)
 
     @abc.abstractmethod
     def head(self):
@@ -240,7 +487,7 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
         raise NotImplementedError
 
     def reverse(self):
-        return SinglyLinkedList.list(*reversed(self))
+        return SinglyLinkedList.fromReversedIterable(self)
 
     @abc.abstractmethod
     def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]):
@@ -251,6 +498,34 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
         raise NotImplementedError
     #    return self.reverse().foldLeft(identity, lambda x: lambda y: function(y)(x))
 
+    @abc.abstractmethod
+    def foldl(self, identity: U, function: Callable[[U, T], U]) -> U:
+        """ Uncurried foldLeft: function(accumulator, elem).
+
+            One call per element and no closures, so two-argument
+            builtins work directly:
+
+            aList.foldl(0, operator.add)
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def foldr(self, identity: U, function: Callable[[T, U], U]) -> U:
+        """ Uncurried foldRight: function(elem, accumulator), last element first. """
+        raise NotImplementedError
+
+    def reduce(self, function: Callable[[T, T], T]):# -> Result[T]
+        """ foldl seeded with the head.
+
+            Result.empty() on the empty list, which has no identity to
+            return. Exceptions raised by function propagate as in foldl.
+
+            Usage: SinglyLinkedList.list(3, 1, 2).reduce(max) # Result(3)
+        """
+        if not self._length:
+            return Result.empty()
+        return Result.success(self._tail.foldl(self._head, function))
+
     def map(self, function: Callable[[T], U]):# -> SinglyLinkedList[U]:
         """ Map a function T -> U to each element in a list.
 
@@ -258,10 +533,15 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
             because the implementation is abstracted enough to allow for this.
         """
         #return self.foldLeft(self.list(), lambda h: lambda t: self.cons(function(h), t))
-        accumulator = []
-        for elem in self:
-            accumulator.append(function(elem))
-        return SinglyLinkedList.list(*accumulator)
+        return SinglyLinkedList.fromIterable([function(elem) for elem in self])
+
+    def parMap(self, function: Callable[[T], U], chunkSize: int=1024, maxWorkers: Optional[int]=None,
+               useThreads: bool=False, executor: Optional[Executor]=None):# -> SinglyLinkedList[U]
+        """ Parallel map preserving order. See parTraverse for the options. """
+        builder: ListBuilder[U] = ListBuilder()
+        for chunk in _run_chunks(_map_chunk, self, function, chunkSize, maxWorkers, useThreads, executor):
+            builder.extend(chunk)
+        return builder.freeze()
 
     @abc.abstractmethod
     def drop(self, n: int):
@@ -273,20 +553,206 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
     def toPyList(self):
         raise NotImplementedError
 
+    def toTuple(self) -> tuple:
+        return tuple(iter(self))
+
+    def toArray(self, typecode: str) -> array.array:
+        """ Copies the elements into an array.array of the given typecode.
+
+            Raises TypeError/OverflowError when an element does not fit
+            the typecode (see the array module).
+        """
+        return array.array(typecode, self.toPyList())
+
+    def toString(self, limit: Optional[int]=None) -> str:
+        """ Renders like str(), showing at most limit elements.
+
+            Usage: aList.toString(3) -> "[1, 2, 3, ... (999997 more), NIL]"
+
+            Iterative, so safe for lists of any length. Cost is O(limit).
+        """
+        shown = self._length if limit is None else max(0, min(limit, self._length))
+        parts = [str(elem) for elem in islice(self, shown)]
+        if shown < self._length:
+            parts.append(f"... ({self._length - shown} more)")
+        parts.append("NIL")
+        return f"[{', '.join(parts)}]"
+
+    def toRepr(self, limit: Optional[int]=None) -> str:
+        """ Renders like repr(), showing at most limit elements. """
+        if not self._length:
+            return repr(self)
+        shown = self._length if limit is None else max(0, min(limit, self._length))
+        parts = [f"Cons({elem!r}, " for elem in islice(self, shown)]
+        end = "Nil" if shown == self._length else f"... ({self._length - shown} more)"
+        return f"SinglyLinkedList({''.join(parts)}{end}{')' * shown})"
+
     def flatMap(self, func): # (func: A -> SinglyLinkedList[B]) -> SinglyLinkedList[B]
         """ Apply function from A -> List[B] to each element.
-            
+
             Equivalent implementation (TODO: Not sure how to implement):
             return SinglyLinkedList.flatten(SinglyLinkedList.map(func))
+
+            Equivalent definition:
+            self.foldRight(SinglyLinkedList.list(), lambda h: lambda t: SinglyLinkedList.concat(func(h), t))
+
+            Each inner list is copied once, except the last one, which
+            becomes the shared tail of the output. O(length of output).
         """
-        return self.foldRight(SinglyLinkedList.list(), lambda h: lambda t: SinglyLinkedList.concat(func(h), t))
+        inner_lists = [func(elem) for elem in self]
+        if not inner_lists:
+            return _NIL
+        shared_tail = inner_lists.pop()
+        values: list = []
+        for inner in inner_lists:
+            _extend_values(values, inner)
+        return _prepend_all(values, shared_tail)
 
     def filter(self, predicate: Callable[[T], bool]):
         """ Removes elements from the lst that do not satisfy a given predicate.
+
+            Equivalent definition:
+            self.foldRight(SinglyLinkedList.list(), lambda h: lambda t: SinglyLinkedList.cons(h, t) if predicate(h) else t)
+
+            The run of kept elements after the last removed element is
+            shared with self instead of being copied. O(n).
+        """
+        kept = []
+        shared_length = 0 # number of kept elements before shared_tail
+        shared_tail = self
+        node = self
+        while node._length:
+            if predicate(node._head):
+                kept.append(node._head)
+            else:
+                shared_length = len(kept)
+                shared_tail = node._tail
+            node = node._tail
+        del kept[shared_length:]
+        return _prepend_all(kept, shared_tail)
+
+    def partition(self, predicate: Callable[[T], bool]):# -> Tuple[SinglyLinkedList[T], SinglyLinkedList[T]]
+        """ (elements satisfying predicate, the others) in one pass.
+
+            Like filter, each side shares with self the run of elements
+            after the last element that went to the other side.
+        """
+        kept: list = []
+        rejected: list = []
+        kept_tail = rejected_tail = self
+        node = self
+        while node._length:
+            head = node._head
+            node = node._tail
+            if predicate(head):
+                kept.append(head)
+                rejected_tail = node
+            else:
+                rejected.append(head)
+                kept_tail = node
+        # Everything in kept_tail went to kept (and likewise for rejected).
+        del kept[len(kept) - kept_tail._length:]
+        del rejected[len(rejected) - rejected_tail._length:]
+        return _prepend_all(kept, kept_tail), _prepend_all(rejected, rejected_tail)
+
+    def span(self, predicate: Callable[[T], bool]):# -> Tuple[SinglyLinkedList[T], SinglyLinkedList[T]]
+        """ (longest prefix satisfying predicate, the rest). The rest is shared. """
+        prefix = []
+        node = self
+        while node._length and predicate(node._head):
+            prefix.append(node._head)
+            node = node._tail
+        return (self if not node._length else _prepend_all(prefix, _NIL)), node
+
+    def splitAt(self, n: int):# -> Tuple[SinglyLinkedList[T], SinglyLinkedList[T]]
+        """ (first n elements, the rest). The rest is shared. """
+        prefix = []
+        node = self
+        while n > 0 and node._length:
+            prefix.append(node._head)
+            node = node._tail
+            n -= 1
+        return (self if not node._length else _prepend_all(prefix, _NIL)), node
+
+    def groupBy(self, key: Callable[[T], K], persistent: bool=True):
+        """ Groups the elements by key(elem), keeping their order.
+
+            Returns PersistentHashMap[K, SinglyLinkedList[T]], or a dict
+            in order of first occurrence when persistent is False.
+        """
+        groups: dict = {}
+        for elem in _extend_values([], self):
+            k = key(elem)
+            group = groups.get(k)
+            if group is None:
+                groups[k] = [elem]
+            else:
+                group.append(elem)
+        if not persistent:
+            return {k: _prepend_all(values, _NIL) for k, values in groups.items()}
+        builder = PersistentHashMap.builder()
+        for k, values in groups.items():
+            builder.assoc(k, _prepend_all(values, _NIL))
+        return builder.persistent()
+
+    def zip(self, other):# SinglyLinkedList[U] -> SinglyLinkedList[Tuple[T, U]]
+        """ Pairs elements by position; stops at the shorter list. """
+        pairs = []
+        left, right = self, other
+        while left._length and right._length:
+            pairs.append((left._head, right._head))
+            left = left._tail
+            right = right._tail
+        return _prepend_all(pairs, _NIL)
+
+    def zipWith(self, other, function):# (SinglyLinkedList[U], T -> U -> V) -> SinglyLinkedList[V]
+        """ Combines elements by position with a curried function; stops at the shorter list. """
+        values = []
+        left, right = self, other
+        while left._length and right._length:
+            values.append(function(left._head)(right._head))
+            left = left._tail
+            right = right._tail
+        return _prepend_all(values, _NIL)
+
+    def unzip(self):# SinglyLinkedList[Tuple[T, U]] -> Tuple[SinglyLinkedList[T], SinglyLinkedList[U]]
+        """ Splits a list of pairs into the list of firsts and the list of seconds. """
+        firsts = []
+        seconds = []
+        for first, second in _extend_values([], self):
+            firsts.append(first)
+            seconds.append(second)
+        return _prepend_all(firsts, _NIL), _prepend_all(seconds, _NIL)
+
+    def zipWithIndex(self, start: int=0):# -> SinglyLinkedList[Tuple[T, int]]
+        """ Pairs each element with its position: (elem, index). """
+        return _prepend_all([(elem, index) for index, elem in enumerate(_extend_values([], self), start)], _NIL)
+
+    def sortBy(self, key: Optional[Callable[[T], object]]=None, reverse: bool=False):
+        """ Stable sort by key (the elements themselves when None). O(n log n).
+
+            Runs list.sort, i.e. Timsort: a natural merge sort that
+            detects existing runs and merges them bottom-up without
+            recursion, so presorted input costs O(n). For data larger
+            than memory see Stream.sortedStream.
         """
-        return self.foldRight(SinglyLinkedList.list(), \
-            lambda h: lambda t: SinglyLinkedList.cons(h, t) if predicate(h) else t
-        )
+        values = _extend_values([], self)
+        values.sort(key=key, reverse=reverse)
+        return _prepend_all(values, _NIL)
+
+    def sortWith(self, comparator: Callable[[T, T], int], reverse: bool=False):
+        """ Stable sort by comparator(a, b), negative when a comes first. """
+        return self.sortBy(cmp_to_key(comparator), reverse)
+
+    def view(self):# -> ListView[T]
+        """ Lazy view for chaining map/filter/flatMap without intermediate lists.
+
+            The chain runs in one pass at the terminal operation, e.g.
+
+            aList.view().map(f).filter(p).toList()
+        """
+        from fpinpy.collections.view import ListView # view imports this module
+        return ListView(self)
 
     def forEach(self, effect: Callable[[T], None]):
         worklist = self
@@ -301,23 +767,30 @@ class SinglyLinkedList(Generic[T]): # Generic[T] is a subclass of metaclass=ABCM
 
 class Nil(SinglyLinkedList[T]):
     """Represents empty list.
+
+        Nil is a singleton: Nil() and SinglyLinkedList.nil() always
+        return the same instance.
     """
+    __slots__ = ()
 
-    def __init__(self):
-        pass
+    # Read directly by internal code in place of length() and hash()
+    _length = 0
+    _hash = hash("Nil")
 
-    _instances: Dict[object, object] = {}
-    import threading
-    lock = threading.Lock()
+    _instance: Optional["Nil"] = None
+    _lock = threading.Lock()
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            with cls.lock:
-                # another thread could have created the lock
+    def __new__(cls):
+        if Nil._instance is None:
+            with Nil._lock:
+                # another thread could have created the instance
                 # between the check and acquiring lock, so check again.
-                if cls not in cls._instances:
-                    cls._instances[cls] = super().__new__(Nil, *args, **kwargs)
-        return cls._instances[cls]
+                if Nil._instance is None:
+                    Nil._instance = super().__new__(cls)
+        return Nil._instance
+
+    def __init__(self):
+        pass
 
     @overrides(SinglyLinkedList)
     def head(self) -> T:
@@ -348,6 +821,14 @@ class Nil(SinglyLinkedList[T]):
     def foldRight(self, identity: U, function: Callable[[U, T], U]):
         return identity
 
+    @overrides(SinglyLinkedList)
+    def foldl(self, identity: U, function: Callable[[U, T], U]) -> U:
+        return identity
+
+    @overrides(SinglyLinkedList)
+    def foldr(self, identity: U, function: Callable[[T, U], U]) -> U:
+        return identity
+
     @overrides(SinglyLinkedList)
     def drop(self, n: int) -> SinglyLinkedList[T]:
         return self
@@ -370,19 +851,27 @@ class Nil(SinglyLinkedList[T]):
         return isinstance(o, Nil)
 
     def __hash__(self):
-        return hash(repr(self))
+        return Nil._hash
+
+    def __reduce__(self):
+        return (Nil, ())
 
 class Cons(SinglyLinkedList[T]):
     """Represents non-empty list.
+
+        Direct construction validates the tail. Library code builds
+        nodes through _cons(), which skips the check.
     """
+    __slots__ = ('_head', '_tail', '_length', '_hash')
 
     def __init__(self,
                  head: T,
                  tail: SinglyLinkedList[T]):
-        self._head = head
         assert isinstance(tail, Cons) or isinstance(tail, Nil), f"Type was {type(tail)} but should have been Cons or Nil"
+        self._head = head
         self._tail = tail
-        self._length = tail.length() + 1
+        self._length = tail._length + 1
+        self._hash: Optional[int] = None
 
     @overrides(SinglyLinkedList)
     def head(self) -> T:
@@ -398,7 +887,7 @@ class Cons(SinglyLinkedList[T]):
 
     @overrides(SinglyLinkedList)
     def setHead(self, head: T) -> SinglyLinkedList[T]:
-        return SinglyLinkedList.cons(head, self.tail())
+        return _cons(head, self._tail)
 
     @overrides(SinglyLinkedList)
     def length(self):
@@ -444,44 +933,195 @@ class Cons(SinglyLinkedList[T]):
                     return _foldLeft(function(acc)(lst.head()), lst.tail())
             return _foldLeft(identity, self)
 
+            Delegates to foldl, which avoids the curried call per element.
         """
-        accumulator = identity # (empty/Nil)
-        for elem in self:
-           accumulator = function(accumulator)(elem)
+        return self.foldl(identity, lambda accumulator, elem: function(accumulator)(elem))
+
+    @overrides(SinglyLinkedList)
+    def foldl(self, identity: U, function: Callable[[U, T], U]) -> U:
+        accumulator = identity
+        node: SinglyLinkedList[T] = self
+        while node._length:
+            accumulator = function(accumulator, node._head)
+            node = node._tail
         return accumulator
 
     @overrides(SinglyLinkedList)
     def foldRight(self, identity: U, function: Callable[[T], Callable[[U], U]]) -> U:
+        """ Delegates to foldr. """
+        return self.foldr(identity, lambda elem, accumulator: function(elem)(accumulator))
+
+    @overrides(SinglyLinkedList)
+    def foldr(self, identity: U, function: Callable[[T, U], U]) -> U:
+        """ Walks a Python list snapshot of the elements backwards.
+
+            Each call allocates the snapshot, one pointer per element,
+            and releases it on return; no list nodes are built.
+        """
         accumulator = identity
-        tmp_list = self.reverse()
-        while not tmp_list.isEmpty():
-            next_elem = tmp_list.head()
-            accumulator = function(next_elem)(accumulator)
-            tmp_list = tmp_list.tail()
+        for elem in reversed(_extend_values([], self)):
+            accumulator = function(elem, accumulator)
         return accumulator
 
     @overrides(SinglyLinkedList)
     def toPyList(self):
-        return self.foldRight(list(), lambda h: lambda t: [h] + t)
+        """ O(n). Equivalent definition:
+
+            self.foldRight(list(), lambda h: lambda t: [h] + t)
+        """
+        return _extend_values([], self)
 
     @overrides(SinglyLinkedList)
     def __str__(self) -> str:
-        accumulator = ""
-        def toString(accumulator: str, aList: SinglyLinkedList) -> str:
-            if aList.isEmpty():
-                return accumulator
-            else:
-                accumulator = accumulator.__add__(str(aList.head())).__add__(", ")
-                return toString(accumulator , aList.tail())
-        return f"[{toString(accumulator, self)}NIL]"
+        """ Iterative equivalent of
+
+            def toString(accumulator: str, aList: SinglyLinkedList) -> str:
+                if aList.isEmpty():
+                    return accumulator
+                else:
+                    return toString(accumulator + str(aList.head()) + ", ", aList.tail())
+            return f"[{toString('', self)}NIL]"
+
+            See toString to cap the number of elements shown.
+        """
+        return self.toString()
 
     def __repr__(self) -> str:
-        accumulator = ""
-        def toString(accumulator: str, aList: SinglyLinkedList) -> str:
-            if aList.isEmpty():
-                # Cons(accumulator, Nil)
-                return accumulator + repr(aList) + ")"
-            else:
-                accumulator = accumulator + "Cons(" + repr(aList.head()) + ", "
-                return toString(accumulator, aList.tail())
-        return f"SinglyLinkedList({toString(accumulator, self)})"
+        """ SinglyLinkedList(Cons(1, Cons(2, Nil))). See toRepr. """
+        return self.toRepr()
+
+    def __eq__(self, other) -> bool:
+        """ Structural equality, element by element.
+
+            Stops early on different lengths, on different cached
+            hashes and as soon as both lists reach a shared tail.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Cons):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        a: SinglyLinkedList = self
+        b: SinglyLinkedList = other
+        while a is not b:
+            if a._head is not b._head and a._head != b._head:
+                return False
+            a = a._tail
+            b = b._tail
+        return True
+
+    def __hash__(self) -> int:
+        """ Hash of (head, hash of tail), cached on each node.
+
+            Only the nodes in front of the first node with a cached
+            hash are visited, so lists sharing a hashed suffix cost
+            O(length of the new prefix). Raises TypeError when an
+            element is unhashable, like tuple.
+        """
+        if self._hash is not None:
+            return self._hash
+        uncached: list = [] # Cons nodes; Nil always has a hash
+        node: SinglyLinkedList[T] = self
+        while node._hash is None:
+            uncached.append(node)
+            node = node._tail
+        tail_hash = node._hash
+        for cons in reversed(uncached):
+            tail_hash = cons._hash = hash((cons._head, tail_hash))
+        return tail_hash
+
+    def __reduce__(self):
+        """ Pickles the elements as one flat tuple.
+
+            The default slot-based pickling recurses once per node and
+            hits the recursion limit on long lists.
+        """
+        return (SinglyLinkedList.fromIterable, (self.toTuple(),))
+
+_object_new = object.__new__
+
+def _cons(head, tail):
+    """Unchecked Cons constructor for internal use.
+
+        The caller guarantees that tail is Cons or Nil.
+    """
+    node = _object_new(Cons)
+    node._head = head
+    node._tail = tail
+    node._length = tail._length + 1
+    node._hash = None
+    return node
+
+def _extend_values(values, aList):
+    """Appends the elements of aList to the Python list values."""
+    append = values.append
+    node = aList
+    while node._length:
+        append(node._head)
+        node = node._tail
+    return values
+
+def _prepend_all(values, tail):
+    """Prepends a Python sequence to tail, preserving order.
+
+        O(len(values)); tail is shared.
+    """
+    for elem in reversed(values):
+        tail = _cons(elem, tail)
+    return tail
+
+_NIL: Nil = Nil()
+
+class _FailFast(Exception):
+    """Stops traverseAsync workers at the first deciding Failure."""
+    def __init__(self, failure):
+        super().__init__()
+        self.failure = failure
+
+def _chunked(aList, chunkSize: int):
+    """Splits aList into Python lists of chunkSize elements."""
+    if chunkSize < 1:
+        raise ValueError(f"chunkSize must be positive but was {chunkSize}")
+    iterator = iter(aList)
+    chunk = list(islice(iterator, chunkSize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunkSize))
+
+def _run_chunks(task, aList, function, chunkSize, maxWorkers, useThreads, executor):
+    """Runs task(function, chunk) for every chunk; results in list order."""
+    chunks = _chunked(aList, chunkSize)
+    if executor is not None:
+        return list(executor.map(task, repeat(function), chunks))
+    pool = ThreadPoolExecutor(maxWorkers) if useThreads else ProcessPoolExecutor(maxWorkers)
+    with pool:
+        return list(pool.map(task, repeat(function), chunks))
+
+def _map_chunk(function, chunk):
+    return [function(elem) for elem in chunk]
+
+def _traverse_chunk(function, chunk):
+    """Applies function and encodes each Result as a plain tuple.
+
+        Tuples cross process boundaries even when a Failure holds a
+        traceback.
+    """
+    return [_encode_result(function(elem)) for elem in chunk]
+
+def _encode_result(result):
+    if result.isSuccess():
+        return (True, result.successValue())
+    if result.isFailure():
+        return (False, result.failureValue())
+    return (None, None)
+
+def _decode_result(encoded):
+    succeeded, value = encoded
+    if succeeded:
+        return Result.success(value)
+    if succeeded is None:
+        return Result.empty()
+    return Result.failure(value)
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import abc
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+from fpinpy.meta.decorators import overrides
+from fpinpy.result import Result
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from typing import TypeVar, Generic, Callable, Iterable, Optional, Tuple
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+S = TypeVar('S')
+
+DEFAULT_RUN_SIZE = 100000
+DEFAULT_FAN_IN = 64
+_SPILL_BATCH = 1024
+
+class StreamIterator:
+    """Forward iterator over a Stream.
+
+        Only the current cell is referenced, so cells already
+        visited can be reclaimed while iterating.
+    """
+    def __init__(self, stream):
+        self._state = stream
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        state = self._state
+        if state.isEmpty():
+            raise StopIteration
+        self._state = state.tail()
+        return state._head
+
+class Stream(Generic[T]):
+    """Lazy list with a strict head and a memoized tail.
+
+        The tail of each cell is a supplier (thunk) that is evaluated
+        at most once, the first time tail() is called. Only the prefix
+        that has been consumed is ever materialized.
+
+        Combinators that walk the stream (foldLeft, drop, forEach, ...)
+        drop their reference to the first cell before walking, so a
+        stream whose head is not retained by the caller runs in
+        constant memory.
+    """
+    __slots__ = ()
+    # Cell fields read directly by the walks after an isEmpty() check;
+    # StreamCons keeps them in slots, StreamNil never has them read.
+    _head: T
+    _supplier: Optional[Callable[[], "Stream[T]"]]
+    _tail: Optional["Stream[T]"]
+
+    @staticmethod
+    def empty():
+        return _EMPTY
+
+    @staticmethod
+    def cons(head: T, tail: Callable[[], "Stream[T]"]):
+        """ Input:
+            head: T; evaluated element
+            tail: () -> Stream[T]; supplier of the rest of the stream
+        """
+        return StreamCons(head, tail)
+
+    @staticmethod
+    def stream(*args):
+        return Stream.fromIterable(args)
+
+    @staticmethod
+    def fromIterable(iterable: Iterable[T]):
+        """ Wraps an iterable, iterator or generator.
+
+            Elements are pulled from the underlying iterator one at a
+            time, as the stream is consumed. The iterator must not be
+            advanced by anything else afterwards.
+        """
+        return _from_iterator(iter(iterable))
+
+    @staticmethod
+    def iterate(seed: T, function: Callable[[T], T]):
+        """ Infinite stream seed, f(seed), f(f(seed)), ... """
+        return StreamCons(seed, lambda: Stream.iterate(function(seed), function))
+
+    @staticmethod
+    def unfold(state: S, function: Callable[[S], Result]):
+        """ Builds a stream from a seed state.
+
+            Input:
+            state: S; initial state
+            function: S -> Result[Tuple[T, S]]; produces the next element
+                and the next state. The stream ends at the first Empty
+                or Failure.
+        """
+        return function(state) \
+            .map(lambda pair: StreamCons(pair[0], lambda: Stream.unfold(pair[1], function))) \
+            .getOrElse(_EMPTY)
+
+    @staticmethod
+    def sortedStream(iterable: Iterable[T], key: Optional[Callable[[T], object]]=None, reverse: bool=False,
+                     runSize: int=DEFAULT_RUN_SIZE, fanIn: int=DEFAULT_FAN_IN, directory: Optional[str]=None):
+        """ External stable sort: the elements of iterable in sorted order.
+
+            Reads runSize elements at a time, sorts each run in memory
+            and spills it to an anonymous temporary file (pickled, in
+            batches), then merges the runs lazily with a k-way heap
+            merge. At most fanIn runs are merged at once; more runs are
+            merged in extra passes. Memory stays around one run while
+            spilling and one batch per run while merging.
+
+            Input that fits in a single run is sorted in memory without
+            touching the disk. The input is consumed when the stream is
+            created; the temporary files are removed once the stream is
+            exhausted or garbage collected.
+
+            Input:
+            directory: str; where temporary files go (tempfile default when None)
+        """
+        if runSize < 1:
+            raise ValueError(f"runSize must be positive but was {runSize}")
+        if fanIn < 2:
+            raise ValueError(f"fanIn must be at least 2 but was {fanIn}")
+        return Stream.fromIterable(_external_sort(iter(iterable), key, reverse, runSize, fanIn, directory))
+
+    def sortBy(self, key: Optional[Callable[[T], object]]=None, reverse: bool=False,
+               runSize: int=DEFAULT_RUN_SIZE, fanIn: int=DEFAULT_FAN_IN, directory: Optional[str]=None):
+        """ Stable external sort, see sortedStream. Never terminates on an infinite stream. """
+        iterator = StreamIterator(self)
+        del self # release the first cell for the caller
+        return Stream.sortedStream(iterator, key, reverse, runSize, fanIn, directory)
+
+    def __iter__(self):
+        return StreamIterator(self)
+
+    @abc.abstractmethod
+    def head(self) -> T:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def tail(self):# -> Stream[T]
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def isEmpty(self) -> bool:
+        raise NotImplementedError
+
+    def headOption(self) -> Result:
+        """ Safe head: Result[T], Empty for an empty stream. """
+        return Result.empty() if self.isEmpty() else Result.success(self.head())
+
+    def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]) -> U:
+        """ Strict left fold. Never terminates on an infinite stream. """
+        stream = self
+        del self # release the first cell for the caller
+        accumulator = identity
+        while not stream.isEmpty():
+            accumulator = function(accumulator)(stream._head)
+            stream = stream.tail()
+        return accumulator
+
+    def forEach(self, effect: Callable[[T], None]) -> None:
+        stream = self
+        del self # release the first cell for the caller
+        while not stream.isEmpty():
+            effect(stream._head)
+            stream = stream.tail()
+        return None
+
+    def drop(self, n: int):
+        """ Removes n elements from the front of the stream.
+
+            The dropped prefix is evaluated, because evaluating a tail
+            is the only way to reach the next cell.
+        """
+        stream = self
+        del self # release the first cell for the caller
+        while n > 0 and not stream.isEmpty():
+            stream = stream.tail()
+            n -= 1
+        return stream
+
+    def dropWhile(self, predicate: Callable[[T], bool]):
+        stream = self
+        del self # release the first cell for the caller
+        while not stream.isEmpty() and predicate(stream._head):
+            stream = stream.tail()
+        return stream
+
+    def take(self, n: int):
+        """ Lazily keeps the first n elements. """
+        if n <= 0 or self.isEmpty():
+            return _EMPTY
+        stream = self
+        return StreamCons(stream._head, lambda: stream.tail().take(n - 1) if n > 1 else _EMPTY)
+
+    def takeWhile(self, predicate: Callable[[T], bool]):
+        """ Lazily keeps elements while predicate holds. """
+        if self.isEmpty() or not predicate(self._head):
+            return _EMPTY
+        stream = self
+        return StreamCons(stream._head, lambda: stream.tail().takeWhile(predicate))
+
+    def map(self, function: Callable[[T], U]):# -> Stream[U]
+        if self.isEmpty():
+            return _EMPTY
+        stream = self
+        return StreamCons(function(stream._head), lambda: stream.tail().map(function))
+
+    def filter(self, predicate: Callable[[T], bool]):
+        """ Lazily removes elements that do not satisfy predicate.
+
+            Evaluates up to the first matching element. Runs of
+            rejected elements are skipped iteratively.
+        """
+        stream = self
+        del self # release the first cell for the caller
+        while not stream.isEmpty() and not predicate(stream._head):
+            stream = stream.tail()
+        if stream.isEmpty():
+            return _EMPTY
+        return StreamCons(stream._head, lambda: stream.tail().filter(predicate))
+
+    def append(self, other: Callable[[], "Stream[T]"]):
+        """ Lazily appends the stream supplied by other. """
+        if self.isEmpty():
+            return other()
+        stream = self
+        return StreamCons(stream._head, lambda: stream.tail().append(other))
+
+    def flatMap(self, function):# (function: T -> Stream[U]) -> Stream[U]
+        """ Lazily applies function: T -> Stream[U] and flattens.
+
+            Elements mapping to empty streams are skipped iteratively.
+        """
+        stream = self
+        del self # release the first cell for the caller
+        while not stream.isEmpty():
+            inner = function(stream._head)
+            if not inner.isEmpty():
+                rest = stream
+                return inner.append(lambda: rest.tail().flatMap(function))
+            stream = stream.tail()
+        return _EMPTY
+
+    def toList(self):# -> SinglyLinkedList[T]
+        """ Strict conversion. Never terminates on an infinite stream. """
+        return SinglyLinkedList.fromIterable(self.toPyList())
+
+    def toPyList(self):
+        iterator = StreamIterator(self)
+        del self # release the first cell for the caller
+        return [elem for elem in iterator]
+
+    def __str__(self):
+        """ Shows the evaluated prefix only; ... marks an unevaluated tail. """
+        parts = []
+        stream = self
+        while isinstance(stream, StreamCons):
+            parts.append(str(stream._head))
+            if stream._supplier is not None:
+                parts.append("...")
+                return f"[{', '.join(parts)}]"
+            stream = stream._tail
+        parts.append("NIL")
+        return f"[{', '.join(parts)}]"
+
+    def __repr__(self):
+        return f"Stream({str(self)})"
+
+class StreamNil(Stream[T]):
+    """Represents the empty stream. Singleton.
+    """
+    __slots__ = ()
+
+    _instance: Optional["StreamNil"] = None
+
+    def __new__(cls):
+        if StreamNil._instance is None:
+            StreamNil._instance = super().__new__(cls)
+        return StreamNil._instance
+
+    @overrides(Stream)
+    def head(self) -> T:
+        raise RuntimeError("head called on empty stream")
+
+    @overrides(Stream)
+    def tail(self):
+        raise RuntimeError("tail called on empty stream")
+
+    @overrides(Stream)
+    def isEmpty(self) -> bool:
+        return True
+
+class StreamCons(Stream[T]):
+    """Represents a non-empty stream.
+
+        _supplier holds the unevaluated tail and is cleared once the
+        tail has been computed, so the closure (and whatever it
+        captured) can be reclaimed.
+    """
+    __slots__ = ('_head', '_supplier', '_tail')
+
+    def __init__(self, head: T, tail: Callable[[], Stream[T]]):
+        self._head = head
+        self._supplier = tail
+        self._tail = None
+
+    @overrides(Stream)
+    def head(self) -> T:
+        return self._head
+
+    @overrides(Stream)
+    def tail(self) -> Stream[T]:
+        supplier = self._supplier
+        if supplier is not None:
+            self._tail = supplier()
+            self._supplier = None
+        return self._tail # type: ignore[return-value]
+
+    @overrides(Stream)
+    def isEmpty(self) -> bool:
+        return False
+
+def _from_iterator(iterator):
+    try:
+        head = next(iterator)
+    except StopIteration:
+        return _EMPTY
+    return StreamCons(head, lambda: _from_iterator(iterator))
+
+def _external_sort(iterator, key, reverse: bool, runSize: int, fanIn: int, directory):
+    first = sorted(islice(iterator, runSize), key=key, reverse=reverse)
+    if len(first) < runSize:
+        yield from first
+        return
+    runs = [_spill(first, directory)]
+    del first
+    try:
+        while True:
+            run = sorted(islice(iterator, runSize), key=key, reverse=reverse)
+            if not run:
+                break
+            runs.append(_spill(run, directory))
+            del run
+        # Merge passes keep the runs in input order, so the result stays stable.
+        while len(runs) > fanIn:
+            merged = []
+            for start in range(0, len(runs), fanIn):
+                group = runs[start:start + fanIn]
+                merged.append(_spill(heapq.merge(*map(_read_run, group), key=key, reverse=reverse), directory))
+                for file in group:
+                    file.close()
+            runs = merged
+        yield from heapq.merge(*map(_read_run, runs), key=key, reverse=reverse)
+    finally:
+        for file in runs:
+            file.close()
+
+def _spill(values: Iterable, directory):
+    """Writes values to a new temporary file in pickled batches."""
+    file = tempfile.TemporaryFile(dir=directory)
+    values = iter(values)
+    while True:
+        batch = list(islice(values, _SPILL_BATCH))
+        if not batch:
+            break
+        pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+    return file
+
+def _read_run(file):
+    file.seek(0)
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
+
+_EMPTY: StreamNil = StreamNil()
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+from fpinpy.result import Result
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from typing import TypeVar, Generic, Callable, Iterable, Optional
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+class _Node:
+    """Trie node. array holds children, or values at the leaf level.
+
+        edit is None for persistent nodes and the owning transient's
+        token for nodes that transient may mutate in place.
+    """
+    __slots__ = ('edit', 'array')
+
+    def __init__(self, edit, array: list):
+        self.edit = edit
+        self.array = array
+
+_EMPTY_NODE = _Node(None, [])
+
+def _tailoff(size: int) -> int:
+    """Physical index of the first element held in the tail."""
+    return 0 if size < WIDTH else ((size - 1) >> BITS) << BITS
+
+def _new_path(edit, level: int, node: _Node) -> _Node:
+    while level > 0:
+        node = _Node(edit, [node])
+        level -= BITS
+    return node
+
+class PersistentVector(Generic[T]):
+    """Persistent vector implemented as a bit-partitioned trie.
+
+        Elements live in leaves of 32 values under a tree of 32-way
+        nodes; the last, partially filled leaf is kept apart as the
+        tail. get, set, append and pop touch one root-to-leaf path and
+        share everything else with the previous version, which makes
+        them O(log32 n). append and pop at the tail are O(1) in most
+        cases.
+
+        Slices share the trie with the original vector. Whole subtrees
+        before the slice start are released; the logical start is
+        kept as an offset (origin) into the trie.
+
+        For bulk construction use a TransientVector (see builder() and
+        transient()), which mutates nodes it owns in place.
+    """
+    __slots__ = ('_count', '_shift', '_root', '_tail', '_origin')
+
+    def __init__(self, count: int, shift: int, root: _Node, tail: list, origin: int=0):
+        """ Prefer the factories over direct construction. """
+        self._count = count
+        self._shift = shift
+        self._root = root
+        self._tail = tail
+        self._origin = origin
+
+    @staticmethod
+    def empty():
+        return _EMPTY
+
+    @staticmethod
+    def vector(*args):
+        return PersistentVector.fromIterable(args)
+
+    @staticmethod
+    def fromIterable(iterable: Iterable[T]):
+        builder = PersistentVector.builder()
+        for elem in iterable:
+            builder.append(elem)
+        return builder.persistent()
+
+    @staticmethod
+    def fromList(aList: SinglyLinkedList[T]):
+        return PersistentVector.fromIterable(aList)
+
+    @staticmethod
+    def builder():
+        """ Returns an empty TransientVector. """
+        return TransientVector(_EMPTY)
+
+    def transient(self):
+        """ Returns a TransientVector holding the same elements.
+
+            The transient shares structure with self and copies a node
+            only the first time it writes to it.
+        """
+        return TransientVector(self)
+
+    def length(self) -> int:
+        return self._count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def isEmpty(self) -> bool:
+        return self._count == 0
+
+    def _array_for(self, index: int) -> list:
+        """Leaf array holding physical index."""
+        if index >= _tailoff(self._origin + self._count):
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node.array[(index >> level) & MASK]
+            level -= BITS
+        return node.array
+
+    def _check_index(self, index: int) -> None:
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index {index} out of range for vector of length {self._count}")
+
+    def get(self, index: int) -> T:
+        """ Element at index; raises IndexError when out of range. """
+        self._check_index(index)
+        index += self._origin
+        return self._array_for(index)[index & MASK]
+
+    def getOrFailure(self, index: int) -> Result:
+        """ Safe get: Result[T], Failure when index is out of range. """
+        if not 0 <= index < self._count:
+            return Result.failure(f"Index {index} out of range for vector of length {self._count}")
+        return Result.success(self.get(index))
+
+    def set(self, index: int, value: T):
+        """ New vector with value at index. index == length() appends. """
+        if index == self._count:
+            return self.append(value)
+        self._check_index(index)
+        index += self._origin
+        if index >= _tailoff(self._origin + self._count):
+            tail = list(self._tail)
+            tail[index & MASK] = value
+            return PersistentVector(self._count, self._shift, self._root, tail, self._origin)
+        root = _do_assoc(self._shift, self._root, index, value)
+        return PersistentVector(self._count, self._shift, root, self._tail, self._origin)
+
+    def append(self, value: T):
+        size = self._origin + self._count
+        if size - _tailoff(size) < WIDTH:
+            return PersistentVector(self._count + 1, self._shift, self._root, self._tail + [value], self._origin)
+        tail_node = _Node(None, self._tail)
+        shift = self._shift
+        if (size >> BITS) > (1 << shift):
+            root = _Node(None, [self._root, _new_path(None, shift, tail_node)])
+            shift += BITS
+        else:
+            root = _push_tail(None, size, shift, self._root, tail_node)
+        return PersistentVector(self._count + 1, shift, root, [value], self._origin)
+
+    def pop(self):
+        """ New vector without the last element. """
+        if self._count == 0:
+            raise RuntimeError("pop called on empty vector")
+        if self._count == 1:
+            return _EMPTY
+        size = self._origin + self._count
+        if size - _tailoff(size) > 1:
+            return PersistentVector(self._count - 1, self._shift, self._root, self._tail[:-1], self._origin)
+        tail = self._array_for(size - 2)
+        if _tailoff(size - 1) <= self._origin:
+            return _in_tail(self._count - 1, tail, self._origin)
+        root = _pop_tail(size, self._shift, self._root)
+        shift = self._shift
+        if root is None:
+            root = _EMPTY_NODE
+        if shift > BITS and len(root.array) == 1:
+            root = root.array[0]
+            shift -= BITS
+        return PersistentVector(self._count - 1, shift, root, tail, self._origin)
+
+    def last(self) -> T:
+        return self.get(self._count - 1)
+
+    def slice(self, start: int, end: int):
+        """ Elements [start, end), sharing structure with self.
+
+            Bounds are clamped to the vector like Python slices, but
+            negative indices are not supported here.
+        """
+        start = max(0, min(start, self._count))
+        end = max(start, min(end, self._count))
+        if start == end:
+            return _EMPTY
+        if start == 0 and end == self._count:
+            return self
+        vector = self._take(end)
+        origin = vector._origin + start
+        if _tailoff(origin + end - start) <= origin:
+            return _in_tail(end - start, vector._tail, origin)
+        root = _trim_left(vector._shift, vector._root, origin, 0)
+        return PersistentVector(end - start, vector._shift, root, vector._tail, origin)
+
+    def _take(self, n: int):
+        """First n elements (0 < n <= length), keeping the origin."""
+        if n == self._count:
+            return self
+        size = self._origin + self._count
+        new_size = self._origin + n
+        tailoff = _tailoff(size)
+        if new_size > tailoff:
+            return PersistentVector(n, self._shift, self._root, self._tail[:new_size - tailoff], self._origin)
+        tail = self._array_for(new_size - 1)[:((new_size - 1) & MASK) + 1]
+        new_tailoff = _tailoff(new_size)
+        if new_tailoff <= self._origin:
+            return _in_tail(n, tail, self._origin)
+        root = _take_tree(self._shift, self._root, new_tailoff)
+        shift = self._shift
+        while shift > BITS and len(root.array) == 1:
+            root = root.array[0]
+            shift -= BITS
+        return PersistentVector(n, shift, root, tail, self._origin)
+
+    def __getitem__(self, index):
+        """ Python indexing: negative indices and slices with step 1. """
+        if isinstance(index, slice):
+            start, end, step = index.indices(self._count)
+            if step != 1:
+                return PersistentVector.fromIterable(self.get(i) for i in range(start, end, step))
+            return self.slice(start, end)
+        if index < 0:
+            index += self._count
+        return self.get(index)
+
+    def __iter__(self):
+        size = self._origin + self._count
+        index = self._origin
+        while index < size:
+            leaf = self._array_for(index)
+            offset = index & MASK
+            stop = min(len(leaf), offset + size - index)
+            yield from leaf[offset:stop] if offset or stop < len(leaf) else leaf
+            index += stop - offset
+
+    def map(self, function: Callable[[T], U]):# -> PersistentVector[U]
+        return PersistentVector.fromIterable(function(elem) for elem in self)
+
+    def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]) -> U:
+        accumulator = identity
+        for elem in self:
+            accumulator = function(accumulator)(elem)
+        return accumulator
+
+    def forEach(self, effect: Callable[[T], None]) -> None:
+        for elem in self:
+            effect(elem)
+        return None
+
+    def toPyList(self) -> list:
+        return [elem for elem in self]
+
+    def toList(self):# -> SinglyLinkedList[T]
+        return SinglyLinkedList.fromIterable(self)
+
+    def __str__(self):
+        return f"Vector({', '.join(str(elem) for elem in self)})"
+
+    def __repr__(self):
+        return f"Vector({', '.join(repr(elem) for elem in self)})"
+
+class TransientVector(Generic[T]):
+    """Mutable builder for PersistentVector.
+
+        Writes go to nodes owned by this transient, copying a shared
+        node the first time it is touched. persistent() hands the
+        result over in O(1) and invalidates the transient.
+    """
+    __slots__ = ('_count', '_shift', '_root', '_tail', '_origin', '_edit')
+
+    def __init__(self, vector: PersistentVector[T]):
+        self._edit: Optional[object] = object()
+        self._count = vector._count
+        self._shift = vector._shift
+        self._root = _Node(self._edit, list(vector._root.array))
+        self._tail = list(vector._tail)
+        self._origin = vector._origin
+
+    def _ensure_editable(self) -> None:
+        if self._edit is None:
+            raise RuntimeError("Transient used after persistent() call")
+
+    def _editable(self, node: _Node) -> _Node:
+        return node if node.edit is self._edit else _Node(self._edit, list(node.array))
+
+    def length(self) -> int:
+        return self._count
+
+    def append(self, value: T):
+        """ Appends in place. Returns self for chaining. """
+        self._ensure_editable()
+        size = self._origin + self._count
+        if size - _tailoff(size) < WIDTH:
+            self._tail.append(value)
+            self._count += 1
+            return self
+        tail_node = _Node(self._edit, self._tail)
+        self._tail = [value]
+        if (size >> BITS) > (1 << self._shift):
+            self._root = _Node(self._edit, [self._root, _new_path(self._edit, self._shift, tail_node)])
+            self._shift += BITS
+        else:
+            self._root = self._push_tail(size, self._shift, self._root, tail_node)
+        self._count += 1
+        return self
+
+    def _push_tail(self, size: int, level: int, parent: _Node, tail_node: _Node) -> _Node:
+        parent = self._editable(parent)
+        array = parent.array
+        subidx = ((size - 1) >> level) & MASK
+        if level == BITS:
+            node = tail_node
+        elif subidx < len(array) and array[subidx] is not None:
+            node = self._push_tail(size, level - BITS, array[subidx], tail_node)
+        else:
+            node = _new_path(self._edit, level - BITS, tail_node)
+        if subidx < len(array):
+            array[subidx] = node
+        else:
+            array.append(node)
+        return parent
+
+    def set(self, index: int, value: T):
+        """ Sets in place. index == length() appends. Returns self. """
+        self._ensure_editable()
+        if index == self._count:
+            return self.append(value)
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index {index} out of range for vector of length {self._count}")
+        index += self._origin
+        if index >= _tailoff(self._origin + self._count):
+            self._tail[index & MASK] = value
+            return self
+        self._root = self._editable(self._root)
+        node = self._root
+        level = self._shift
+        while level > 0:
+            subidx = (index >> level) & MASK
+            child = self._editable(node.array[subidx])
+            node.array[subidx] = child
+            node = child
+            level -= BITS
+        node.array[index & MASK] = value
+        return self
+
+    def persistent(self) -> PersistentVector[T]:
+        """ Freezes the elements into a PersistentVector. """
+        self._ensure_editable()
+        self._edit = None
+        if self._count == 0:
+            return _EMPTY
+        return PersistentVector(self._count, self._shift, self._root, self._tail, self._origin)
+
+def _push_tail(edit, size: int, level: int, parent: _Node, tail_node: _Node) -> _Node:
+    array = list(parent.array)
+    subidx = ((size - 1) >> level) & MASK
+    if level == BITS:
+        node = tail_node
+    elif subidx < len(array) and array[subidx] is not None:
+        node = _push_tail(edit, size, level - BITS, array[subidx], tail_node)
+    else:
+        node = _new_path(edit, level - BITS, tail_node)
+    if subidx < len(array):
+        array[subidx] = node
+    else:
+        array.append(node)
+    return _Node(edit, array)
+
+def _do_assoc(level: int, node: _Node, index: int, value) -> _Node:
+    array = list(node.array)
+    if level == 0:
+        array[index & MASK] = value
+    else:
+        subidx = (index >> level) & MASK
+        array[subidx] = _do_assoc(level - BITS, array[subidx], index, value)
+    return _Node(None, array)
+
+def _pop_tail(size: int, level: int, node: _Node) -> Optional[_Node]:
+    """Removes the leaf holding physical index size - 2, which becomes the tail."""
+    subidx = ((size - 2) >> level) & MASK
+    if level > BITS:
+        child = _pop_tail(size, level - BITS, node.array[subidx])
+        if child is None and subidx == 0:
+            return None
+        array = node.array[:subidx + 1]
+        if child is None:
+            del array[subidx]
+        else:
+            array[subidx] = child
+        return _Node(None, array)
+    if subidx == 0:
+        return None
+    return _Node(None, node.array[:subidx])
+
+def _take_tree(level: int, node: _Node, n: int) -> _Node:
+    """Copy of the right edge of node holding its first n elements."""
+    span = 1 << level
+    k = (n + span - 1) >> level
+    array = node.array[:k]
+    rest = n - (k - 1) * span
+    if level > BITS and rest < span:
+        array[k - 1] = _take_tree(level - BITS, array[k - 1], rest)
+    return _Node(None, array)
+
+def _trim_left(level: int, node: _Node, start: int, base: int) -> _Node:
+    """Copy of the left edge of node with subtrees wholly before start cleared.
+
+        Cleared slots keep their position, so indexing is unchanged.
+    """
+    subidx = (start - base) >> level
+    array = list(node.array)
+    for j in range(min(subidx, len(array))):
+        array[j] = None
+    if level > BITS and subidx < len(array) and array[subidx] is not None:
+        array[subidx] = _trim_left(level - BITS, array[subidx], start, base + (subidx << level))
+    return _Node(None, array)
+
+def _in_tail(count: int, tail: list, origin: int) -> PersistentVector:
+    """Vector whose elements all sit in tail, re-rooted on an empty trie.
+
+        The origin moves down by whole leaves into the tail's own leaf,
+        so the tree cannot hold trimmed slots that later operations
+        would walk into.
+    """
+    return PersistentVector(count, BITS, _EMPTY_NODE, tail, origin & MASK)
+
+_EMPTY: PersistentVector = PersistentVector(0, BITS, _EMPTY_NODE, [])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+from functools import partial
+from itertools import chain, islice, takewhile
+from fpinpy.collections.singly_linked_list import SinglyLinkedList
+from typing import TypeVar, Generic, Callable, Iterable, Iterator, Tuple
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+
+class ListView(Generic[T]):
+    """Deferred pipeline of combinators over a source collection.
+
+        map, filter, flatMap, take and takeWhile only record a stage
+        and return a new view. Nothing runs until a terminal operation
+        (foldLeft, foldl, forEach, toPyList, toList or iteration), which pulls
+        every element through all stages in a single pass. No
+        intermediate list is allocated between stages.
+
+        Usage:
+        aList.view().map(f).filter(p).map(g).foldLeft(0, lambda acc: lambda x: acc + x)
+
+        The source is any iterable collection; views are immutable and
+        may be run more than once.
+    """
+    __slots__ = ('_source', '_stages')
+
+    def __init__(self, source: Iterable, stages: Tuple[Callable[[Iterator], Iterator], ...]=()):
+        self._source = source
+        self._stages = stages
+
+    def _stage(self, stage: Callable[[Iterator], Iterator]):
+        return ListView(self._source, self._stages + (stage,))
+
+    def map(self, function: Callable[[T], U]):# -> ListView[U]
+        return self._stage(partial(map, function))
+
+    def filter(self, predicate: Callable[[T], bool]):
+        return self._stage(partial(filter, predicate))
+
+    def flatMap(self, function):# (function: T -> Iterable[U]) -> ListView[U]
+        """ function may return a SinglyLinkedList or any iterable. """
+        return self._stage(lambda iterator: chain.from_iterable(map(function, iterator)))
+
+    def take(self, n: int):
+        return self._stage(lambda iterator: islice(iterator, max(n, 0)))
+
+    def takeWhile(self, predicate: Callable[[T], bool]):
+        return self._stage(partial(takewhile, predicate))
+
+    def __iter__(self) -> Iterator[T]:
+        iterator = iter(self._source)
+        for stage in self._stages:
+            iterator = stage(iterator)
+        return iterator
+
+    def foldLeft(self, identity: U, function: Callable[[U], Callable[[T], U]]) -> U:
+        return self.foldl(identity, lambda accumulator, elem: function(accumulator)(elem))
+
+    def foldl(self, identity: U, function: Callable[[U, T], U]) -> U:
+        """ Uncurried foldLeft, see SinglyLinkedList.foldl. """
+        accumulator = identity
+        for elem in self:
+            accumulator = function(accumulator, elem)
+        return accumulator
+
+    def forEach(self, effect: Callable[[T], None]) -> None:
+        for elem in self:
+            effect(elem)
+        return None
+
+    def toPyList(self) -> list:
+        return list(self)
+
+    def toList(self):# -> SinglyLinkedList[T]
+        """ Forces the view back into a SinglyLinkedList. """
+        return SinglyLinkedList.fromIterable(self)
+
+    def __str__(self):
+        return f"ListView({type(self._source).__name__}, stages={len(self._stages)})"
+
+    def __repr__(self):
+        return str(self)
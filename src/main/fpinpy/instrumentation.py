@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Opt-in counters for allocations, Result constructions and combinator calls.
+
+    Enabling installs counting wrappers on the data structures;
+    disabling puts the original functions back, so a disabled process
+    runs exactly the uninstrumented code.
+
+    Enable for a block:
+
+    with instrumentation.enabled():
+        pipeline()
+    print(instrumentation.table())
+
+    or for a whole process by setting FPINPY_INSTRUMENTATION=1 before
+    fpinpy is imported; the table is then written to stderr at exit.
+
+    snapshot() returns
+    {"allocations": {class name: count},
+     "results": {Result subtype: count},
+     "calls": {"Class.method": {"calls": count, "seconds": wall time}}}.
+    Call times are inclusive: a combinator that calls another one
+    counts that time too.
+"""
+import atexit
+import inspect
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional
+
+ENVIRONMENT_VARIABLE = "FPINPY_INSTRUMENTATION"
+
+_lock = threading.RLock()
+_depth = 0
+_patches: List[tuple] = [] # (owner, name, original attribute), restored in reverse
+_allocations: Dict[str, int] = {}
+_results: Dict[str, int] = {}
+_calls: Dict[str, List] = {} # label -> [calls, seconds]
+
+def isEnabled() -> bool:
+    return _depth > 0
+
+def enable() -> None:
+    """ Installs the wrappers. Calls nest: each enable needs a disable. """
+    global _depth
+    with _lock:
+        if _depth == 0:
+            _install()
+        _depth += 1
+
+def disable() -> None:
+    """ Removes the wrappers once every enable has been matched. Counters are kept. """
+    global _depth
+    with _lock:
+        if _depth == 0:
+            raise RuntimeError("instrumentation.disable() called while disabled")
+        _depth -= 1
+        if _depth == 0:
+            _uninstall()
+
+@contextmanager
+def enabled(clear: bool=True):
+    """ Instruments the with-block; resets the counters first unless clear is False. """
+    if clear:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+def reset() -> None:
+    with _lock:
+        _allocations.clear()
+        _results.clear()
+        _calls.clear()
+
+def snapshot() -> dict:
+    """ Copy of the counters. """
+    with _lock:
+        return {
+            "allocations": dict(_allocations),
+            "results": dict(_results),
+            "calls": {label: {"calls": calls, "seconds": seconds} for label, (calls, seconds) in _calls.items()},
+        }
+
+def table(data: Optional[dict]=None) -> str:
+    """ snapshot() (or data) as aligned text, calls sorted by time. """
+    data = snapshot() if data is None else data
+    lines = []
+    for title, counts in (("allocations", data["allocations"]), ("results", data["results"])):
+        lines.append(f"{title:<40}{'count':>12}")
+        lines.extend(f"  {name:<38}{count:>12}" for name, count in sorted(counts.items(), key=lambda item: -item[1]))
+    lines.append(f"{'calls':<40}{'count':>12}{'seconds':>12}")
+    for label, entry in sorted(data["calls"].items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"  {label:<38}{entry['calls']:>12}{entry['seconds']:>12.6f}")
+    return "\n".join(lines)
+
+def _count(counter: Dict[str, int], name: str) -> None:
+    with _lock:
+        counter[name] = counter.get(name, 0) + 1
+
+def _record_call(label: str, seconds: float) -> None:
+    with _lock:
+        entry = _calls.get(label)
+        if entry is None:
+            _calls[label] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+def _patch(owner, name: str, replacement) -> None:
+    _patches.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, replacement)
+
+def _uninstall() -> None:
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+def _counting_object_new(cls):
+    _count(_allocations, cls.__name__)
+    return object.__new__(cls)
+
+def _counting_init(cls, init):
+    name = cls.__name__
+    @wraps(init)
+    def wrapper(self, *args, **kwargs):
+        if type(self) is cls:
+            _count(_allocations, name)
+        return init(self, *args, **kwargs)
+    return wrapper
+
+def _counting_new(new):
+    @wraps(new)
+    def wrapper(cls, *args, **kwargs):
+        _count(_results, cls.__name__)
+        return new(cls, *args, **kwargs)
+    return staticmethod(wrapper)
+
+def _counting_bool_result_init(init):
+    @wraps(init)
+    def wrapper(self, value, failed=False):
+        _count(_results, "bool.Failure" if failed else "bool.Success")
+        return init(self, value, failed)
+    return wrapper
+
+def _timed(label: str, function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record_call(label, time.perf_counter() - start)
+    return wrapper
+
+def _time_methods(cls) -> None:
+    """ Wraps the public methods cls defines itself. Coroutine and generator functions are left alone. """
+    for name, attribute in list(cls.__dict__.items()):
+        if name.startswith("_"):
+            continue
+        wrapStatic = isinstance(attribute, staticmethod)
+        function = attribute.__func__ if isinstance(attribute, (staticmethod, classmethod)) else attribute
+        if not inspect.isfunction(function) or inspect.iscoroutinefunction(function) or inspect.isgeneratorfunction(function):
+            continue
+        timed = _timed(f"{cls.__name__}.{name}", function)
+        if wrapStatic:
+            timed = staticmethod(timed)
+        elif isinstance(attribute, classmethod):
+            timed = classmethod(timed)
+        _patch(cls, name, timed)
+
+def _install() -> None:
+    from fpinpy.collections import singly_linked_list, intern, stream, chunked_list, vector, random_access_list
+    from fpinpy.result import result_using_subclass_distinguisher as subclass_result
+    from fpinpy.result import result_using_bool_distinguisher as bool_result
+    cls: type
+    # Node allocations: internal constructors go through _object_new, the rest through __init__.
+    _patch(singly_linked_list, "_object_new", _counting_object_new)
+    _patch(intern, "_object_new", _counting_object_new)
+    for cls in (singly_linked_list.Cons, stream.StreamCons, chunked_list.ChunkedList,
+                vector.PersistentVector, vector._Node, random_access_list.RandomAccessList):
+        _patch(cls, "__init__", _counting_init(cls, cls.__dict__["__init__"]))
+    # Result constructions by subtype
+    for cls in (subclass_result.Success, subclass_result.Empty, subclass_result.Failure):
+        _patch(cls, "__new__", _counting_new(cls.__dict__["__new__"]))
+    _patch(bool_result.Result, "__init__", _counting_bool_result_init(bool_result.Result.__dict__["__init__"]))
+    # Combinator calls and wall time
+    for cls in (singly_linked_list.SinglyLinkedList, singly_linked_list.Cons, singly_linked_list.Nil,
+                singly_linked_list.ListBuilder, stream.Stream, stream.StreamCons,
+                subclass_result.Result, subclass_result.Success, subclass_result.Empty, subclass_result.Failure,
+                bool_result.Result):
+        _time_methods(cls)
+
+def _report_at_exit() -> None:
+    print(table(), file=sys.stderr)
+
+if os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0"):
+    enable()
+    atexit.register(_report_at_exit)
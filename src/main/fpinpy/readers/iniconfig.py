@@ -92,7 +92,7 @@ class IniConfigReader():
         try:
             entries = aParser.items(aSection)
             if entries is not None:
-                return Result.success(SinglyLinkedList.list(*entries))
+                return Result.success(SinglyLinkedList.fromIterable(entries))
             else:
                 return Result.success(SinglyLinkedList.list())
         except Exception as e:
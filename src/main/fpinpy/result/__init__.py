@@ -21,3 +21,4 @@
 # SOFTWARE.
 #
 from .result_using_subclass_distinguisher import Result, Success, Failure, Empty
+from .validation import Validation, Valid, Invalid, Errors, ErrorSample, ValidationError
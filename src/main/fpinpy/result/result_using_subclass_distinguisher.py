@@ -25,6 +25,7 @@ from functools import wraps
 from fpinpy.meta.decorators import overrides
 from typing import TypeVar, Generic, Callable, List, Self
 import sys
+import traceback
 # Declare module-scoped type variables for generics
 T = TypeVar('T')
 U = TypeVar('U')
@@ -474,6 +475,23 @@ class Failure(Empty[T]):
     def failureValue(self) -> Exception:
         return self._exception
 
+    def tracebackText(self) -> str:
+        """The traceback active at construction as formatted text.
+
+            Empty if the Failure was not created while handling an
+            exception. Survives pickling, the traceback object does not.
+        """
+        if self.exception_traceback is not None:
+            return "".join(traceback.format_exception(self.exception_type, self.exception_object, self.exception_traceback))
+        return self.__dict__.get("exception_traceback_text", "")
+
+    def __getstate__(self):
+        """Traceback objects cannot be pickled; keeps them as text."""
+        state = self.__dict__.copy()
+        state["exception_traceback_text"] = self.tracebackText()
+        state["exception_traceback"] = None
+        return state
+
     @overrides(Result)
     def isEmpty(self) -> bool:
         return False
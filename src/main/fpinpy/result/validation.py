@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Validation: an applicative that accumulates errors instead of stopping at the first.
+
+    Errors are kept in a bounded summary (Errors): a total count, a
+    counter per error type and at most cap sampled records. A sampled
+    record holds the element position, the error type name and the
+    message, never the exception object, so no traceback is retained.
+    Memory stays O(cap + distinct error types) however many elements
+    fail.
+
+    Usage:
+
+    validated = Validation.traverse(rows, parseRow, cap=20)
+    if validated.isInvalid():
+        errors = validated.errors()
+        log(errors.count(), errors.counts(), errors.samples())
+"""
+import abc
+import random
+from typing import TypeVar, Generic, Any, Callable, Dict, NamedTuple, Optional, Tuple
+from fpinpy.meta.decorators import overrides
+from fpinpy.result.result_using_subclass_distinguisher import Result
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+
+DEFAULT_CAP = 100
+SAMPLINGS = ("first", "reservoir")
+
+class ErrorSample(NamedTuple):
+    """One retained error. position is the element position in traverse, None otherwise."""
+    position: Optional[int]
+    type: str
+    message: str
+
+    @staticmethod
+    def of(error, position: Optional[int]=None):# -> ErrorSample
+        if isinstance(error, BaseException):
+            return ErrorSample(position, type(error).__qualname__, str(error))
+        return ErrorSample(position, "RuntimeError", str(error)) # as Result.failure(str)
+
+class Errors:
+    """Bounded summary of the errors of an Invalid.
+
+        count() is exact, as are the per-type counters; samples() keeps
+        at most cap records. sampling="first" keeps the first cap
+        errors in order. sampling="reservoir" keeps a uniform random
+        sample of all errors (algorithm R), reproducible with seed.
+
+        Instances are immutable; merge returns a new summary.
+    """
+    __slots__ = ('_cap', '_sampling', '_random', '_count', '_counts', '_samples')
+
+    def __init__(self, cap: int=DEFAULT_CAP, sampling: str="first", seed: Optional[int]=None):
+        if cap < 0:
+            raise ValueError(f"cap must not be negative but was {cap}")
+        if sampling not in SAMPLINGS:
+            raise ValueError(f"sampling must be one of {SAMPLINGS} but was {sampling!r}")
+        self._cap = cap
+        self._sampling = sampling
+        self._random = random.Random(seed) if sampling == "reservoir" else None
+        self._count = 0
+        self._counts: Dict[str, int] = {}
+        self._samples: list = []
+
+    @staticmethod
+    def of(*errors, cap: int=DEFAULT_CAP, sampling: str="first", seed: Optional[int]=None):# -> Errors
+        summary = Errors(cap, sampling, seed)
+        for error in errors:
+            summary._add(ErrorSample.of(error))
+        return summary
+
+    def _add(self, sample: ErrorSample) -> None:
+        """ Records one error. Only for summaries not yet handed out. """
+        self._count += 1
+        self._counts[sample.type] = self._counts.get(sample.type, 0) + 1
+        if len(self._samples) < self._cap:
+            self._samples.append(sample)
+        elif self._random is not None:
+            slot = self._random.randrange(self._count)
+            if slot < self._cap:
+                self._samples[slot] = sample
+
+    def _absorb(self, other, position: Optional[int]) -> None:
+        """ Records all errors of other as errors at position. Counts stay exact. """
+        unsampled = dict(other._counts)
+        for sample in other._samples:
+            self._add(sample._replace(position=position))
+            unsampled[sample.type] -= 1
+        for name, count in unsampled.items():
+            if count:
+                self._count += count
+                self._counts[name] = self._counts.get(name, 0) + count
+
+    def _copy(self):# -> Errors
+        other = Errors(self._cap, self._sampling)
+        if self._random is not None:
+            other._random.setstate(self._random.getstate())
+        other._count = self._count
+        other._counts = dict(self._counts)
+        other._samples = list(self._samples)
+        return other
+
+    def merge(self, other):# -> Errors
+        """ Errors of self followed by those of other, with the settings of self.
+
+            With reservoir sampling the merged sample is drawn from
+            both samples in proportion to their counts, so it stays
+            uniform over all errors.
+        """
+        merged = self._copy()
+        merged._count += other._count
+        for name, count in other._counts.items():
+            merged._counts[name] = merged._counts.get(name, 0) + count
+        if merged._random is None:
+            merged._samples.extend(other._samples[:max(self._cap - len(self._samples), 0)])
+            return merged
+        left, right = list(self._samples), list(other._samples)
+        leftCount, rightCount = self._count, other._count
+        samples = []
+        while len(samples) < self._cap and (left or right):
+            fromLeft = bool(left) and (not right or merged._random.randrange(leftCount + rightCount) < leftCount)
+            source = left if fromLeft else right
+            samples.append(source.pop(merged._random.randrange(len(source))))
+            if fromLeft:
+                leftCount -= 1
+            else:
+                rightCount -= 1
+        merged._samples = samples
+        return merged
+
+    def count(self) -> int:
+        return self._count
+
+    def counts(self) -> Dict[str, int]:
+        """ Number of errors per type name, most frequent first. """
+        return dict(sorted(self._counts.items(), key=lambda item: -item[1]))
+
+    def samples(self) -> Tuple[ErrorSample, ...]:
+        return tuple(self._samples)
+
+    def cap(self) -> int:
+        return self._cap
+
+    def isTruncated(self) -> bool:
+        """ True if some errors are only counted, not sampled. """
+        return self._count > len(self._samples)
+
+    def __eq__(self, other):
+        if isinstance(other, Errors):
+            return (self._count, self._counts, self._samples) == (other._count, other._counts, other._samples)
+        return False
+
+    def __str__(self):
+        counts = ", ".join(f"{name}={count}" for name, count in self.counts().items())
+        return f"Errors({self._count}: {counts}; {len(self._samples)} sampled)"
+
+    def __repr__(self):
+        return str(self)
+
+class ValidationError(RuntimeError):
+    """Failure value of Validation.toResult(); errors holds the summary."""
+    def __init__(self, errors: Errors):
+        super().__init__(str(errors))
+        self.errors = errors
+
+class Validation(abc.ABC, Generic[T]):
+    """Applicative with two modes, Valid and Invalid.
+
+        map2, ap, traverse and sequence accumulate the errors of every
+        Invalid into one bounded Errors summary. flatMap is monadic and
+        stops at the first Invalid, like Result.flatMap.
+
+        Each mode is enforced by use of factory functions.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def valid(value: T):# -> Valid[T]
+        return Valid(value)
+
+    @staticmethod
+    def invalid(*errors, cap: int=DEFAULT_CAP, sampling: str="first", seed: Optional[int]=None):# -> Invalid[T]
+        """ Invalid from exceptions or messages, or from a single Errors summary. """
+        if len(errors) == 1 and isinstance(errors[0], Errors):
+            return Invalid(errors[0])
+        if not errors:
+            raise ValueError("Validation.invalid needs at least one error")
+        return Invalid(Errors.of(*errors, cap=cap, sampling=sampling, seed=seed))
+
+    @staticmethod
+    def fromResult(result, emptyIsFailure: bool=True):# Result[T] -> Validation[T]
+        """ Success is Valid and Failure is Invalid. Empty is Invalid
+            when emptyIsFailure, else Valid(None).
+        """
+        if result.isSuccess():
+            return Valid(result.successValue())
+        if result.isFailure():
+            return Validation.invalid(result.failureValue())
+        if emptyIsFailure:
+            return Validation.invalid(RuntimeError("Empty was considered Failure."))
+        return Valid(None)
+
+    @staticmethod
+    def traverse(iterable, function, cap: int=DEFAULT_CAP, sampling: str="first", seed: Optional[int]=None,
+                 emptyIsFailure: bool=True): # Iterable[T], Callable[[T], Result[U] | Validation[U]] -> Validation[SinglyLinkedList[U]]
+        """ Applies function to every element and accumulates all errors.
+
+            function returns a Result or a Validation; an exception it
+            raises counts as an error, as in Result.flatMap. Elements
+            are pulled one at a time. After the first error the valid
+            values are dropped, so memory is O(cap + distinct error
+            types) from then on, whatever the input size.
+
+            Output:
+            Valid[SinglyLinkedList[U]] or Invalid whose samples carry the
+            element position.
+        """
+        from fpinpy.collections.singly_linked_list import ListBuilder # singly_linked_list imports fpinpy.result
+        errors = Errors(cap, sampling, seed)
+        builder: Optional[ListBuilder[Any]] = ListBuilder()
+        for index, elem in enumerate(iterable):
+            try:
+                result = function(elem)
+            except Exception as e:
+                errors._add(ErrorSample.of(e, index))
+                builder = None
+                continue
+            if isinstance(result, Validation):
+                if result.isValid():
+                    if builder is not None:
+                        builder.append(result.validValue())
+                    continue
+                errors._absorb(result.errors(), index)
+                builder = None
+                continue
+            if result.isSuccess():
+                if builder is not None:
+                    builder.append(result.successValue())
+                continue
+            if result.isFailure():
+                errors._add(ErrorSample.of(result.failureValue(), index))
+            elif emptyIsFailure:
+                errors._add(ErrorSample(index, "Empty", "Empty was considered Failure."))
+            else:
+                continue
+            builder = None
+        if errors._count or builder is None:
+            return Invalid(errors)
+        return Valid(builder.freeze())
+
+    @staticmethod
+    def sequence(iterable, cap: int=DEFAULT_CAP, sampling: str="first", seed: Optional[int]=None,
+                 emptyIsFailure: bool=True): # Iterable[Result[T] | Validation[T]] -> Validation[SinglyLinkedList[T]]
+        """ Converts a collection of Result or Validation into one Validation. See traverse. """
+        return Validation.traverse(iterable, lambda x: x, cap, sampling, seed, emptyIsFailure)
+
+    @staticmethod
+    def lift2(func): # -> Validation[A] -> Validation[B] -> Validation[C]
+        return lambda validation1: lambda validation2: validation2.ap(validation1.map(func))
+
+    @staticmethod
+    def map2(validation1, validation2, func): # (Validation[A], Validation[B], func: A -> B -> C) -> Validation[C]
+        """ Like Result.map2, but errors of both sides are kept. """
+        return Validation.lift2(func)(validation1)(validation2)
+
+    @abc.abstractmethod
+    def isValid(self) -> bool:
+        raise NotImplementedError
+
+    def isInvalid(self) -> bool:
+        return not self.isValid()
+
+    @abc.abstractmethod
+    def validValue(self) -> T:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def errors(self) -> Errors:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def map(self, function: Callable[[T], U]):# -> Validation[U]
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def ap(self, functionValidation):# (Validation[T], Validation[T -> U]) -> Validation[U]
+        """ Applies the wrapped function, accumulating the errors of both. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def flatMap(self, function):# (function: T -> Validation[U]) -> Validation[U]
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def getOrElse(self, default_value):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def toResult(self):# -> Result[T]
+        """ Success, or Failure holding a ValidationError with the summary. """
+        raise NotImplementedError
+
+class Valid(Validation[T]):
+    """Represents a Validation that holds a value."""
+    __slots__ = ('_value',)
+
+    def __init__(self, value: T):
+        self._value = value
+
+    @overrides(Validation)
+    def isValid(self) -> bool:
+        return True
+
+    @overrides(Validation)
+    def validValue(self) -> T:
+        return self._value
+
+    @overrides(Validation)
+    def errors(self) -> Errors:
+        raise RuntimeError(f"Method errors() called on a {self.__class__} instance.")
+
+    @overrides(Validation)
+    def map(self, function: Callable[[T], U]):# -> Validation[U]
+        try:
+            return Valid(function(self._value))
+        except Exception as e:
+            return Validation.invalid(e)
+
+    @overrides(Validation)
+    def ap(self, functionValidation):# -> Validation[U]
+        if functionValidation.isValid():
+            return self.map(functionValidation.validValue())
+        return functionValidation
+
+    @overrides(Validation)
+    def flatMap(self, function):# -> Validation[U]
+        try:
+            return function(self._value)
+        except Exception as e:
+            return Validation.invalid(e)
+
+    @overrides(Validation)
+    def getOrElse(self, default_value):
+        return self._value
+
+    @overrides(Validation)
+    def toResult(self):# -> Result[T]
+        return Result.success(self._value)
+
+    def __eq__(self, other):
+        if isinstance(other, Valid):
+            return self._value == other._value
+        return False
+
+    def __str__(self):
+        return f"Valid({self._value})"
+
+    def __repr__(self):
+        return f"Valid({self._value!r})"
+
+class Invalid(Validation[T]):
+    """Represents a Validation that failed; holds an Errors summary."""
+    __slots__ = ('_errors',)
+
+    def __init__(self, errors: Errors):
+        self._errors = errors
+
+    @overrides(Validation)
+    def isValid(self) -> bool:
+        return False
+
+    @overrides(Validation)
+    def validValue(self) -> T:
+        raise RuntimeError(f"Method validValue() called on a {self.__class__} instance.")
+
+    @overrides(Validation)
+    def errors(self) -> Errors:
+        return self._errors
+
+    @overrides(Validation)
+    def map(self, function: Callable[[T], U]):# -> Validation[U]
+        return self
+
+    @overrides(Validation)
+    def ap(self, functionValidation):# -> Validation[U]
+        if functionValidation.isValid():
+            return self
+        return Invalid(functionValidation.errors().merge(self._errors))
+
+    @overrides(Validation)
+    def flatMap(self, function):# -> Validation[U]
+        return self
+
+    @overrides(Validation)
+    def getOrElse(self, default_value):
+        return default_value() if callable(default_value) else default_value
+
+    @overrides(Validation)
+    def toResult(self):# -> Result[T]
+        return Result.failure(ValidationError(self._errors))
+
+    def __eq__(self, other):
+        if isinstance(other, Invalid):
+            return self._errors == other._errors
+        return False
+
+    def __str__(self):
+        return f"Invalid({self._errors})"
+
+    def __repr__(self):
+        return str(self)
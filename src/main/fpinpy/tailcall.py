@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Trampolined tail calls: recursion in constant stack space.
+
+    A recursive function returns a TailCall describing the next step
+    instead of making the call: TailCall.done(value) ends the
+    recursion, TailCall.suspend(lambda: f(...)) defers the recursive
+    call. run() drives the steps in a loop.
+
+    def foldLeft(acc, aList, function):# -> TailCall
+        if aList.isEmpty():
+            return TailCall.done(acc)
+        return TailCall.suspend(lambda: foldLeft(function(acc)(aList.head()), aList.tail(), function))
+
+    foldLeft(0, SinglyLinkedList.fromIterable(range(10**6)), add).run() # no RecursionError
+
+    With @trampoline, callers get the value directly. A step that
+    the loop should continue with is built by f.tailCall(...), which
+    suspends the call instead of making it; a plain call f(...) always
+    returns the value, so it is safe in non-tail position too:
+
+    @trampoline
+    def foldLeft(acc, aList, function):
+        if aList.isEmpty():
+            return TailCall.done(acc)
+        return foldLeft.tailCall(function(acc)(aList.head()), aList.tail(), function)
+
+    Steps compose with map and flatMap; run() keeps pending
+    continuations on a heap list, so non-tail recursion written with
+    flatMap is stack safe too:
+
+    @trampoline
+    def size(tree):
+        if tree is None:
+            return TailCall.done(0)
+        return size.tailCall(tree.left).flatMap(lambda l: size.tailCall(tree.right).map(lambda r: l + r + 1))
+"""
+import abc
+from functools import wraps
+from fpinpy.result import Result
+from typing import TypeVar, Generic, Any, Callable, List, Protocol, cast
+# Declare module-scoped type variables for generics
+T = TypeVar('T')
+U = TypeVar('U')
+T_co = TypeVar('T_co', covariant=True)
+
+class TailCall(abc.ABC, Generic[T]):
+    """One step of a trampolined computation. Prefer the factories over direct construction."""
+    __slots__ = ()
+
+    @staticmethod
+    def done(value: T):# -> Done[T]
+        return Done(value)
+
+    @staticmethod
+    def suspend(thunk: Callable[[], "TailCall[T]"]):# -> Suspend[T]
+        return Suspend(thunk)
+
+    def run(self) -> T:
+        """ Evaluates the steps iteratively and returns the final value. """
+        current: TailCall[Any] = self
+        continuations: List[Callable[[Any], TailCall[Any]]] = []
+        done, suspend, flatMap = Done, Suspend, _FlatMap
+        while True:
+            if isinstance(current, suspend):
+                current = current._thunk()
+            elif isinstance(current, done):
+                if not continuations:
+                    return current._value
+                current = continuations.pop()(current._value)
+            elif isinstance(current, flatMap):
+                continuations.append(current._function)
+                current = current._source
+            else:
+                raise TypeError(f"Trampolined steps must return a TailCall, got {type(current).__name__}")
+
+    def flatMap(self, function: Callable[[T], "TailCall[U]"]):# -> TailCall[U]
+        """ Continues with function(value). Not evaluated until run(). """
+        return _FlatMap(self, function)
+
+    def map(self, function: Callable[[T], U]):# -> TailCall[U]
+        return _FlatMap(self, lambda value: Done(function(value)))
+
+    def flatMapResult(self, function: Callable[[T], "TailCall[Result[U]]"]):# TailCall[Result[T]] -> TailCall[Result[U]]
+        """ Result.flatMap inside a trampoline.
+
+            For a TailCall holding a Result: continues with
+            function(value) on Success and passes Failure or Empty
+            through. An exception from function becomes a Failure,
+            as with Result.flatMap.
+        """
+        def step(result):
+            if not result.isSuccess():
+                return Done(result)
+            try:
+                return function(result.successValue())
+            except Exception as e:
+                return Done(Result.failure(e))
+        return _FlatMap(self, step)
+
+    @abc.abstractmethod
+    def isSuspended(self) -> bool:
+        raise NotImplementedError
+
+class Done(TailCall[T]):
+    """Final step holding the value."""
+    __slots__ = ('_value',)
+
+    def __init__(self, value: T):
+        self._value = value
+
+    def isSuspended(self) -> bool:
+        return False
+
+    def __repr__(self):
+        return f"Done({self._value!r})"
+
+class Suspend(TailCall[T]):
+    """Deferred step: calling the thunk yields the next TailCall."""
+    __slots__ = ('_thunk',)
+
+    def __init__(self, thunk: Callable[[], TailCall[T]]):
+        self._thunk = thunk
+
+    def isSuspended(self) -> bool:
+        return True
+
+    def __repr__(self):
+        return "Suspend(...)"
+
+class _FlatMap(TailCall[U]):
+    __slots__ = ('_source', '_function')
+
+    def __init__(self, source: TailCall, function: Callable):
+        self._source = source
+        self._function = function
+
+    def isSuspended(self) -> bool:
+        return True
+
+    def __repr__(self):
+        return "FlatMap(...)"
+
+def _step(function: Callable[..., TailCall[T]], args: tuple, kwargs: dict) -> TailCall[T]:
+    step = function(*args, **kwargs)
+    if not isinstance(step, TailCall):
+        raise TypeError(f"{function.__qualname__} must return a TailCall, got {type(step).__name__}")
+    return step
+
+class Trampolined(Protocol[T_co]):
+    """What @trampoline returns: call it for the value, or tailCall for a step."""
+    def __call__(self, *args: Any, **kwargs: Any) -> T_co: ...
+    def tailCall(self, *args: Any, **kwargs: Any) -> TailCall[Any]: ...
+
+def trampoline(function: Callable[..., TailCall[T]]) -> Trampolined[T]:
+    """ Decorates a function returning TailCall so that callers get the value.
+
+        Every call of the decorated function runs its own loop and
+        returns the result, wherever it is made from, so it can be used
+        in non-tail position (1 + f(n - 1)) or from a map or foldLeft
+        callback. Tail calls that should share the caller's loop are
+        written as f.tailCall(...), which returns a suspended step
+        without evaluating the body.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        return _step(function, args, kwargs).run()
+    setattr(wrapper, "tailCall", lambda *args, **kwargs: Suspend(lambda: _step(function, args, kwargs)))
+    return cast(Trampolined[T], wrapper)
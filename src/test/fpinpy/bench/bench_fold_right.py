@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""foldRight over a list snapshot against reverse-and-walk.
+
+    legacy reverses the list into new nodes and walks them through
+    head()/tail(), as foldRight did before. current walks a temporary
+    Python list of the elements backwards. The peak columns are the
+    memory allocated by one call, measured with tracemalloc.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_fold_right.py [max_exponent]
+"""
+import sys
+import time
+import tracemalloc
+
+from fpinpy import SinglyLinkedList
+
+def legacy_fold_right(aList, identity, function):
+    accumulator = identity
+    tmp_list = aList.reverse()
+    while not tmp_list.isEmpty():
+        accumulator = function(tmp_list.head())(accumulator)
+        tmp_list = tmp_list.tail()
+    return accumulator
+
+def add(x):
+    return lambda accumulator: accumulator + x
+
+def elapsed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def peak(function) -> int:
+    tracemalloc.start()
+    function()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+def main(max_exponent: int=6):
+    print(f"{'n':>10}{'legacy (s)':>12}{'current (s)':>13}{'legacy peak':>13}{'current peak':>14}")
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        aList = SinglyLinkedList.fromIterable(range(size))
+        legacy = lambda: legacy_fold_right(aList, 0, add)
+        current = lambda: aList.foldRight(0, add)
+        print(f"{size:>10}{elapsed(legacy):>12.4f}{elapsed(current):>13.4f}{peak(legacy):>13}{peak(current):>14}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Scaling of filter, flatMap, flatten and concat.
+
+    Each combinator is timed at 10^3 to 10^6 elements against its
+    previous foldRight-based definition. Linear implementations keep a
+    roughly constant time per element as the size grows.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_linear_combinators.py [max_exponent]
+"""
+import sys
+import time
+
+from fpinpy import SinglyLinkedList
+
+def legacy_concat(list1, list2):
+    return SinglyLinkedList.foldRightStatic(list1, list2, lambda x: lambda y: SinglyLinkedList.cons(x, y))
+
+def legacy_filter(aList, predicate):
+    return aList.foldRight(SinglyLinkedList.list(), lambda h: lambda t: SinglyLinkedList.cons(h, t) if predicate(h) else t)
+
+def legacy_flatMap(aList, func):
+    return aList.foldRight(SinglyLinkedList.list(), lambda h: lambda t: legacy_concat(func(h), t))
+
+def is_even(x):
+    return x % 2 == 0
+
+def pair(x):
+    return SinglyLinkedList.list(x, -x)
+
+CASES = {
+    "filter": (
+        lambda aList: legacy_filter(aList, is_even),
+        lambda aList: aList.filter(is_even)),
+    "flatMap": (
+        lambda aList: legacy_flatMap(aList, pair),
+        lambda aList: aList.flatMap(pair)),
+    "flatten": (
+        lambda aList: legacy_flatMap(aList.map(pair), lambda x: x),
+        lambda aList: SinglyLinkedList.flatten(aList.map(pair))),
+    "concat": (
+        lambda aList: legacy_concat(aList, aList),
+        lambda aList: SinglyLinkedList.concat(aList, aList)),
+}
+
+def elapsed(function, argument) -> float:
+    start = time.perf_counter()
+    function(argument)
+    return time.perf_counter() - start
+
+def main(max_exponent: int=6):
+    print(f"{'case':<10}{'n':>10}{'legacy (s)':>12}{'linear (s)':>12}{'ns/elem':>10}")
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        aList = SinglyLinkedList.list(*range(size))
+        for name, (legacy, linear) in CASES.items():
+            legacy_seconds = elapsed(legacy, aList)
+            linear_seconds = elapsed(linear, aList)
+            print(f"{name:<10}{size:>10}{legacy_seconds:>12.4f}{linear_seconds:>12.4f}{linear_seconds / size * 1e9:>10.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Memory and throughput of the slotted Cons layout.
+
+    Compares the current Cons/Nil nodes against the previous layout,
+    which carried a per-instance __dict__, asserted on the tail type and
+    called tail.length() on every construction.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_node_layout.py [size]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from fpinpy import SinglyLinkedList
+
+class LegacyNil:
+    def length(self):
+        return 0
+
+    def isEmpty(self):
+        return True
+
+class LegacyCons:
+    def __init__(self, head, tail):
+        self._head = head
+        assert isinstance(tail, LegacyCons) or isinstance(tail, LegacyNil), f"Type was {type(tail)} but should have been Cons or Nil"
+        self._tail = tail
+        self._length = tail.length() + 1
+
+    def length(self):
+        return self._length
+
+    def isEmpty(self):
+        return False
+
+def legacy_list(*args):
+    output = LegacyNil()
+    for i in range(len(args)-1, -1, -1):
+        output = LegacyCons(args[i], output)
+    return output
+
+def current_list(*args):
+    return SinglyLinkedList.list(*args)
+
+def measure_memory(factory, values) -> int:
+    """Bytes still allocated after building a list from values."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    aList = factory(*values)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del aList
+    return after - before
+
+def measure_time(factory, values, repeat: int=5) -> float:
+    """Best wall time in seconds of building a list from values."""
+    return min(timeit.repeat(lambda: factory(*values), number=1, repeat=repeat))
+
+def main(size: int=1_000_000):
+    values = tuple(range(size))
+    print(f"{'layout':<10}{'bytes/node':>12}{'build (s)':>12}{'nodes/s':>14}")
+    for name, factory in (("legacy", legacy_list), ("slotted", current_list)):
+        memory = measure_memory(factory, values)
+        seconds = measure_time(factory, values)
+        print(f"{name:<10}{memory / size:>12.1f}{seconds:>12.4f}{size / seconds:>14.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
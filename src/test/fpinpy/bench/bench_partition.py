@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Single-pass partition and groupBy against the filter-twice baseline.
+
+    partition is timed against two filter calls, both with the
+    current filter and with the previous foldRight-based one.
+    groupBy is timed against one filter per distinct key.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_partition.py [max_exponent]
+"""
+import sys
+import time
+
+from fpinpy import SinglyLinkedList
+
+def legacy_filter(aList, predicate):
+    return aList.foldRight(SinglyLinkedList.list(), lambda h: lambda t: SinglyLinkedList.cons(h, t) if predicate(h) else t)
+
+def is_even(x):
+    return x % 2 == 0
+
+def is_odd(x):
+    return x % 2 == 1
+
+def residue(x):
+    return x % 4
+
+CASES = {
+    "partition": (
+        lambda aList: (legacy_filter(aList, is_even), legacy_filter(aList, is_odd)),
+        lambda aList: (aList.filter(is_even), aList.filter(is_odd)),
+        lambda aList: aList.partition(is_even)),
+    "groupBy": (
+        lambda aList: {k: legacy_filter(aList, lambda x: residue(x) == k) for k in range(4)},
+        lambda aList: {k: aList.filter(lambda x: residue(x) == k) for k in range(4)},
+        lambda aList: aList.groupBy(residue)),
+}
+
+def elapsed(function, argument) -> float:
+    start = time.perf_counter()
+    function(argument)
+    return time.perf_counter() - start
+
+def main(max_exponent: int=6):
+    print(f"{'case':<11}{'n':>10}{'legacy (s)':>12}{'filter (s)':>12}{'1-pass (s)':>12}")
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        aList = SinglyLinkedList.fromIterable(range(size))
+        for name, (legacy, filtered, single) in CASES.items():
+            print(f"{name:<11}{size:>10}{elapsed(legacy, aList):>12.4f}{elapsed(filtered, aList):>12.4f}{elapsed(single, aList):>12.4f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Trampolined recursion against the iterative loops it replaces.
+
+    Each case computes the same value three ways: a while loop, plain
+    recursion (only below the interpreter's recursion limit) and a
+    @trampoline function. The trampoline pays one thunk and one step
+    object per call; the columns show that overhead per element.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_tailcall.py [max_exponent]
+"""
+import sys
+import time
+
+from fpinpy import SinglyLinkedList, Result, TailCall, trampoline
+
+def loop_sum(aList):
+    accumulator = 0
+    while not aList.isEmpty():
+        accumulator += aList.head()
+        aList = aList.tail()
+    return accumulator
+
+def recursive_sum(aList, accumulator=0):
+    if aList.isEmpty():
+        return accumulator
+    return recursive_sum(aList.tail(), accumulator + aList.head())
+
+@trampoline
+def trampolined_sum(aList, accumulator=0):
+    if aList.isEmpty():
+        return TailCall.done(accumulator)
+    return trampolined_sum.tailCall(aList.tail(), accumulator + aList.head())
+
+def loop_chain(n):
+    result = Result.success(0)
+    for _ in range(n):
+        result = result.flatMap(lambda x: Result.success(x + 1))
+    return result
+
+def recursive_chain(n):
+    if n == 0:
+        return Result.success(0)
+    return recursive_chain(n - 1).flatMap(lambda x: Result.success(x + 1))
+
+@trampoline
+def trampolined_chain(n):
+    if n == 0:
+        return TailCall.done(Result.success(0))
+    return trampolined_chain.tailCall(n - 1).flatMapResult(lambda x: TailCall.done(Result.success(x + 1)))
+
+CASES = {
+    "sum": (lambda n: SinglyLinkedList.fromIterable(range(n)), loop_sum, recursive_sum, trampolined_sum),
+    "flatMap": (lambda n: n, loop_chain, recursive_chain, trampolined_chain),
+}
+
+def elapsed(function, argument) -> float:
+    start = time.perf_counter()
+    function(argument)
+    return time.perf_counter() - start
+
+def main(max_exponent: int=6):
+    limit = sys.getrecursionlimit()
+    print(f"{'case':<9}{'n':>10}{'loop (s)':>12}{'recursive (s)':>15}{'trampoline (s)':>16}")
+    for exponent in range(2, max_exponent + 1):
+        size = 10 ** exponent
+        for name, (prepare, loop, recursive, trampolined) in CASES.items():
+            argument = prepare(size)
+            recursion = f"{elapsed(recursive, argument):>15.4f}" if size < limit // 2 else f"{'-':>15}"
+            print(f"{name:<9}{size:>10}{elapsed(loop, argument):>12.4f}{recursion}{elapsed(trampolined, argument):>16.4f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
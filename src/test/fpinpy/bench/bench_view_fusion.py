@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Eager combinator chains versus fused ListView pipelines.
+
+    Runs lst.map(f).filter(p).map(g).foldLeft(...) eagerly and through
+    lst.view(). Reports the intermediate list nodes each variant
+    allocates, the peak traced memory and the wall time.
+
+    Usage (from src/main):
+
+    PYTHONPATH=. python ../test/fpinpy/bench/bench_view_fusion.py [size]
+"""
+import sys
+import time
+import tracemalloc
+
+from fpinpy import SinglyLinkedList
+
+def f(x):
+    return x * 3
+
+def p(x):
+    return x % 2 == 0
+
+def g(x):
+    return x + 1
+
+def add(acc):
+    return lambda x: acc + x
+
+def eager(aList):
+    """Returns the result and the number of intermediate nodes built."""
+    step1 = aList.map(f)
+    step2 = step1.filter(p)
+    step3 = step2.map(g)
+    return step3.foldLeft(0, add), step1.length() + step2.length() + step3.length()
+
+def fused(aList):
+    return aList.view().map(f).filter(p).map(g).foldLeft(0, add), 0
+
+def measure(function, aList):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result, nodes = function(aList)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, nodes, peak, seconds
+
+def main(size: int=1_000_000):
+    aList = SinglyLinkedList.list(*range(size))
+    print(f"{'variant':<8}{'nodes':>12}{'peak (MiB)':>12}{'time (s)':>10}")
+    results = set()
+    for name, function in (("eager", eager), ("view", fused)):
+        result, nodes, peak, seconds = measure(function, aList)
+        results.add(result)
+        print(f"{name:<8}{nodes:>12}{peak / 2**20:>12.1f}{seconds:>10.3f}")
+    assert len(results) == 1, "variants disagree"
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
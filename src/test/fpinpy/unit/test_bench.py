@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import pytest
+from hamcrest import *
+
+from fpinpy import bench
+from fpinpy.bench import cases
+from fpinpy.bench.__main__ import main
+
+class Test_select:
+    def test_pattern_and_size(self):
+        selected = bench.select(["SinglyLinkedList.map*"], maxSize=10_000)
+        assert_that([case.id for case in selected], equal_to(["SinglyLinkedList.map[1000]", "SinglyLinkedList.map[10000]"]))
+    def test_covers_result_implementations_and_reader(self):
+        ids = [case.id for case in bench.select()]
+        assert_that(ids, has_items("Result[subclass].map[100]", "Result[bool].flatMap[100]",
+                                   "SinglyLinkedList.traverse[1000]", "IniConfigReader.getSection[10]"))
+
+class Test_run:
+    def test_every_standard_case_runs(self):
+        for case in bench.select(maxSize=100):
+            case.setup(case.size)()
+    def test_measure(self):
+        results = bench.run([bench.Benchmark("noop", None, lambda size: lambda: None)], repeat=2)
+        assert_that(results["noop"]["min"], greater_than(0))
+        assert_that(results["noop"]["median"], greater_than_or_equal_to(results["noop"]["min"]))
+
+class Test_compare:
+    def test_regression_beyond_threshold(self):
+        baseline = {"a": {"min": 1.0}, "b": {"min": 1.0}, "gone": {"min": 1.0}}
+        results = {"a": {"min": 1.2}, "b": {"min": 1.3}, "new": {"min": 9.0}}
+        regressions = bench.compare(results, baseline, threshold=0.25)
+        assert_that(regressions, equal_to([bench.Regression("b", 1.0, 1.3)]))
+        assert_that(regressions[0].ratio, close_to(1.3, 1e-9))
+
+class Test_main:
+    def test_missing_baseline_fails(self, tmp_path, capsys):
+        missing = str(tmp_path / "baseline.json")
+        assert_that(main(["IniConfigReader.getProperty[10]", "--repeat", "1", "--baseline", missing]), equal_to(2))
+        assert_that(capsys.readouterr().err, contains_string("No baseline at"))
+    def test_baseline_round_trip(self, tmp_path, capsys):
+        baseline = str(tmp_path / "baseline.json")
+        assert_that(main(["IniConfigReader.getProperty[10]", "--repeat", "1", "--output", baseline]), equal_to(0))
+        assert_that(bench.load(baseline), has_key("IniConfigReader.getProperty[10]"))
+        assert_that(main(["IniConfigReader.getProperty[10]", "--repeat", "1", "--baseline", baseline, "--threshold", "-1"]), equal_to(1))
+        assert_that(capsys.readouterr().err, contains_string("REGRESSION IniConfigReader.getProperty[10]"))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import array
+import pickle
+import pytest
+from hamcrest import *
+
+from fpinpy import ChunkedList, SinglyLinkedList
+
+class Test_Initialization:
+    def test_fromIterable_chunks(self):
+        sut = ChunkedList.fromIterable(range(10), chunkSize=4)
+        assert_that(list(sut.chunks()), equal_to([(0, 1, 2, 3), (4, 5, 6, 7), (8, 9)]))
+        assert_that(sut.length(), equal_to(10))
+    def test_fromIterable_typecode(self):
+        sut = ChunkedList.fromIterable(range(3), typecode='q')
+        assert_that(next(sut.chunks()), instance_of(array.array))
+        assert_that(sut.toPyList(), equal_to([0, 1, 2]))
+    def test_empty(self):
+        sut = ChunkedList.list()
+        assert_that(sut.isEmpty(), equal_to(True))
+        assert_that(sut.head, raises(RuntimeError))
+        assert_that(str(sut), equal_to("[NIL]"))
+    def test_invalid_chunkSize(self):
+        assert_that(calling(ChunkedList.fromIterable).with_args([1], 0), raises(ValueError))
+
+class Test_head_tail:
+    def test_tail_shares_chunk(self):
+        sut = ChunkedList.fromIterable(range(5), chunkSize=4)
+        assert_that(sut.tail().head(), equal_to(1))
+        assert_that(sut.tail()._chunk, same_instance(sut._chunk))
+    def test_tail_crosses_chunk_boundary(self):
+        sut = ChunkedList.fromIterable(range(5), chunkSize=2).tail().tail()
+        assert_that(sut.head(), equal_to(2))
+        assert_that(sut.length(), equal_to(3))
+    def test_cons(self):
+        sut = ChunkedList.list(2, 3).cons(1)
+        assert_that(sut.toPyList(), equal_to([1, 2, 3]))
+
+class Test_drop:
+    def test_drop_within_and_across_chunks(self):
+        sut = ChunkedList.fromIterable(range(10), chunkSize=4)
+        assert_that(sut.drop(2).toPyList(), equal_to(list(range(2, 10))))
+        assert_that(sut.drop(6).toPyList(), equal_to([6, 7, 8, 9]))
+        assert_that(sut.drop(6).length(), equal_to(4))
+    def test_drop_too_many_yields_empty(self):
+        sut = ChunkedList.list(1, 2).drop(3)
+        assert_that(sut.isEmpty(), equal_to(True))
+
+class Test_bulk:
+    def test_map(self):
+        sut = ChunkedList.fromIterable(range(5), chunkSize=2).tail().map(lambda x: x * 2)
+        assert_that(sut.toPyList(), equal_to([2, 4, 6, 8]))
+    def test_filter(self):
+        sut = ChunkedList.fromIterable(range(10), chunkSize=3).filter(lambda x: x % 4 == 0)
+        assert_that(sut.toPyList(), equal_to([0, 4, 8]))
+    def test_foldLeft(self):
+        sut = ChunkedList.fromIterable(range(1, 5), chunkSize=3).foldLeft(0, lambda x: lambda y: x + y)
+        assert_that(sut, equal_to(10))
+    def test_iteration(self):
+        sut = [x for x in ChunkedList.fromIterable(range(5), chunkSize=2).drop(1)]
+        assert_that(sut, equal_to([1, 2, 3, 4]))
+
+class Test_conversion:
+    def test_round_trip(self):
+        aList = SinglyLinkedList.list(1, 2, 3)
+        sut = ChunkedList.fromList(aList).toList()
+        assert_that(str(sut), equal_to("[1, 2, 3, NIL]"))
+
+class Test_pickle:
+    def test_long_chain(self):
+        sut = ChunkedList.fromIterable(range(100000), chunkSize=4)
+        assert_that(pickle.loads(pickle.dumps(sut)).toPyList(), equal_to(list(range(100000))))
+    def test_empty_is_shared(self):
+        assert_that(pickle.loads(pickle.dumps(ChunkedList.empty())), same_instance(ChunkedList.empty()))
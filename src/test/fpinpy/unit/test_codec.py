@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import array
+import io
+import pytest
+from hamcrest import *
+
+from fpinpy import codec, Result, SinglyLinkedList, Nil
+
+class Test_roundTrip:
+    @pytest.mark.parametrize("value", [
+        None, True, False, 0, -1, 2**63 - 1, -2**63, 2**100, -2**70, 1.5, "", "é",
+        b"", b"\x00\xff", (), (1, "a"), [1, [2, []]], {"a": 1, 2: (3,)},
+    ])
+    def test_plain_values(self, value):
+        assert_that(codec.loads(codec.dumps(value)), equal_to(value))
+    def test_bool_stays_bool(self):
+        assert_that(codec.loads(codec.dumps([True, 1])), contains_exactly(same_instance(True), 1))
+    def test_mixed_list(self):
+        sut = SinglyLinkedList.list(1, "a", SinglyLinkedList.list(2.0, None))
+        assert_that(codec.loads(codec.dumps(sut)), equal_to(sut))
+    def test_nil(self):
+        assert_that(codec.loads(codec.dumps(SinglyLinkedList.nil())), same_instance(Nil()))
+    def test_memoryview_decodes_as_bytes(self):
+        assert_that(codec.loads(codec.dumps(memoryview(b"abc"))), equal_to(b"abc"))
+    def test_memoryview_input(self):
+        data = bytearray(b"junk" + codec.dumps([1, 2]))
+        assert_that(codec.loads(memoryview(data)[4:]), equal_to([1, 2]))
+    def test_deep_nesting(self):
+        value: list = []
+        for _ in range(100000):
+            value = [value]
+        depth = 0
+        decoded = codec.loads(codec.dumps(value))
+        while decoded:
+            decoded = decoded[0]
+            depth += 1
+        assert_that(depth, equal_to(100000))
+
+class Test_numericFastPath:
+    def test_int_list(self):
+        sut = SinglyLinkedList.fromIterable(range(1000))
+        data = codec.dumps(sut)
+        assert_that(data[len(codec.MAGIC):len(codec.MAGIC) + 2], equal_to(b"Aq"))
+        assert_that(codec.loads(data), equal_to(sut))
+    def test_float_list(self):
+        sut = SinglyLinkedList.list(1.5, -2.0)
+        assert_that(codec.dumps(sut)[len(codec.MAGIC):len(codec.MAGIC) + 2], equal_to(b"Ad"))
+        assert_that(codec.loads(codec.dumps(sut)), equal_to(sut))
+    def test_out_of_range_int_falls_back(self):
+        sut = SinglyLinkedList.list(1, 2**64)
+        assert_that(codec.loads(codec.dumps(sut)), equal_to(sut))
+    def test_array(self):
+        sut = array.array('h', [1, -2, 3])
+        decoded = codec.loads(codec.dumps(sut))
+        assert_that(decoded, instance_of(array.array))
+        assert_that(decoded, equal_to(sut))
+
+class Test_result:
+    def test_success(self):
+        sut = codec.loads(codec.dumps(Result.success(SinglyLinkedList.list(1))))
+        assert_that(sut, equal_to(Result.success(SinglyLinkedList.list(1))))
+    def test_empty(self):
+        assert_that(codec.loads(codec.dumps(Result.empty())).isEmpty(), equal_to(True))
+    def test_failure(self):
+        try:
+            raise KeyError("k")
+        except KeyError as e:
+            failure = Result.failure(e)
+        sut = codec.loads(codec.dumps(failure))
+        assert_that(sut.failureValue(), instance_of(KeyError))
+        assert_that(sut.failureValue().args, equal_to(("k",)))
+        assert_that(sut.tracebackText(), contains_string("KeyError: 'k'"))
+    def test_unknown_exception_class(self):
+        data = codec.dumps(Result.failure(ValueError("m"))).replace(b"ValueError", b"NoSuchErrr")
+        sut = codec.loads(data)
+        assert_that(sut.failureValue(), instance_of(RuntimeError))
+        assert_that(str(sut.failureValue()), contains_string("m"))
+
+class Test_frames:
+    def test_several_values(self):
+        stream = io.BytesIO()
+        codec.dump(SinglyLinkedList.list(1, 2), stream)
+        codec.dump("x", stream)
+        stream.seek(0)
+        assert_that(codec.load(stream), equal_to(SinglyLinkedList.list(1, 2)))
+        assert_that(codec.load(stream), equal_to("x"))
+        assert_that(calling(codec.load).with_args(stream), raises(EOFError))
+
+class Test_errors:
+    def test_unsupported_type(self):
+        assert_that(calling(codec.dumps).with_args(object()), raises(TypeError))
+    @pytest.mark.parametrize("data", [b"", b"nope", codec.dumps([1, 2])[:-3], codec.dumps(1) + b"N", codec.MAGIC + b"Z"])
+    def test_malformed(self, data):
+        assert_that(calling(codec.loads).with_args(data), raises(ValueError))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import pytest
+from hamcrest import *
+
+from fpinpy import PersistentHashMap, MapUtilities, Success, Failure
+
+class CollidingKey:
+    """Distinct keys sharing one hash value."""
+    def __init__(self, value):
+        self.value = value
+    def __hash__(self):
+        return 42
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+class Test_Initialization:
+    def test_empty(self):
+        sut = PersistentHashMap.empty()
+        assert_that(sut.length(), equal_to(0))
+        assert_that(sut.isEmpty(), equal_to(True))
+    def test_fromDict(self):
+        sut = PersistentHashMap.fromDict({'a': 1, 'b': 2})
+        assert_that(sut.toDict(), equal_to({'a': 1, 'b': 2}))
+    def test_fromIterable_later_keys_win(self):
+        sut = PersistentHashMap.fromIterable([('a', 1), ('a', 2)])
+        assert_that(sut.toDict(), equal_to({'a': 2}))
+
+class Test_assoc:
+    def test_assoc_preserves_original(self):
+        original = PersistentHashMap.fromIterable((i, i) for i in range(1000))
+        sut = original.assoc(1000, 'x').assoc(5, 'y')
+        assert_that(sut.length(), equal_to(1001))
+        assert_that(sut[5], equal_to('y'))
+        assert_that(original.length(), equal_to(1000))
+        assert_that(original[5], equal_to(5))
+        assert_that(1000 in original, equal_to(False))
+    def test_assoc_same_value_returns_self(self):
+        value = object()
+        original = PersistentHashMap.empty().assoc('a', value)
+        assert_that(original.assoc('a', value), same_instance(original))
+    def test_hash_collisions(self):
+        sut = PersistentHashMap.empty()
+        for i in range(10):
+            sut = sut.assoc(CollidingKey(i), i)
+        assert_that(sut.length(), equal_to(10))
+        assert_that([sut[CollidingKey(i)] for i in range(10)], equal_to(list(range(10))))
+        sut = sut.dissoc(CollidingKey(3)).assoc('other', -1)
+        assert_that(sut.length(), equal_to(10))
+        assert_that(CollidingKey(3) in sut, equal_to(False))
+
+class Test_dissoc:
+    def test_dissoc(self):
+        original = PersistentHashMap.fromIterable((i, i) for i in range(100))
+        sut = original
+        for i in range(0, 100, 2):
+            sut = sut.dissoc(i)
+        assert_that(sorted(sut), equal_to(list(range(1, 100, 2))))
+        assert_that(original.length(), equal_to(100))
+    def test_dissoc_missing_returns_self(self):
+        original = PersistentHashMap.fromDict({'a': 1})
+        assert_that(original.dissoc('b'), same_instance(original))
+    def test_dissoc_last_yields_empty(self):
+        sut = PersistentHashMap.fromDict({'a': 1}).dissoc('a')
+        assert_that(sut, same_instance(PersistentHashMap.empty()))
+
+class Test_lookup:
+    def test_getitem_missing_raises(self):
+        assert_that(calling(PersistentHashMap.empty().__getitem__).with_args('a'), raises(KeyError))
+    def test_get_default(self):
+        assert_that(PersistentHashMap.empty().get('a', 0), equal_to(0))
+    def test_getOrFailure(self):
+        sut = PersistentHashMap.fromDict({'a': 1})
+        assert_that(sut.getOrFailure('a'), equal_to(Success(1)))
+        assert_that(sut.getOrFailure('b'), instance_of(Failure))
+    def test_getOrFailure_message_names_only_the_key(self):
+        sut = PersistentHashMap.fromDict({i: i for i in range(100)})
+        message = str(sut.getOrFailure('missing').failureValue())
+        assert_that(message, contains_string("'missing'"))
+        assert_that(message, is_not(contains_string("99")))
+    def test_items_is_a_view(self):
+        sut = PersistentHashMap.fromDict({'a': 1, 'b': 2})
+        items = sut.items()
+        assert_that(len(items), equal_to(2))
+        assert_that(('a', 1) in items, equal_to(True))
+        assert_that(('a', 2) in items, equal_to(False))
+        assert_that(sorted(items), equal_to([('a', 1), ('b', 2)]))
+        assert_that(sorted(items), equal_to(sorted(items)))
+        assert_that(items == {('a', 1), ('b', 2)}, equal_to(True))
+    def test_getMapValue_accepts_map(self):
+        sut = MapUtilities.getMapValue('a', PersistentHashMap.fromDict({'a': 1}))
+        assert_that(sut, equal_to(Success(1)))
+    def test_equality_with_dict_contents(self):
+        assert_that(PersistentHashMap.fromDict({'a': 1}), equal_to(PersistentHashMap.fromDict({'a': 1})))
+
+class Test_transient:
+    def test_builder(self):
+        builder = PersistentHashMap.builder()
+        for i in range(5000):
+            builder.assoc(i, i)
+        sut = builder.dissoc(0).dissoc(0).persistent()
+        assert_that(sut.length(), equal_to(4999))
+        assert_that(sut[4999], equal_to(4999))
+    def test_transient_does_not_change_original(self):
+        original = PersistentHashMap.fromIterable((i, i) for i in range(100))
+        sut = original.transient().assoc(0, -1).dissoc(1).persistent()
+        assert_that(original.toDict(), equal_to({i: i for i in range(100)}))
+        assert_that(sut[0], equal_to(-1))
+        assert_that(1 in sut, equal_to(False))
+    def test_use_after_persistent_fails(self):
+        transient = PersistentHashMap.builder()
+        transient.persistent()
+        assert_that(calling(transient.assoc).with_args('a', 1), raises(RuntimeError))
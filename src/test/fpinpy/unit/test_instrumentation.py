@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import subprocess
+import sys
+import pytest
+from hamcrest import *
+
+from fpinpy import SinglyLinkedList, Result, instrumentation
+from fpinpy.collections import singly_linked_list
+
+class Test_disabled:
+    def test_no_wrappers_installed(self):
+        assert_that(instrumentation.isEnabled(), equal_to(False))
+        assert_that(singly_linked_list._object_new, same_instance(object.__new__))
+        assert_that(hasattr(SinglyLinkedList.__dict__["map"], "__wrapped__"), equal_to(False))
+    def test_nothing_counted(self):
+        instrumentation.reset()
+        SinglyLinkedList.list(1, 2).map(lambda x: x)
+        assert_that(instrumentation.snapshot()["allocations"], equal_to({}))
+    def test_unbalanced_disable(self):
+        assert_that(calling(instrumentation.disable), raises(RuntimeError))
+
+class Test_enabled:
+    def test_counts_node_allocations(self):
+        with instrumentation.enabled():
+            SinglyLinkedList.list(1, 2, 3).map(lambda x: x + 1)
+            SinglyLinkedList.cons(0, SinglyLinkedList.nil())
+        assert_that(instrumentation.snapshot()["allocations"]["Cons"], equal_to(7))
+    def test_counts_results_by_subtype(self):
+        with instrumentation.enabled():
+            Result.success(1).map(lambda x: x).flatMap(lambda x: Result.failure("no"))
+            Result.empty()
+        assert_that(instrumentation.snapshot()["results"], equal_to({"Success": 2, "Failure": 1, "Empty": 1}))
+    def test_counts_calls_and_time(self):
+        with instrumentation.enabled():
+            aList = SinglyLinkedList.list(1, 2)
+            aList.map(lambda x: x)
+            aList.map(lambda x: x)
+        calls = instrumentation.snapshot()["calls"]
+        assert_that(calls["SinglyLinkedList.map"]["calls"], equal_to(2))
+        assert_that(calls["SinglyLinkedList.map"]["seconds"], greater_than(0))
+    def test_wrappers_removed_afterwards(self):
+        with instrumentation.enabled():
+            assert_that(singly_linked_list._object_new, is_not(same_instance(object.__new__)))
+        assert_that(singly_linked_list._object_new, same_instance(object.__new__))
+        assert_that(SinglyLinkedList.list(1).map(lambda x: x), equal_to(SinglyLinkedList.list(1)))
+    def test_nesting(self):
+        with instrumentation.enabled():
+            with instrumentation.enabled(clear=False):
+                pass
+            assert_that(instrumentation.isEnabled(), equal_to(True))
+        assert_that(instrumentation.isEnabled(), equal_to(False))
+    def test_table(self):
+        with instrumentation.enabled():
+            SinglyLinkedList.list(1).reverse()
+        assert_that(instrumentation.table(), all_of(contains_string("Cons"), contains_string("SinglyLinkedList.reverse")))
+
+class Test_environment:
+    def test_reports_at_exit(self):
+        environment = dict(os.environ, FPINPY_INSTRUMENTATION="1")
+        completed = subprocess.run([sys.executable, "-c", "import fpinpy; fpinpy.SinglyLinkedList.list(1, 2).reverse()"],
+                                   env=environment, capture_output=True, text=True, check=True)
+        assert_that(completed.stderr, contains_string("SinglyLinkedList.reverse"))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import gc
+import pickle
+import threading
+import pytest
+from hamcrest import *
+
+from fpinpy import SinglyLinkedList, Cons
+from fpinpy.collections import InternPool
+
+class Test_InternPool:
+    def test_equal_lists_are_identical(self):
+        pool = InternPool()
+        assert_that(pool.list('a', 'b'), same_instance(pool.list('a', 'b')))
+    def test_suffixes_are_shared(self):
+        pool = InternPool()
+        assert_that(pool.list('x', 'b').tail(), same_instance(pool.list('y', 'b').tail()))
+    def test_equal_heads_of_different_types_stay_apart(self):
+        pool = InternPool()
+        first = pool.list(True, 2)
+        sut = pool.list(1, 2)
+        assert_that(sut, is_not(same_instance(first)))
+        assert_that([type(elem) for elem in sut], equal_to([int, int]))
+        assert_that(type(pool.list(1.0, 2).head()), equal_to(float))
+        assert_that(pool.list(1, 2), same_instance(sut))
+    def test_interned_nodes_are_cons(self):
+        sut = InternPool().list(1, 2)
+        assert_that(sut, instance_of(Cons))
+        assert_that(sut, equal_to(SinglyLinkedList.list(1, 2)))
+    def test_cons_interns_foreign_tail(self):
+        pool = InternPool()
+        sut = pool.cons(0, SinglyLinkedList.list(1, 2))
+        assert_that(sut.tail(), same_instance(pool.list(1, 2)))
+    def test_intern(self):
+        pool = InternPool()
+        interned = pool.intern(SinglyLinkedList.list(1, 2))
+        assert_that(pool.intern(SinglyLinkedList.list(1, 2)), same_instance(interned))
+        assert_that(pool.intern(interned), same_instance(interned))
+    def test_pools_are_independent(self):
+        assert_that(InternPool().list(1) is InternPool().list(1), equal_to(False))
+
+class Test_stats:
+    def test_hits_and_misses(self):
+        pool = InternPool()
+        kept = pool.list(1, 2)
+        pool.list(0, 1, 2)
+        sut = pool.stats()
+        assert_that(sut['misses'], equal_to(3))
+        assert_that(sut['hits'], equal_to(2))
+    def test_unreferenced_nodes_are_evicted(self):
+        pool = InternPool()
+        kept = pool.list(1)
+        pool.list(2, 3)
+        gc.collect()
+        assert_that(pool.stats()['live'], equal_to(1))
+    def test_clear(self):
+        pool = InternPool()
+        kept = pool.list(1)
+        pool.clear()
+        assert_that(pool.stats(), equal_to({'hits': 0, 'misses': 0, 'live': 0}))
+
+class Test_interned:
+    def test_uses_pool_of_with_block(self):
+        with InternPool() as pool:
+            sut = SinglyLinkedList.interned(1, 2)
+            assert_that(sut, same_instance(pool.list(1, 2)))
+        assert_that(InternPool.current() is pool, equal_to(False))
+    def test_default_pool(self):
+        assert_that(SinglyLinkedList.interned('p', 'q'), same_instance(SinglyLinkedList.interned('p', 'q')))
+
+class Test_threads:
+    def test_concurrent_construction_yields_one_node(self):
+        pool = InternPool()
+        results = []
+        def build():
+            for _ in range(200):
+                results.append(pool.list(*range(20)))
+        threads = [threading.Thread(target=build) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_that(len({id(result) for result in results}), equal_to(1))
+    def test_same_pool_entered_from_several_threads(self):
+        pool = InternPool()
+        barrier = threading.Barrier(4)
+        errors = []
+        def enter():
+            try:
+                for _ in range(50):
+                    with pool:
+                        barrier.wait()
+                        assert InternPool.current() is pool
+                        with InternPool() as inner:
+                            assert InternPool.current() is inner
+                        assert InternPool.current() is pool
+                        barrier.wait()
+                    assert InternPool.current() is not pool
+            except Exception as e:
+                errors.append(e)
+                barrier.abort()
+        threads = [threading.Thread(target=enter) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_that(errors, empty())
+
+class Test_pickle:
+    def test_unpickles_into_current_pool(self):
+        with InternPool() as pool:
+            aList = pool.list(1, 2)
+            assert_that(pickle.loads(pickle.dumps(aList)), same_instance(aList))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import operator
+import pickle
+import pytest
+from hamcrest import *
+
+from fpinpy import NumericList, Result, SinglyLinkedList
+from fpinpy.collections import numeric_list
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(numeric_list, "numpy", None)
+    return request.param
+
+class Test_Initialization:
+    def test_backend(self, backend):
+        assert_that(NumericList.backend(), equal_to(backend))
+    def test_infers_int_and_float(self, backend):
+        assert_that(NumericList.list(1, 2).head(), instance_of(int))
+        assert_that(NumericList.list(1, 2.5).toPyList(), equal_to([1.0, 2.5]))
+    def test_rejects_non_numbers(self, backend):
+        assert_that(calling(NumericList.list).with_args("a"), raises(TypeError))
+    def test_fromList(self, backend):
+        sut = NumericList.fromList(SinglyLinkedList.list(1, 2, 3))
+        assert_that(sut.toList(), equal_to(SinglyLinkedList.list(1, 2, 3)))
+    def test_empty(self, backend):
+        assert_that(NumericList.empty().isEmpty(), equal_to(True))
+    def test_typecode_is_backend_independent(self, backend):
+        assert_that(NumericList.list(1, 2).typecode(), equal_to("q"))
+        assert_that(NumericList.list(1, 2.5).typecode(), equal_to("d"))
+        assert_that(NumericList.list(1, 2).tail().cons(0).typecode(), equal_to("q"))
+    def test_typecode_of_empty_is_backend_independent(self, backend):
+        assert_that(NumericList.list().typecode(), equal_to("d"))
+        assert_that(NumericList.fromIterable([]).typecode(), equal_to("d"))
+        assert_that(NumericList.empty().typecode(), equal_to("d"))
+        assert_that(NumericList.empty('q').typecode(), equal_to("q"))
+
+class Test_views:
+    def test_tail_drop_take(self, backend):
+        sut = NumericList.fromIterable(range(10))
+        assert_that(sut.tail().head(), equal_to(1))
+        assert_that(sut.drop(3).take(2).toPyList(), equal_to([3, 4]))
+        assert_that(sut.drop(20).isEmpty(), equal_to(True))
+        assert_that(sut.length(), equal_to(10))
+    def test_views_share_the_buffer(self, backend):
+        sut = NumericList.fromIterable(range(10))
+        assert_that(sut.drop(5)._buffer, same_instance(sut._buffer))
+    def test_empty_head_and_tail(self, backend):
+        assert_that(calling(NumericList.empty().head), raises(RuntimeError))
+        assert_that(calling(NumericList.empty().tail), raises(RuntimeError))
+
+class Test_cons:
+    def test_persistent(self, backend):
+        sut = NumericList.list(1, 2)
+        first = sut.cons(0)
+        second = sut.cons(5)
+        assert_that(first.toPyList(), equal_to([0, 1, 2]))
+        assert_that(second.toPyList(), equal_to([5, 1, 2]))
+        assert_that(sut.toPyList(), equal_to([1, 2]))
+    def test_reuses_free_slot(self, backend):
+        sut = NumericList.list(1).cons(0)
+        assert_that(sut.cons(-1)._buffer, same_instance(sut._buffer))
+    def test_cons_on_tail(self, backend):
+        sut = NumericList.list(1, 2, 3).cons(0)
+        assert_that(sut.tail().tail().cons(9).toPyList(), equal_to([9, 2, 3]))
+        assert_that(sut.toPyList(), equal_to([0, 1, 2, 3]))
+    def test_many(self, backend):
+        sut = NumericList.empty('q')
+        for i in range(1000):
+            sut = sut.cons(i)
+        assert_that(sut.toPyList(), equal_to(list(range(999, -1, -1))))
+    def test_wrong_type(self, backend):
+        assert_that(calling(NumericList.list(1).cons).with_args(1.5), raises(TypeError))
+
+class Test_map:
+    def test_elementwise(self, backend):
+        assert_that(NumericList.list(1, 2).map(lambda x: x * 1.5).toPyList(), equal_to([1.5, 3.0]))
+    def test_vectorized(self, backend):
+        assert_that(NumericList.list(1, 2).map(lambda x: x * 2 + 1, vectorized=True).toPyList(), equal_to([3, 5]))
+    def test_non_numeric_result(self, backend):
+        assert_that(calling(NumericList.list(1).map).with_args(str), raises(TypeError))
+
+class Test_filter:
+    def test_elementwise(self, backend):
+        assert_that(NumericList.fromIterable(range(6)).filter(lambda x: x % 2).toPyList(), equal_to([1, 3, 5]))
+    def test_vectorized(self, backend):
+        sut = NumericList.fromIterable(range(6)).filter(lambda x: x > 3, vectorized=True)
+        assert_that(sut.toPyList(), equal_to([4, 5]))
+    def test_all_kept(self, backend):
+        sut = NumericList.list(1, 2)
+        assert_that(sut.filter(lambda x: True), same_instance(sut))
+
+class Test_foldLeft:
+    @pytest.mark.parametrize("function, identity, expected", [
+        (operator.add, 10, 16), (operator.mul, 2, 12), (max, 0, 3), (min, 0, 0),
+    ])
+    def test_known_reductions(self, backend, function, identity, expected):
+        assert_that(NumericList.list(1, 2, 3).foldLeft(identity, function), equal_to(expected))
+    def test_curried(self, backend):
+        assert_that(NumericList.list(1, 2, 3).foldLeft(0, lambda acc: lambda x: acc * 10 + x), equal_to(123))
+    def test_empty(self, backend):
+        assert_that(NumericList.empty().foldLeft(5, operator.add), equal_to(5))
+
+class Test_traverse:
+    def test_success(self, backend):
+        sut = NumericList.list(1, 2).traverse(lambda x: Result.success(x + 1))
+        assert_that(sut.getOrThrow().toPyList(), equal_to([2, 3]))
+    def test_first_failure(self, backend):
+        sut = NumericList.list(1, 2).traverse(lambda x: Result.failure("bad") if x == 2 else Result.success(x))
+        assert_that(sut.isFailure(), equal_to(True))
+    def test_empty_is_failure(self, backend):
+        assert_that(NumericList.list(1).traverse(lambda x: Result.empty()).isFailure(), equal_to(True))
+    def test_vectorized_raises(self, backend):
+        sut = NumericList.list(1, 0).traverse(lambda x: 1 // x, vectorized=True)
+        assert_that(sut.isFailure(), equal_to(True))
+
+class Test_conversion:
+    def test_toArray_is_a_copy(self, backend):
+        sut = NumericList.list(1, 2)
+        values = sut.toArray()
+        values[0] = 9
+        assert_that(sut.toPyList(), equal_to([1, 2]))
+    def test_fromArray(self, backend):
+        sut = NumericList.fromArray(NumericList.list(1.5, 2.5).drop(1).toArray())
+        assert_that(sut.toPyList(), equal_to([2.5]))
+    def test_pickle_round_trip(self, backend):
+        for sut in (NumericList.list(1, 2), NumericList.fromIterable(range(10)).drop(3).take(4),
+                    NumericList.list(1.5, -2.5), NumericList.empty()):
+            loaded = pickle.loads(pickle.dumps(sut))
+            assert_that(loaded, equal_to(sut))
+            assert_that(loaded.typecode(), equal_to(sut.typecode()))
+        assert_that(pickle.loads(pickle.dumps(NumericList.list(2, 3))).cons(1).toPyList(), equal_to([1, 2, 3]))
+    def test_equality_and_str(self, backend):
+        assert_that(NumericList.list(1, 2), equal_to(NumericList.list(1, 2)))
+        assert_that(str(NumericList.list(1, 2)), equal_to("[1, 2, NIL]"))
+
+class Test_numpy:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+    def test_ufunc_map(self, numpy):
+        assert_that(NumericList.list(1.0, 4.0).map(numpy.sqrt).toPyList(), equal_to([1.0, 2.0]))
+    def test_ufunc_filter(self, numpy):
+        assert_that(NumericList.list(-1.0, 2.0).filter(numpy.signbit).toPyList(), equal_to([-1.0]))
+    def test_ufunc_fold(self, numpy):
+        assert_that(NumericList.list(1.0, 2.0).foldLeft(0.5, numpy.add), equal_to(3.5))
+    def test_ufunc_traverse_floating_point_error(self, numpy):
+        assert_that(NumericList.list(1.0, -1.0).traverse(numpy.log).isFailure(), equal_to(True))
+        assert_that(NumericList.list(1.0, 2.0).traverse(numpy.log).isSuccess(), equal_to(True))
+    def test_pickle_loads_into_array_backend(self, numpy, monkeypatch):
+        pickled = pickle.dumps(NumericList.list(1, 2, 3))
+        monkeypatch.setattr(numeric_list, "numpy", None)
+        loaded = pickle.loads(pickled)
+        assert_that(loaded.backend(), equal_to("array"))
+        assert_that(loaded.toPyList(), equal_to([1, 2, 3]))
+    def test_typecode_of_sized_arrays(self, numpy):
+        assert_that(NumericList.fromArray(numpy.arange(3, dtype=numpy.int32)).typecode(), equal_to("i"))
+        assert_that(NumericList.fromArray(numpy.arange(3, dtype=numpy.float32)).typecode(), equal_to("f"))
+        assert_that(NumericList.fromArray(numpy.arange(3, dtype=numpy.complex128)).typecode(), equal_to("D"))
+    def test_fromArray_without_copy(self, numpy):
+        values = numpy.arange(4)
+        assert_that(NumericList.fromArray(values, copy=False).drop(2)._view().base, same_instance(values))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import random
+import pytest
+from hamcrest import *
+
+from fpinpy import RandomAccessList, SinglyLinkedList, Result
+
+class Test_Initialization:
+    def test_list(self):
+        assert_that(RandomAccessList.list(1, 2, 3).toPyList(), equal_to([1, 2, 3]))
+    def test_empty(self):
+        assert_that(RandomAccessList.empty().isEmpty(), equal_to(True))
+        assert_that(calling(RandomAccessList.empty().head), raises(RuntimeError))
+        assert_that(calling(RandomAccessList.empty().tail), raises(RuntimeError))
+    def test_fromList_and_toList(self):
+        aList = SinglyLinkedList.list(1, 2, 3)
+        assert_that(RandomAccessList.fromList(aList).toList(), equal_to(aList))
+
+class Test_spine:
+    def test_cons_merges_equal_trees(self):
+        sut = RandomAccessList.empty().cons(3).cons(2).cons(1)
+        assert_that(sut._size, equal_to(3))
+        assert_that(sut._next.isEmpty(), equal_to(True))
+    def test_head_and_tail(self):
+        sut = RandomAccessList.fromIterable(range(10))
+        heads = []
+        while not sut.isEmpty():
+            heads.append(sut.head())
+            sut = sut.tail()
+        assert_that(heads, equal_to(list(range(10))))
+
+class Test_get:
+    @pytest.mark.parametrize("length", [1, 2, 3, 7, 8, 31, 100])
+    def test_every_index(self, length):
+        sut = RandomAccessList.fromIterable(range(length))
+        assert_that([sut.get(i) for i in range(length)], equal_to(list(range(length))))
+    def test_out_of_range(self):
+        assert_that(calling(RandomAccessList.list(1).get).with_args(1), raises(IndexError))
+        assert_that(RandomAccessList.list(1).getOrFailure(-1).isFailure(), equal_to(True))
+    def test_negative_index(self):
+        assert_that(RandomAccessList.list(1, 2, 3)[-1], equal_to(3))
+
+class Test_update:
+    def test_persistent(self):
+        sut = RandomAccessList.fromIterable(range(20))
+        updated = sut.update(13, "x")
+        assert_that(updated.get(13), equal_to("x"))
+        assert_that(sut.get(13), equal_to(13))
+        assert_that(updated.length(), equal_to(20))
+    def test_random_against_python_list(self):
+        rng = random.Random(7)
+        model = list(range(200))
+        sut = RandomAccessList.fromIterable(model)
+        for _ in range(500):
+            index = rng.randrange(len(model))
+            model[index] = rng.random()
+            sut = sut.update(index, model[index])
+        assert_that(sut.toPyList(), equal_to(model))
+
+class Test_drop:
+    @pytest.mark.parametrize("length", [0, 1, 6, 7, 50])
+    def test_every_count(self, length):
+        sut = RandomAccessList.fromIterable(range(length))
+        for n in range(length + 2):
+            dropped = sut.drop(n)
+            assert_that(dropped.toPyList(), equal_to(list(range(length))[n:]))
+            assert_that(dropped.cons(-1).get(0), equal_to(-1))
+
+class Test_combinators:
+    def test_map_filter(self):
+        sut = RandomAccessList.fromIterable(range(6)).map(lambda x: x * 2).filter(lambda x: x % 4 == 0)
+        assert_that(sut.toPyList(), equal_to([0, 4, 8]))
+    def test_folds(self):
+        sut = RandomAccessList.list("a", "b", "c")
+        assert_that(sut.foldLeft("", lambda acc: lambda x: acc + x), equal_to("abc"))
+        assert_that(sut.foldRight("", lambda x: lambda acc: acc + x), equal_to("cba"))
+    def test_traverse(self):
+        sut = RandomAccessList.traverse(RandomAccessList.list(1, 2), lambda x: Result.success(x + 1))
+        assert_that(sut.getOrThrow(), equal_to(RandomAccessList.list(2, 3)))
+        assert_that(RandomAccessList.sequence(RandomAccessList.list(Result.failure("x"))).isFailure(), equal_to(True))
+    def test_sequence_forwards_flags(self):
+        aList = RandomAccessList.list(Result.success(1), Result.failure("x"), Result.empty(), Result.success(3))
+        sut = RandomAccessList.sequence(aList, ignoreFailure=True)
+        assert_that(sut.getOrThrow(), equal_to(RandomAccessList.list(1, 3)))
+        assert_that(sut, equal_to(RandomAccessList.traverse(aList, lambda x: x, ignoreFailure=True)))
+    def test_empty_is_its_own_rest(self):
+        assert_that(RandomAccessList.list(1).tail(), same_instance(RandomAccessList.empty()))
+        assert_that(RandomAccessList.empty().cons(1).toPyList(), equal_to([1]))
+    def test_str(self):
+        assert_that(str(RandomAccessList.list(1, 2)), equal_to("[1, 2, NIL]"))
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 #
+import pickle
 import pytest
 from hamcrest import *
 
@@ -351,3 +352,21 @@ class Test_getOrThrow():
         def test_empty(self):
             sut = Result.empty()
             assert_that(calling(sut.getOrThrow), raises(RuntimeError))
+
+class Test_pickle():
+    def test_success(self):
+        sut = pickle.loads(pickle.dumps(Result.success(1)))
+        assert_that(sut, equal_to(Result.success(1)))
+    def test_failure_keeps_traceback_as_text(self):
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            failure = Result.failure(e)
+        sut = pickle.loads(pickle.dumps(failure))
+        assert_that(sut.failureValue(), instance_of(ValueError))
+        assert_that(sut.exception_traceback, none())
+        assert_that(sut.tracebackText(), contains_string("ValueError: boom"))
+    def test_failure_without_traceback(self):
+        sut = pickle.loads(pickle.dumps(Result.failure("boom")))
+        assert_that(str(sut.failureValue()), equal_to("boom"))
+        assert_that(sut.tracebackText(), equal_to(""))
@@ -20,11 +20,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 #
+import array
+import asyncio
+import inspect
+import operator
+import pickle
 import pytest
 from hamcrest import *
 
-from fpinpy import SinglyLinkedList, Nil, Cons
+from fpinpy import SinglyLinkedList, Nil, Cons, PersistentHashMap
 from fpinpy.result import Result, Failure, Success
+from fpinpy.collections import ListBuilder
+from fpinpy.collections.singly_linked_list import SinglyLinkedListIterator
+
+# Module-level so that process pools can pickle them.
+def double(x):
+    return x * 2
+
+def validate(x):
+    if x % 3 == 0:
+        return Result.failure(ValueError(x))
+    if x % 5 == 0:
+        return Result.empty()
+    return Result.success(x)
 
 class Test_Initialization:
     class Test_Cons:
@@ -44,6 +62,16 @@ class Test_Initialization:
         def test_factory(self):
             sut = SinglyLinkedList.list()
             assert_that(sut, instance_of(Nil))
+        def test_singleton(self):
+            assert_that(SinglyLinkedList.nil(), same_instance(Nil()))
+            assert_that(SinglyLinkedList.list(), same_instance(Nil()))
+            assert_that(SinglyLinkedList.list(1).tail(), same_instance(Nil()))
+    class Test_Layout:
+        def test_nodes_have_no_dict(self):
+            assert_that(hasattr(SinglyLinkedList.list(1, 2), '__dict__'), equal_to(False))
+            assert_that(hasattr(SinglyLinkedList.list(), '__dict__'), equal_to(False))
+        def test_direct_construction_checks_tail(self):
+            assert_that(calling(Cons).with_args(1, [2, 3]), raises(AssertionError))
 
 class Test_head():
     class Test_Cons:
@@ -83,18 +111,38 @@ class Test_str():
         def test_str_some(self):
             sut = str(SinglyLinkedList.list(1, 2, 3))
             assert_that(sut, equal_to("[1, 2, 3, NIL]"))
+        def test_str_long_list_does_not_recurse(self):
+            sut = str(SinglyLinkedList.list(*range(100000)))
+            assert_that(sut, ends_with("99998, 99999, NIL]"))
+        def test_toString_limit(self):
+            sut = SinglyLinkedList.list(*range(1000000)).toString(3)
+            assert_that(sut, equal_to("[0, 1, 2, ... (999997 more), NIL]"))
+        def test_toString_limit_above_length(self):
+            sut = SinglyLinkedList.list(1, 2).toString(5)
+            assert_that(sut, equal_to("[1, 2, NIL]"))
     class Test_Nil:
         def test_str(self):
             sut = str(SinglyLinkedList.list())
             assert_that(sut, equal_to("[NIL]"))
+        def test_toString_limit(self):
+            sut = SinglyLinkedList.list().toString(3)
+            assert_that(sut, equal_to("[NIL]"))
 
-#class Test_repr():
-#    class Test_Cons:
-#        sut = repr(SinglyLinkedList.list(1, 2, 3))
-#        assert_that(sut, equal_to("Cons(1, Cons(2, Cons(3, NIL)))"))
-#    class Test_Nil:
-#        sut = repr(SinglyLinkedList.list())
-#        assert_that(sut, equal_to("Nil"))
+class Test_repr():
+    class Test_Cons:
+        def test_repr_some(self):
+            sut = repr(SinglyLinkedList.list(1, 2, 3))
+            assert_that(sut, equal_to("SinglyLinkedList(Cons(1, Cons(2, Cons(3, Nil))))"))
+        def test_repr_long_list_does_not_recurse(self):
+            sut = repr(SinglyLinkedList.list(*range(100000)))
+            assert_that(sut, ends_with("Cons(99999, Nil" + ")" * 100001))
+        def test_toRepr_limit(self):
+            sut = SinglyLinkedList.list('a', 'b', 'c').toRepr(1)
+            assert_that(sut, equal_to("SinglyLinkedList(Cons('a', ... (2 more)))"))
+    class Test_Nil:
+        def test_repr(self):
+            sut = repr(SinglyLinkedList.list())
+            assert_that(sut, equal_to("Nil"))
 
 class Test_setHead():
     class Test_Cons:
@@ -150,11 +198,59 @@ class Test_foldRight():
         def test_foldRight_singleton(self):
             sut = SinglyLinkedList.list(2).foldLeft(0, lambda x: lambda y: x + y)
             assert_that(str(sut), equal_to("2"))
+        def test_foldRight_is_repeatable(self):
+            aList = SinglyLinkedList.list(2, 3, 4)
+            first = aList.foldRight("", lambda x: lambda y: f"({x}{y})")
+            assert_that(aList.foldRight("", lambda x: lambda y: f"({x}{y})"), equal_to(first))
+            assert_that(first, equal_to("(2(3(4)))"))
+        def test_foldRight_builds_no_nodes(self, monkeypatch):
+            from fpinpy.collections import singly_linked_list
+            aList = SinglyLinkedList.list(2, 3, 4)
+            monkeypatch.setattr(singly_linked_list, "_object_new", None)
+            assert_that(aList.foldRight(0, lambda x: lambda y: x + y), equal_to(9))
+            assert_that(aList.foldr(0, lambda x, y: x + y), equal_to(9))
+        def test_foldRight_deep(self):
+            size = 100_000
+            assert_that(SinglyLinkedList.fromIterable(range(size)).foldRight(0, lambda x: lambda y: x + y), equal_to(sum(range(size))))
+        def test_foldRightStatic(self):
+            sut = SinglyLinkedList.foldRightStatic(SinglyLinkedList.list(2, 3, 4), SinglyLinkedList.list(5), lambda x: lambda y: SinglyLinkedList.cons(x, y))
+            assert_that(sut, equal_to(SinglyLinkedList.list(2, 3, 4, 5)))
+            assert_that(SinglyLinkedList.foldRightStatic(SinglyLinkedList.list(), 0, lambda x: lambda y: x + y), equal_to(0))
     class Test_Nil:
         def test_foldRight_keeps_identity(self):
             sut = SinglyLinkedList.list().foldLeft(0, lambda x: lambda y: x + y)
             assert_that(str(sut), equal_to("0"))
 
+class Test_foldl:
+    def test_foldl_operator(self):
+        assert_that(SinglyLinkedList.list(2, 3, 4).foldl(0, operator.add), equal_to(9))
+    def test_foldl_order(self):
+        assert_that(SinglyLinkedList.list(2, 3, 4).foldl("", lambda acc, x: f"({acc}{x})"), equal_to("(((2)3)4)"))
+    def test_foldl_matches_foldLeft(self):
+        aList = SinglyLinkedList.list(2, 3, 4)
+        assert_that(aList.foldl(SinglyLinkedList.list(), lambda acc, x: SinglyLinkedList.cons(x, acc)),
+                    equal_to(aList.foldLeft(SinglyLinkedList.list(), lambda acc: lambda x: SinglyLinkedList.cons(x, acc))))
+    def test_foldl_none(self):
+        assert_that(SinglyLinkedList.list().foldl(7, operator.add), equal_to(7))
+
+class Test_foldr:
+    def test_foldr_order(self):
+        assert_that(SinglyLinkedList.list(2, 3, 4).foldr("", lambda x, acc: f"({x}{acc})"), equal_to("(2(3(4)))"))
+    def test_foldr_rebuilds_list(self):
+        aList = SinglyLinkedList.list(2, 3, 4)
+        assert_that(aList.foldr(SinglyLinkedList.list(), SinglyLinkedList.cons), equal_to(aList))
+    def test_foldr_none(self):
+        assert_that(SinglyLinkedList.list().foldr(7, operator.add), equal_to(7))
+
+class Test_reduce:
+    def test_reduce(self):
+        assert_that(SinglyLinkedList.list(3, 1, 2).reduce(max), equal_to(Result.success(3)))
+        assert_that(SinglyLinkedList.list("a", "b", "c").reduce(operator.add), equal_to(Result.success("abc")))
+    def test_reduce_singleton(self):
+        assert_that(SinglyLinkedList.list(5).reduce(lambda a, b: 1 / 0), equal_to(Result.success(5)))
+    def test_reduce_none(self):
+        assert_that(SinglyLinkedList.list().reduce(operator.add).isEmpty(), equal_to(True))
+
 class Test_drop():
     class Test_Cons:
         def test_drop_some(self):
@@ -182,11 +278,21 @@ class Test_filter():
         def test_filter_some(self):
             sut = SinglyLinkedList.list(1,2,3,4).filter(lambda h: h > 2)
             assert_that(str(sut), equal_to('[3, 4, NIL]'))
-        def test_filter_singleton(self): # TODO
-            pass
+        def test_filter_singleton(self):
+            sut = SinglyLinkedList.list(1).filter(lambda h: h > 2)
+            assert_that(str(sut), equal_to('[NIL]'))
+        def test_filter_shares_tail_after_last_removed(self):
+            aList = SinglyLinkedList.list(1, 2, 3, 4)
+            sut = aList.filter(lambda h: h != 2)
+            assert_that(str(sut), equal_to('[1, 3, 4, NIL]'))
+            assert_that(sut.tail(), same_instance(aList.drop(2)))
+        def test_filter_keeps_all_returns_self(self):
+            aList = SinglyLinkedList.list(1, 2, 3)
+            assert_that(aList.filter(lambda h: True), same_instance(aList))
     class Test_Nil:
-        def test_filter(self): # TODO
-            pass
+        def test_filter(self):
+            sut = SinglyLinkedList.list().filter(lambda h: h > 2)
+            assert_that(str(sut), equal_to('[NIL]'))
 
 class Test_forEach():
     class Test_Cons:
@@ -266,6 +372,20 @@ class Test_SinglyLinkedListIterator:
             assert_that(next(sut), equal_to(2))
             assert_that(next(sut), equal_to(1))
             assert_that(calling(next).with_args(sut), raises(StopIteration))
+        def test_backward_is_lazy_iterator(self):
+            assert_that(reversed(SinglyLinkedList.list(1, 2)), instance_of(SinglyLinkedListIterator))
+        def test_backward_builds_no_nodes(self, monkeypatch):
+            from fpinpy.collections import singly_linked_list
+            aList = SinglyLinkedList.list(1, 2, 3)
+            monkeypatch.setattr(singly_linked_list, "_object_new", None)
+            sut = reversed(aList)
+            assert_that(sut.__length_hint__(), equal_to(3))
+            assert_that(list(sut), equal_to([3, 2, 1]))
+        def test_backward_none(self):
+            assert_that(list(reversed(SinglyLinkedList.list())), equal_to([]))
+        def test_backward_iterator_class(self):
+            sut = SinglyLinkedListIterator(SinglyLinkedList.list(1, 2, 3), reverse=True)
+            assert_that(list(sut), equal_to([3, 2, 1]))
 
 class Test_traverse:
     # TODO Expand tests to include all cases. sequence was considered more important.
@@ -279,6 +399,58 @@ class Test_traverse:
         def test_traverse_empty(self):
             sut = SinglyLinkedList.traverse(SinglyLinkedList.list(), lambda x: Result.of(x + 1))
             assert_that(str(sut), equal_to("Result([NIL])"))
+        def test_traverse_failFast_stops_at_first_failure(self):
+            calls = []
+            def tracked(x):
+                calls.append(x)
+                return validate(x)
+            sut = SinglyLinkedList.traverse(SinglyLinkedList.fromIterable(range(1, 100)), tracked, failFast=True)
+            assert_that(sut.isFailure(), equal_to(True))
+            assert_that(str(sut.failureValue()), equal_to("3"))
+            assert_that(calls, equal_to([1, 2, 3]))
+        def test_traverse_failFast_empty_is_failure(self):
+            sut = SinglyLinkedList.traverse(SinglyLinkedList.list(1, 5, 3), validate, failFast=True)
+            assert_that(str(sut.failureValue()), equal_to("Empty was considered Failure."))
+        def test_traverse_failFast_without_failure(self):
+            sut = SinglyLinkedList.traverse(SinglyLinkedList.list(1, 2, 4), validate, failFast=True)
+            assert_that(sut, equal_to(Result.success(SinglyLinkedList.list(1, 2, 4))))
+        def test_traverse_failFast_ignored_with_ignoreFailure(self):
+            aList = SinglyLinkedList.fromIterable(range(1, 20))
+            sut = SinglyLinkedList.traverse(aList, validate, ignoreFailure=True, failFast=True)
+            assert_that(sut, equal_to(SinglyLinkedList.traverse(aList, validate, ignoreFailure=True)))
+
+class Test_traverseIter:
+    def test_traverseIter_is_lazy(self):
+        calls = []
+        def tracked(x):
+            calls.append(x)
+            return validate(x)
+        sut = SinglyLinkedList.traverseIter(SinglyLinkedList.list(1, 2, 4), tracked)
+        assert_that(calls, empty())
+        assert_that(next(sut), equal_to(Result.success(1)))
+        assert_that(calls, equal_to([1]))
+    def test_traverseIter_yields_what_traverse_collects(self):
+        sut = list(SinglyLinkedList.traverseIter(SinglyLinkedList.list(1, 3, 5, 7), validate))
+        assert_that([result.isSuccess() for result in sut], equal_to([True, False, False, True]))
+        assert_that(str(sut[2].failureValue()), equal_to("Empty was considered Failure."))
+    def test_traverseIter_skips_empty(self):
+        sut = list(SinglyLinkedList.traverseIter(SinglyLinkedList.list(1, 5, 7), validate, emptyIsFailure=False))
+        assert_that(sut, equal_to([Result.success(1), Result.success(7)]))
+    def test_traverseIter_ignoreFailure(self):
+        sut = list(SinglyLinkedList.traverseIter(range(1, 10), validate, ignoreFailure=True))
+        assert_that([result.successValue() for result in sut], equal_to([1, 2, 4, 7, 8]))
+    def test_traverseIter_failFast(self):
+        calls = []
+        def tracked(x):
+            calls.append(x)
+            return validate(x)
+        sut = list(SinglyLinkedList.traverseIter(range(1, 100), tracked, failFast=True))
+        assert_that([result.isSuccess() for result in sut], equal_to([True, True, False]))
+        assert_that(calls, equal_to([1, 2, 3]))
+    def test_traverseIter_unbounded_input(self):
+        from itertools import count, islice
+        sut = SinglyLinkedList.traverseIter(count(1), lambda x: Result.success(x * 2))
+        assert_that([result.successValue() for result in islice(sut, 3)], equal_to([2, 4, 6]))
 
 class Test_sequence:
     class Test_static:
@@ -300,6 +472,10 @@ class Test_sequence:
         def test_sequence_empty(self):
             sut = SinglyLinkedList.sequence(SinglyLinkedList.list())
             assert_that(str(sut), equal_to("Result([NIL])"))
+        def test_sequence_passes_flags(self):
+            aList = SinglyLinkedList.list(Result.of(1), Result.empty(), Result.failure(RuntimeError(2)), Result.of(3))
+            assert_that(SinglyLinkedList.sequence(aList, ignoreFailure=True), equal_to(Result.success(SinglyLinkedList.list(1, 3))))
+            assert_that(SinglyLinkedList.sequence(aList, emptyIsFailure=False, failFast=True).failureValue().args, equal_to((2,)))
 
 class Test_flattenResult:
     class Test_Cons:
@@ -326,6 +502,26 @@ class Test_flatMap:
     def test_flatMap(self):
         sut = SinglyLinkedList.list(1,2,3).flatMap(lambda a: SinglyLinkedList.list(a, -a))
         assert_that(str(sut), equal_to("[1, -1, 2, -2, 3, -3, NIL]"))
+    def test_flatMap_with_empty_inner_lists(self):
+        sut = SinglyLinkedList.list(1,2,3).flatMap(lambda a: SinglyLinkedList.list(a) if a != 2 else SinglyLinkedList.list())
+        assert_that(str(sut), equal_to("[1, 3, NIL]"))
+    def test_flatMap_shares_last_inner_list(self):
+        last = SinglyLinkedList.list(3, -3)
+        sut = SinglyLinkedList.list(1, 2).flatMap(lambda a: SinglyLinkedList.list(a) if a == 1 else last)
+        assert_that(sut.tail(), same_instance(last))
+
+class Test_concat:
+    def test_concat_some(self):
+        sut = SinglyLinkedList.concat(SinglyLinkedList.list(1, 2), SinglyLinkedList.list(3))
+        assert_that(str(sut), equal_to("[1, 2, 3, NIL]"))
+    def test_concat_shares_second_list(self):
+        list2 = SinglyLinkedList.list(3, 4)
+        sut = SinglyLinkedList.concat(SinglyLinkedList.list(1, 2), list2)
+        assert_that(sut.drop(2), same_instance(list2))
+    def test_concat_with_empty(self):
+        aList = SinglyLinkedList.list(1, 2)
+        assert_that(SinglyLinkedList.concat(aList, SinglyLinkedList.list()), same_instance(aList))
+        assert_that(SinglyLinkedList.concat(SinglyLinkedList.list(), aList), same_instance(aList))
 
 class Test_toPyList:
     class Test_Cons:
@@ -335,7 +531,302 @@ class Test_toPyList:
         def test_toPyList_singleton(self):
             sut = SinglyLinkedList.list(1).toPyList()
             assert_that(sut, equal_to([1]))
+        def test_toPyList_long(self):
+            sut = SinglyLinkedList.list(*range(100000)).toPyList()
+            assert_that(sut, equal_to(list(range(100000))))
+        def test_toTuple(self):
+            sut = SinglyLinkedList.list(1, 2, 3).toTuple()
+            assert_that(sut, equal_to((1, 2, 3)))
+        def test_toArray(self):
+            sut = SinglyLinkedList.list(1.5, 2.5).toArray('d')
+            assert_that(sut, equal_to(array.array('d', [1.5, 2.5])))
+        def test_toArray_wrong_type(self):
+            assert_that(calling(SinglyLinkedList.list('a').toArray).with_args('q'), raises(TypeError))
     class Test_Nil:
         def test_toPyList_none(self):
             sut = SinglyLinkedList.list().toPyList()
             assert_that(sut, equal_to([]))
+        def test_toTuple(self):
+            sut = SinglyLinkedList.list().toTuple()
+            assert_that(sut, equal_to(()))
+
+class Test_view:
+    def test_view_matches_eager_chain(self):
+        aList = SinglyLinkedList.list(1, 2, 3, 4, 5)
+        eager = aList.map(lambda x: x * 3).filter(lambda x: x % 2 == 0).map(lambda x: x + 1)
+        sut = aList.view().map(lambda x: x * 3).filter(lambda x: x % 2 == 0).map(lambda x: x + 1).toList()
+        assert_that(str(sut), equal_to(str(eager)))
+    def test_view_is_lazy_until_terminal(self):
+        calls = []
+        sut = SinglyLinkedList.list(1, 2, 3).view().map(lambda x: calls.append(x) or x)
+        assert_that(calls, equal_to([]))
+        assert_that(sut.toPyList(), equal_to([1, 2, 3]))
+        assert_that(calls, equal_to([1, 2, 3]))
+    def test_view_runs_single_pass(self):
+        order = []
+        SinglyLinkedList.list(1, 2).view() \
+            .map(lambda x: order.append(('map', x)) or x) \
+            .filter(lambda x: order.append(('filter', x)) or True) \
+            .forEach(lambda x: None)
+        assert_that(order, equal_to([('map', 1), ('filter', 1), ('map', 2), ('filter', 2)]))
+    def test_view_flatMap_take(self):
+        sut = SinglyLinkedList.list(1, 2, 3).view().flatMap(lambda x: SinglyLinkedList.list(x, -x)).take(3)
+        assert_that(sut.toPyList(), equal_to([1, -1, 2]))
+    def test_view_foldLeft(self):
+        sut = SinglyLinkedList.list(1, 2, 3).view().filter(lambda x: x > 1).foldLeft(0, lambda x: lambda y: x + y)
+        assert_that(sut, equal_to(5))
+    def test_view_foldl(self):
+        sut = SinglyLinkedList.list(1, 2, 3, 4).view().map(double).foldl(0, operator.add)
+        assert_that(sut, equal_to(20))
+    def test_view_on_empty(self):
+        sut = SinglyLinkedList.list().view().map(lambda x: x).toList()
+        assert_that(sut, instance_of(Nil))
+
+class Test_parMap:
+    def test_parMap_processes_preserves_order(self):
+        sut = SinglyLinkedList.list(*range(100)).parMap(double, chunkSize=7, maxWorkers=2)
+        assert_that(sut.toPyList(), equal_to([x * 2 for x in range(100)]))
+    def test_parMap_threads(self):
+        sut = SinglyLinkedList.list(1, 2, 3).parMap(lambda x: x + 1, chunkSize=1, useThreads=True)
+        assert_that(str(sut), equal_to("[2, 3, 4, NIL]"))
+    def test_parMap_empty(self):
+        sut = SinglyLinkedList.list().parMap(double, useThreads=True)
+        assert_that(sut, instance_of(Nil))
+    def test_parMap_invalid_chunkSize(self):
+        assert_that(calling(SinglyLinkedList.list(1).parMap).with_args(double, chunkSize=0, useThreads=True), raises(ValueError))
+
+class Test_parTraverse:
+    @pytest.mark.parametrize("flags", [
+        dict(),
+        dict(ignoreFailure=True),
+        dict(ignoreFailure=True, emptyIsFailure=False),
+        dict(successOfFailure=True),
+    ])
+    def test_parTraverse_matches_traverse(self, flags):
+        aList = SinglyLinkedList.list(*range(1, 40))
+        expected = SinglyLinkedList.traverse(aList, validate, **flags)
+        sut = SinglyLinkedList.parTraverse(aList, validate, chunkSize=4, maxWorkers=2, **flags)
+        assert_that(type(sut), equal_to(type(expected)))
+        assert_that(str(sut), equal_to(str(expected)))
+    def test_parTraverse_all_success(self):
+        sut = SinglyLinkedList.parTraverse(SinglyLinkedList.list(1, 2, 4), validate, chunkSize=2, useThreads=True)
+        assert_that(str(sut), equal_to("Result([1, 2, 4, NIL])"))
+
+class Test_traverseAsync:
+    @staticmethod
+    def tracked(limit_log):
+        running = [0]
+        async def lookup(x):
+            running[0] += 1
+            limit_log.append(running[0])
+            await asyncio.sleep(0.001 * (x % 3))
+            running[0] -= 1
+            return validate(x)
+        return lookup
+    def test_traverseAsync_preserves_order(self):
+        log = []
+        sut = asyncio.run(SinglyLinkedList.traverseAsync(SinglyLinkedList.list(1, 2, 4, 7, 8), self.tracked(log), maxConcurrency=2))
+        assert_that(str(sut), equal_to("Result([1, 2, 4, 7, 8, NIL])"))
+        assert_that(max(log), equal_to(2))
+    @pytest.mark.parametrize("flags", [
+        dict(),
+        dict(ignoreFailure=True),
+        dict(ignoreFailure=True, emptyIsFailure=False),
+        dict(successOfFailure=True),
+    ])
+    def test_traverseAsync_matches_traverse(self, flags):
+        aList = SinglyLinkedList.list(*range(1, 20))
+        expected = SinglyLinkedList.traverse(aList, validate, **flags)
+        sut = asyncio.run(SinglyLinkedList.traverseAsync(aList, self.tracked([]), maxConcurrency=3, **flags))
+        assert_that(str(sut), equal_to(str(expected)))
+    def test_traverseAsync_failFast_cancels_remaining(self):
+        started = []
+        cancelled = []
+        async def lookup(x):
+            started.append(x)
+            try:
+                await asyncio.sleep(0 if x == 3 else 1)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return validate(x)
+        sut = asyncio.run(SinglyLinkedList.traverseAsync(SinglyLinkedList.list(*range(1, 10)), lookup, maxConcurrency=3, failFast=True))
+        assert_that(sut, instance_of(Failure))
+        assert_that(str(sut), equal_to("Failure(3)"))
+        assert_that(started, equal_to([1, 2, 3]))
+        assert_that(cancelled, equal_to([1, 2]))
+    def test_traverseAsync_empty(self):
+        sut = asyncio.run(SinglyLinkedList.traverseAsync(SinglyLinkedList.list(), self.tracked([])))
+        assert_that(str(sut), equal_to("Result([NIL])"))
+    def test_sequenceAsync(self):
+        async def run():
+            return await SinglyLinkedList.sequenceAsync([asyncio.sleep(0, Result.of(1)), asyncio.sleep(0, Result.of(2))], maxConcurrency=1)
+        assert_that(str(asyncio.run(run())), equal_to("Result([1, 2, NIL])"))
+    def test_sequenceAsync_failFast_closes_unstarted(self):
+        async def run():
+            coroutines = [asyncio.sleep(0, Result.failure("boom")), asyncio.sleep(0, Result.of(2))]
+            result = await SinglyLinkedList.sequenceAsync(coroutines, maxConcurrency=1, failFast=True)
+            return result, inspect.getcoroutinestate(coroutines[1])
+        result, state = asyncio.run(run())
+        assert_that(result, instance_of(Failure))
+        assert_that(state, equal_to(inspect.CORO_CLOSED))
+
+class Test_equality:
+    class Test_Cons:
+        def test_equal_lists(self):
+            assert_that(SinglyLinkedList.list(1, 2, 3), equal_to(SinglyLinkedList.list(1, 2, 3)))
+        def test_different_lists(self):
+            assert_that(SinglyLinkedList.list(1, 2, 3) != SinglyLinkedList.list(1, 2, 4), equal_to(True))
+            assert_that(SinglyLinkedList.list(1, 2) != SinglyLinkedList.list(1, 2, 3), equal_to(True))
+        def test_not_equal_to_other_types(self):
+            assert_that(SinglyLinkedList.list(1) == [1], equal_to(False))
+            assert_that(SinglyLinkedList.list(1) == SinglyLinkedList.list(), equal_to(False))
+        def test_shared_tail_stops_comparison(self):
+            class Uncomparable:
+                def __eq__(self, other):
+                    raise AssertionError("shared tail was compared")
+                __hash__ = object.__hash__
+            shared = SinglyLinkedList.list(Uncomparable())
+            assert_that(SinglyLinkedList.cons(1, shared), equal_to(SinglyLinkedList.cons(1, shared)))
+        def test_long_lists(self):
+            assert_that(SinglyLinkedList.list(*range(100000)), equal_to(SinglyLinkedList.list(*range(100000))))
+    class Test_Nil:
+        def test_equal(self):
+            assert_that(SinglyLinkedList.list(), equal_to(Nil()))
+
+class Test_hash:
+    def test_equal_lists_have_equal_hashes(self):
+        assert_that(hash(SinglyLinkedList.list(1, 2)), equal_to(hash(SinglyLinkedList.list(1, 2))))
+    def test_usable_as_dict_key(self):
+        cache = {SinglyLinkedList.list('a', 'b'): 1}
+        assert_that(cache[SinglyLinkedList.list('a', 'b')], equal_to(1))
+    def test_hash_is_cached_on_suffix(self):
+        aList = SinglyLinkedList.list(*range(100000))
+        hash(aList)
+        extended = SinglyLinkedList.cons(-1, aList)
+        assert_that(hash(extended), equal_to(hash(SinglyLinkedList.list(-1, *range(100000)))))
+        assert_that(extended.tail()._hash, equal_to(hash(aList)))
+    def test_unhashable_element(self):
+        assert_that(calling(hash).with_args(SinglyLinkedList.list([1])), raises(TypeError))
+    def test_nil_hash_is_stable(self):
+        assert_that(hash(SinglyLinkedList.list()), equal_to(hash(Nil())))
+
+class Test_fromIterable:
+    def test_sequence(self):
+        assert_that(SinglyLinkedList.fromIterable([1, 2, 3]), equal_to(SinglyLinkedList.list(1, 2, 3)))
+    def test_generator(self):
+        aList = SinglyLinkedList.fromIterable(x * 2 for x in range(4))
+        assert_that(aList, equal_to(SinglyLinkedList.list(0, 2, 4, 6)))
+        assert_that(aList.tail().length(), equal_to(3))
+    def test_empty(self):
+        assert_that(SinglyLinkedList.fromIterable(iter(())), same_instance(Nil()))
+    def test_list_is_shared(self):
+        aList = SinglyLinkedList.list(1, 2)
+        assert_that(SinglyLinkedList.fromIterable(aList), same_instance(aList))
+    def test_large_range(self):
+        assert_that(SinglyLinkedList.fromIterable(range(1000000)).length(), equal_to(1000000))
+
+class Test_fromReversedIterable:
+    def test_generator(self):
+        aList = SinglyLinkedList.fromReversedIterable(x for x in range(3))
+        assert_that(aList, equal_to(SinglyLinkedList.list(2, 1, 0)))
+
+class Test_ListBuilder:
+    def test_append_and_extend(self):
+        builder = ListBuilder().append(1).extend(iter([2, 3])).append(4)
+        assert_that(builder.length(), equal_to(4))
+        aList = builder.freeze()
+        assert_that(aList, equal_to(SinglyLinkedList.list(1, 2, 3, 4)))
+        assert_that(aList.tail().tail().length(), equal_to(2))
+    def test_empty(self):
+        assert_that(ListBuilder().freeze(), same_instance(Nil()))
+    def test_used_after_freeze(self):
+        builder = ListBuilder().append(1)
+        builder.freeze()
+        assert_that(calling(builder.append).with_args(2), raises(RuntimeError))
+        assert_that(calling(builder.freeze), raises(RuntimeError))
+
+class Test_pickle:
+    def test_long_list(self):
+        aList = SinglyLinkedList.fromIterable(range(100000))
+        assert_that(pickle.loads(pickle.dumps(aList)), equal_to(aList))
+    def test_nil_is_shared(self):
+        assert_that(pickle.loads(pickle.dumps(SinglyLinkedList.nil())), same_instance(Nil()))
+    @pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+    def test_protocols(self, protocol):
+        aList = SinglyLinkedList.list(1, "a", SinglyLinkedList.list(2))
+        assert_that(pickle.loads(pickle.dumps(aList, protocol)), equal_to(aList))
+
+class Test_sortBy:
+    def test_natural_order(self):
+        assert_that(SinglyLinkedList.list(3, 1, 2).sortBy(), equal_to(SinglyLinkedList.list(1, 2, 3)))
+    def test_stable(self):
+        sut = SinglyLinkedList.list("bb", "a", "cc", "d").sortBy(key=len)
+        assert_that(sut, equal_to(SinglyLinkedList.list("a", "d", "bb", "cc")))
+    def test_reverse(self):
+        assert_that(SinglyLinkedList.list(1, 3, 2).sortBy(reverse=True), equal_to(SinglyLinkedList.list(3, 2, 1)))
+    def test_nil(self):
+        assert_that(SinglyLinkedList.nil().sortBy(), same_instance(Nil()))
+    def test_long_list(self):
+        sut = SinglyLinkedList.fromIterable(range(200000, 0, -1)).sortBy()
+        assert_that(sut.head(), equal_to(1))
+        assert_that(sut.length(), equal_to(200000))
+
+class Test_sortWith:
+    def test_comparator(self):
+        sut = SinglyLinkedList.list(1, 3, 2).sortWith(lambda a, b: b - a)
+        assert_that(sut, equal_to(SinglyLinkedList.list(3, 2, 1)))
+
+class Test_partition:
+    def test_split(self):
+        kept, rejected = SinglyLinkedList.list(1, 2, 3, 4, 5).partition(lambda x: x % 2)
+        assert_that(kept, equal_to(SinglyLinkedList.list(1, 3, 5)))
+        assert_that(rejected, equal_to(SinglyLinkedList.list(2, 4)))
+    def test_shares_trailing_run(self):
+        aList = SinglyLinkedList.list(2, 1, 3, 5)
+        kept, rejected = aList.partition(lambda x: x % 2)
+        assert_that(kept, same_instance(aList.tail()))
+        assert_that(rejected, equal_to(SinglyLinkedList.list(2)))
+    def test_nil(self):
+        assert_that(SinglyLinkedList.nil().partition(bool), equal_to((Nil(), Nil())))
+    def test_long_list(self):
+        kept, rejected = SinglyLinkedList.fromIterable(range(200000)).partition(lambda x: x % 2)
+        assert_that((kept.length(), rejected.length()), equal_to((100000, 100000)))
+
+class Test_span:
+    def test_span(self):
+        aList = SinglyLinkedList.list(1, 2, 3, 1)
+        prefix, rest = aList.span(lambda x: x < 3)
+        assert_that(prefix, equal_to(SinglyLinkedList.list(1, 2)))
+        assert_that(rest, same_instance(aList.drop(2)))
+    def test_splitAt(self):
+        aList = SinglyLinkedList.list(1, 2, 3)
+        assert_that(aList.splitAt(1), equal_to((SinglyLinkedList.list(1), SinglyLinkedList.list(2, 3))))
+        assert_that(aList.splitAt(5), equal_to((aList, Nil())))
+        assert_that(aList.splitAt(0), equal_to((Nil(), aList)))
+
+class Test_groupBy:
+    def test_persistent(self):
+        sut = SinglyLinkedList.list("a", "bb", "c").groupBy(len)
+        assert_that(sut, instance_of(PersistentHashMap))
+        assert_that(sut[1], equal_to(SinglyLinkedList.list("a", "c")))
+        assert_that(sut[2], equal_to(SinglyLinkedList.list("bb")))
+    def test_dict(self):
+        sut = SinglyLinkedList.list("bb", "a", "c").groupBy(len, persistent=False)
+        assert_that(list(sut), equal_to([2, 1]))
+        assert_that(sut[1], equal_to(SinglyLinkedList.list("a", "c")))
+
+class Test_zip:
+    def test_zip_stops_at_shorter(self):
+        sut = SinglyLinkedList.list(1, 2, 3).zip(SinglyLinkedList.list("a", "b"))
+        assert_that(sut, equal_to(SinglyLinkedList.list((1, "a"), (2, "b"))))
+    def test_zipWith(self):
+        sut = SinglyLinkedList.list(1, 2).zipWith(SinglyLinkedList.list(10, 20), lambda a: lambda b: a + b)
+        assert_that(sut, equal_to(SinglyLinkedList.list(11, 22)))
+    def test_unzip(self):
+        firsts, seconds = SinglyLinkedList.list((1, "a"), (2, "b")).unzip()
+        assert_that(firsts, equal_to(SinglyLinkedList.list(1, 2)))
+        assert_that(seconds, equal_to(SinglyLinkedList.list("a", "b")))
+    def test_zipWithIndex(self):
+        sut = SinglyLinkedList.list("a", "b").zipWithIndex(1)
+        assert_that(sut, equal_to(SinglyLinkedList.list(("a", 1), ("b", 2))))
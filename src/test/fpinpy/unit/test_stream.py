@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import random
+import tracemalloc
+import pytest
+from hamcrest import *
+
+from fpinpy import Stream, SinglyLinkedList, Result
+
+def naturals():
+    return Stream.iterate(0, lambda x: x + 1)
+
+class Test_Initialization:
+    def test_empty(self):
+        sut = Stream.empty()
+        assert_that(sut.isEmpty(), equal_to(True))
+        assert_that(sut.head, raises(RuntimeError))
+    def test_stream(self):
+        sut = Stream.stream(1, 2, 3)
+        assert_that(sut.toPyList(), equal_to([1, 2, 3]))
+    def test_iterate(self):
+        sut = naturals().take(3)
+        assert_that(sut.toPyList(), equal_to([0, 1, 2]))
+    def test_unfold(self):
+        sut = Stream.unfold(1, lambda n: Result.success((n, n * 2)) if n < 10 else Result.empty())
+        assert_that(sut.toPyList(), equal_to([1, 2, 4, 8]))
+
+class Test_laziness:
+    def test_tail_is_memoized(self):
+        calls = []
+        def supplier():
+            calls.append(1)
+            return Stream.empty()
+        sut = Stream.cons(1, supplier)
+        sut.tail()
+        sut.tail()
+        assert_that(len(calls), equal_to(1))
+    def test_only_consumed_prefix_is_pulled_from_generator(self):
+        pulled = []
+        def generator():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+        sut = Stream.fromIterable(generator()).map(lambda x: x * 2).take(3).toPyList()
+        assert_that(sut, equal_to([0, 2, 4]))
+        assert_that(pulled, equal_to([0, 1, 2]))
+    def test_str_shows_evaluated_prefix(self):
+        sut = Stream.stream(1, 2, 3)
+        sut.tail()
+        assert_that(str(sut), equal_to("[1, 2, ...]"))
+        sut.drop(3)
+        assert_that(str(sut), equal_to("[1, 2, 3, NIL]"))
+    def test_memory_is_bounded_when_head_not_retained(self):
+        tracemalloc.start()
+        sut = naturals().take(20000).foldLeft(0, lambda x: lambda y: x + y)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert_that(sut, equal_to(sum(range(20000))))
+        assert_that(peak, less_than(20000))
+
+class Test_combinators:
+    def test_map_filter_on_infinite_stream(self):
+        sut = naturals().map(lambda x: x * 3).filter(lambda x: x % 2 == 0).take(4)
+        assert_that(sut.toPyList(), equal_to([0, 6, 12, 18]))
+    def test_filter_skips_long_runs(self):
+        sut = naturals().filter(lambda x: x > 100000).head()
+        assert_that(sut, equal_to(100001))
+    def test_flatMap(self):
+        sut = Stream.stream(1, 2, 3).flatMap(lambda x: Stream.stream(x, -x) if x != 2 else Stream.empty())
+        assert_that(sut.toPyList(), equal_to([1, -1, 3, -3]))
+    def test_flatMap_on_infinite_stream(self):
+        sut = naturals().flatMap(lambda x: Stream.stream(x, x)).take(4)
+        assert_that(sut.toPyList(), equal_to([0, 0, 1, 1]))
+    def test_foldLeft(self):
+        sut = Stream.stream(1, 2, 3).foldLeft(0, lambda x: lambda y: x + y)
+        assert_that(sut, equal_to(6))
+    def test_drop(self):
+        sut = naturals().drop(100000).head()
+        assert_that(sut, equal_to(100000))
+    def test_drop_too_many_yields_empty(self):
+        sut = Stream.stream(1).drop(2)
+        assert_that(sut.isEmpty(), equal_to(True))
+    def test_takeWhile(self):
+        sut = naturals().takeWhile(lambda x: x < 3)
+        assert_that(sut.toPyList(), equal_to([0, 1, 2]))
+    def test_toList(self):
+        sut = Stream.fromIterable(range(3)).toList()
+        assert_that(str(sut), equal_to(str(SinglyLinkedList.list(0, 1, 2))))
+    def test_headOption(self):
+        assert_that(Stream.stream(1).headOption().getOrElse(None), equal_to(1))
+        assert_that(Stream.empty().headOption().isEmpty(), equal_to(True))
+
+class Test_sortedStream:
+    def test_in_memory(self):
+        assert_that(Stream.sortedStream([3, 1, 2]).toPyList(), equal_to([1, 2, 3]))
+    def test_empty(self):
+        assert_that(Stream.sortedStream([]).isEmpty(), equal_to(True))
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_spilled_runs_are_stable(self, reverse, tmp_path):
+        rng = random.Random(3)
+        data = [(rng.randrange(10), i) for i in range(2000)]
+        sut = Stream.sortedStream(data, key=lambda pair: pair[0], reverse=reverse, runSize=50, fanIn=3, directory=str(tmp_path))
+        assert_that(sut.toPyList(), equal_to(sorted(data, key=lambda pair: pair[0], reverse=reverse)))
+    def test_temporary_files_are_anonymous(self, tmp_path):
+        Stream.sortedStream(range(1000, 0, -1), runSize=10, directory=str(tmp_path)).toPyList()
+        assert_that(list(tmp_path.iterdir()), empty())
+    def test_sortBy(self):
+        sut = Stream.stream("bb", "a", "ccc").sortBy(key=len, runSize=1)
+        assert_that(sut.toPyList(), equal_to(["a", "bb", "ccc"]))
+    def test_invalid_sizes(self):
+        assert_that(calling(Stream.sortedStream).with_args([], runSize=0), raises(ValueError))
+        assert_that(calling(Stream.sortedStream).with_args([], fanIn=1), raises(ValueError))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import sys
+import threading
+from hamcrest import *
+
+from fpinpy import SinglyLinkedList, Result, TailCall, trampoline
+from fpinpy.tailcall import Done, Suspend
+
+DEEP = sys.getrecursionlimit() * 50
+
+def foldLeft(acc, aList, function):
+    if aList.isEmpty():
+        return TailCall.done(acc)
+    return TailCall.suspend(lambda: foldLeft(function(acc)(aList.head()), aList.tail(), function))
+
+@trampoline
+def trampolinedFoldLeft(acc, aList, function):
+    if aList.isEmpty():
+        return TailCall.done(acc)
+    return trampolinedFoldLeft.tailCall(function(acc)(aList.head()), aList.tail(), function)
+
+@trampoline
+def isEven(n):
+    return TailCall.done(True) if n == 0 else isOdd.tailCall(n - 1)
+
+@trampoline
+def isOdd(n):
+    return TailCall.done(False) if n == 0 else isEven.tailCall(n - 1)
+
+@trampoline
+def count(n):
+    if n == 0:
+        return TailCall.done(0)
+    return count.tailCall(n - 1).map(lambda x: x + 1)
+
+@trampoline
+def countResult(n, failAt=None):
+    if n == 0:
+        return TailCall.done(Result.success(0))
+    def step(x):
+        if x == failAt:
+            raise ValueError(f"failed at {x}")
+        return TailCall.done(Result.success(x + 1))
+    return countResult.tailCall(n - 1, failAt).flatMapResult(step)
+
+@trampoline
+def depth(n):
+    return TailCall.done(0 if n == 0 else 1 + depth(n - 1))
+
+@trampoline
+def total(aList):
+    return TailCall.done(aList.foldLeft(0, lambda acc: lambda x: acc + depth(x)))
+
+add = lambda acc: lambda x: acc + x
+
+class Test_TailCall:
+    def test_done(self):
+        assert_that(TailCall.done(3).run(), equal_to(3))
+        assert_that(TailCall.done(3).isSuspended(), equal_to(False))
+        assert_that(TailCall.done(3), instance_of(Done))
+    def test_suspend_is_lazy(self):
+        calls = []
+        step = TailCall.suspend(lambda: calls.append(1) or TailCall.done(2))
+        assert_that(step, instance_of(Suspend))
+        assert_that(step.isSuspended(), equal_to(True))
+        assert_that(calls, empty())
+        assert_that(step.run(), equal_to(2))
+        assert_that(calls, equal_to([1]))
+    def test_deep_suspend_runs_in_constant_stack(self):
+        aList = SinglyLinkedList.fromIterable(range(DEEP))
+        assert_that(foldLeft(0, aList, add).run(), equal_to(sum(range(DEEP))))
+    def test_map(self):
+        assert_that(TailCall.done(2).map(lambda x: x * 10).run(), equal_to(20))
+    def test_flatMap(self):
+        step = TailCall.suspend(lambda: TailCall.done(2)).flatMap(lambda x: TailCall.suspend(lambda: TailCall.done(x + 1)))
+        assert_that(step.run(), equal_to(3))
+    def test_deeply_left_nested_flatMap(self):
+        step = TailCall.done(0)
+        for _ in range(DEEP):
+            step = step.flatMap(lambda x: TailCall.done(x + 1))
+        assert_that(step.run(), equal_to(DEEP))
+    def test_step_must_be_tailcall(self):
+        assert_that(calling(TailCall.suspend(lambda: 3).run), raises(TypeError, "got int"))
+
+class Test_flatMapResult:
+    def test_success(self):
+        assert_that(TailCall.done(Result.success(1)).flatMapResult(lambda x: TailCall.done(Result.success(x + 1))).run(),
+                    equal_to(Result.success(2)))
+    def test_failure_short_circuits(self):
+        failure = Result.failure("no")
+        assert_that(TailCall.done(failure).flatMapResult(lambda x: 1 / 0).run(), same_instance(failure))
+    def test_empty_short_circuits(self):
+        assert_that(TailCall.done(Result.empty()).flatMapResult(lambda x: 1 / 0).run().isEmpty(), equal_to(True))
+    def test_exception_becomes_failure(self):
+        result = TailCall.done(Result.success(1)).flatMapResult(lambda x: 1 / 0).run()
+        assert_that(result.isFailure(), equal_to(True))
+        assert_that(result.failureValue(), instance_of(ZeroDivisionError))
+    def test_deep_chain(self):
+        assert_that(countResult(DEEP), equal_to(Result.success(DEEP)))
+    def test_deep_chain_failure(self):
+        result = countResult(DEEP, failAt=10)
+        assert_that(result.isFailure(), equal_to(True))
+        assert_that(str(result.failureValue()), equal_to("failed at 10"))
+
+class Test_trampoline:
+    def test_returns_value(self):
+        assert_that(trampolinedFoldLeft(0, SinglyLinkedList.list(1, 2, 3), add), equal_to(6))
+    def test_deep_tail_recursion(self):
+        aList = SinglyLinkedList.fromIterable(range(DEEP))
+        assert_that(trampolinedFoldLeft(0, aList, add), equal_to(sum(range(DEEP))))
+    def test_mutual_recursion(self):
+        assert_that(isEven(DEEP + 1), equal_to(False))
+        assert_that(isOdd(DEEP + 1), equal_to(True))
+    def test_non_tail_recursion_with_map(self):
+        assert_that(count(DEEP), equal_to(DEEP))
+    def test_nested_non_tail_call_returns_value(self):
+        assert_that(depth(50), equal_to(50))
+    def test_call_from_callback_returns_value(self):
+        assert_that(total(SinglyLinkedList.list(1, 2, 3)), equal_to(6))
+    def test_call_from_map_inside_running_trampoline(self):
+        @trampoline
+        def shifted(n):
+            return TailCall.suspend(lambda: TailCall.done(n)).map(lambda x: x + depth(3))
+        assert_that(shifted(1), equal_to(4))
+    def test_tailCall_is_lazy(self):
+        calls = []
+        @trampoline
+        def recorded(n):
+            calls.append(n)
+            return TailCall.done(n)
+        step = recorded.tailCall(7)
+        assert_that(calls, empty())
+        assert_that(step.run(), equal_to(7))
+        assert_that(calls, equal_to([7]))
+    def test_keeps_metadata(self):
+        assert_that(trampolinedFoldLeft.__name__, equal_to("trampolinedFoldLeft"))
+    def test_must_return_tailcall(self):
+        @trampoline
+        def plain(n):
+            return n
+        assert_that(calling(plain).with_args(1), raises(TypeError, "plain must return a TailCall"))
+    def test_exception_resets_state(self):
+        @trampoline
+        def broken(n):
+            return TailCall.suspend(lambda: 1 / 0)
+        assert_that(calling(broken).with_args(1), raises(ZeroDivisionError))
+        assert_that(isEven(4), equal_to(True))
+    def test_threads_are_independent(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(count(10_000))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_that(results, equal_to([10_000] * 4))
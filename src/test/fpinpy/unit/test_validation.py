@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import pickle
+import tracemalloc
+import pytest
+from hamcrest import *
+
+from fpinpy import SinglyLinkedList, Result, Validation
+from fpinpy.result import Valid, Invalid, Errors, ErrorSample, ValidationError
+
+def parse(x):
+    if x % 3 == 0:
+        raise ValueError(f"bad {x}")
+    if x % 7 == 0:
+        return Result.failure(KeyError(x))
+    return Result.success(x)
+
+add = lambda x: lambda y: x + y
+
+class Test_Errors:
+    def test_counts(self):
+        errors = Errors.of(ValueError("a"), ValueError("b"), KeyError("c"), "d")
+        assert_that(errors.count(), equal_to(4))
+        assert_that(errors.counts(), equal_to({"ValueError": 2, "KeyError": 1, "RuntimeError": 1}))
+        assert_that(list(errors.counts()), equal_to(["ValueError", "KeyError", "RuntimeError"]))
+    def test_samples_hold_no_exceptions(self):
+        sample = Errors.of(ValueError("a")).samples()[0]
+        assert_that(sample, equal_to(ErrorSample(None, "ValueError", "a")))
+    def test_first_sampling_keeps_first_cap(self):
+        errors = Errors.of(*[ValueError(i) for i in range(10)], cap=3)
+        assert_that([sample.message for sample in errors.samples()], equal_to(["0", "1", "2"]))
+        assert_that(errors.isTruncated(), equal_to(True))
+        assert_that(errors.count(), equal_to(10))
+    def test_zero_cap_counts_only(self):
+        errors = Errors.of(ValueError(1), ValueError(2), cap=0)
+        assert_that(errors.samples(), empty())
+        assert_that(errors.counts(), equal_to({"ValueError": 2}))
+    def test_reservoir_sampling_is_reproducible_and_spread(self):
+        first = Errors.of(*[ValueError(i) for i in range(1000)], cap=10, sampling="reservoir", seed=7)
+        second = Errors.of(*[ValueError(i) for i in range(1000)], cap=10, sampling="reservoir", seed=7)
+        assert_that(first.samples(), equal_to(second.samples()))
+        assert_that(len(first.samples()), equal_to(10))
+        assert_that(max(int(sample.message) for sample in first.samples()), greater_than(100))
+    def test_merge(self):
+        merged = Errors.of(ValueError("a"), cap=2).merge(Errors.of(KeyError("b"), KeyError("c")))
+        assert_that(merged.count(), equal_to(3))
+        assert_that(merged.counts(), equal_to({"KeyError": 2, "ValueError": 1}))
+        assert_that([sample.message for sample in merged.samples()], equal_to(["a", "'b'"]))
+    def test_merge_reservoir(self):
+        left = Errors.of(*[ValueError(i) for i in range(100)], cap=5, sampling="reservoir", seed=1)
+        right = Errors.of(*[KeyError(i) for i in range(100)], cap=5, sampling="reservoir", seed=2)
+        merged = left.merge(right)
+        assert_that(merged.count(), equal_to(200))
+        assert_that(len(merged.samples()), equal_to(5))
+        assert_that(left.count(), equal_to(100))
+    def test_invalid_settings(self):
+        assert_that(calling(Errors).with_args(-1), raises(ValueError))
+        assert_that(calling(Errors).with_args(10, "last"), raises(ValueError))
+
+class Test_Validation:
+    def test_valid(self):
+        sut = Validation.valid(2)
+        assert_that(sut, instance_of(Valid))
+        assert_that(sut.isValid(), equal_to(True))
+        assert_that(sut.map(lambda x: x + 1), equal_to(Validation.valid(3)))
+        assert_that(sut.getOrElse(0), equal_to(2))
+        assert_that(sut.toResult(), equal_to(Result.success(2)))
+    def test_nodes_have_no_dict(self):
+        assert_that(hasattr(Validation.valid(1), "__dict__"), equal_to(False))
+        assert_that(hasattr(Validation.invalid(ValueError("a")), "__dict__"), equal_to(False))
+    def test_invalid(self):
+        sut = Validation.invalid(ValueError("a"))
+        assert_that(sut, instance_of(Invalid))
+        assert_that(sut.isInvalid(), equal_to(True))
+        assert_that(sut.map(lambda x: x + 1), same_instance(sut))
+        assert_that(sut.getOrElse(0), equal_to(0))
+        assert_that(calling(sut.validValue), raises(RuntimeError))
+        assert_that(calling(Validation.invalid), raises(ValueError))
+    def test_map_exception_is_invalid(self):
+        sut = Validation.valid(0).map(lambda x: 1 / x)
+        assert_that(sut.errors().counts(), equal_to({"ZeroDivisionError": 1}))
+    def test_map2_accumulates(self):
+        sut = Validation.map2(Validation.invalid(ValueError("a")), Validation.invalid(KeyError("b")), add)
+        assert_that(sut.errors().count(), equal_to(2))
+        assert_that([sample.type for sample in sut.errors().samples()], equal_to(["ValueError", "KeyError"]))
+        assert_that(Validation.map2(Validation.valid(1), Validation.valid(2), add), equal_to(Validation.valid(3)))
+        assert_that(Validation.map2(Validation.valid(1), Validation.invalid("b"), add).errors().count(), equal_to(1))
+    def test_flatMap_stops_at_first(self):
+        sut = Validation.invalid("a").flatMap(lambda x: Validation.invalid("b"))
+        assert_that(sut.errors().count(), equal_to(1))
+        assert_that(Validation.valid(1).flatMap(lambda x: Validation.valid(x + 1)), equal_to(Validation.valid(2)))
+    def test_fromResult(self):
+        assert_that(Validation.fromResult(Result.success(1)), equal_to(Validation.valid(1)))
+        assert_that(Validation.fromResult(Result.failure("a")).errors().counts(), equal_to({"RuntimeError": 1}))
+        assert_that(Validation.fromResult(Result.empty()).isInvalid(), equal_to(True))
+        assert_that(Validation.fromResult(Result.empty(), emptyIsFailure=False), equal_to(Validation.valid(None)))
+    def test_toResult_invalid(self):
+        sut = Validation.invalid(ValueError("a"), ValueError("b")).toResult()
+        assert_that(sut.isFailure(), equal_to(True))
+        assert_that(sut.failureValue(), instance_of(ValidationError))
+        assert_that(sut.failureValue().errors.count(), equal_to(2))
+    def test_pickle(self):
+        sut = Validation.traverse(range(10), parse)
+        assert_that(pickle.loads(pickle.dumps(sut)), equal_to(sut))
+
+class Test_traverse:
+    def test_all_valid(self):
+        assert_that(Validation.traverse(SinglyLinkedList.list(1, 2, 4), parse), equal_to(Validation.valid(SinglyLinkedList.list(1, 2, 4))))
+    def test_empty_input(self):
+        assert_that(Validation.traverse([], parse), equal_to(Validation.valid(SinglyLinkedList.list())))
+    def test_accumulates_every_error(self):
+        sut = Validation.traverse(range(1, 22), parse, cap=2)
+        assert_that(sut.errors().count(), equal_to(9))
+        assert_that(sut.errors().counts(), equal_to({"ValueError": 7, "KeyError": 2}))
+        assert_that(sut.errors().samples(), equal_to((ErrorSample(2, "ValueError", "bad 3"), ErrorSample(5, "ValueError", "bad 6"))))
+    def test_empty_results(self):
+        results = [Result.success(1), Result.empty()]
+        assert_that(Validation.sequence(results).errors().counts(), equal_to({"Empty": 1}))
+        assert_that(Validation.sequence(results, emptyIsFailure=False), equal_to(Validation.valid(SinglyLinkedList.list(1))))
+    def test_nested_validations_keep_counts(self):
+        inner = Validation.invalid(*[ValueError(i) for i in range(5)], cap=1)
+        sut = Validation.sequence([Validation.valid(1), inner, Validation.invalid("x")], cap=10)
+        assert_that(sut.errors().count(), equal_to(6))
+        assert_that(sut.errors().counts(), equal_to({"ValueError": 5, "RuntimeError": 1}))
+        assert_that([sample.position for sample in sut.errors().samples()], equal_to([1, 2]))
+    def test_memory_is_bounded(self):
+        tracemalloc.start()
+        sut = Validation.traverse(range(200_000), parse, cap=10)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert_that(sut.errors().count(), greater_than(80_000))
+        assert_that(peak, less_than(200_000))
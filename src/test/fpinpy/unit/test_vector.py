@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Jonathan L. Komar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import random
+import pytest
+from hamcrest import *
+
+from fpinpy import PersistentVector, SinglyLinkedList, Success, Failure
+
+class Test_Initialization:
+    def test_empty(self):
+        sut = PersistentVector.empty()
+        assert_that(sut.length(), equal_to(0))
+        assert_that(sut.isEmpty(), equal_to(True))
+    def test_vector(self):
+        sut = PersistentVector.vector(1, 2, 3)
+        assert_that(sut.toPyList(), equal_to([1, 2, 3]))
+    def test_fromList(self):
+        sut = PersistentVector.fromList(SinglyLinkedList.list(1, 2, 3))
+        assert_that(str(sut.toList()), equal_to("[1, 2, 3, NIL]"))
+
+class Test_get:
+    def test_get_across_levels(self):
+        sut = PersistentVector.fromIterable(range(40000))
+        assert_that([sut.get(i) for i in (0, 31, 32, 1023, 1024, 32767, 32768, 39999)],
+                    equal_to([0, 31, 32, 1023, 1024, 32767, 32768, 39999]))
+    def test_get_out_of_range(self):
+        assert_that(calling(PersistentVector.vector(1).get).with_args(1), raises(IndexError))
+    def test_getOrFailure(self):
+        sut = PersistentVector.vector(1, 2)
+        assert_that(sut.getOrFailure(1), instance_of(Success))
+        assert_that(sut.getOrFailure(2), instance_of(Failure))
+    def test_negative_index(self):
+        assert_that(PersistentVector.vector(1, 2, 3)[-1], equal_to(3))
+
+class Test_set:
+    def test_set_shares_and_preserves_original(self):
+        original = PersistentVector.fromIterable(range(100))
+        sut = original.set(5, -5)
+        assert_that(sut.get(5), equal_to(-5))
+        assert_that(original.get(5), equal_to(5))
+        assert_that(sut._root.array[1], same_instance(original._root.array[1]))
+    def test_set_at_length_appends(self):
+        sut = PersistentVector.vector(1).set(1, 2)
+        assert_that(sut.toPyList(), equal_to([1, 2]))
+
+class Test_append_pop:
+    def test_append_preserves_original(self):
+        original = PersistentVector.fromIterable(range(32))
+        sut = original.append(32)
+        assert_that(sut.length(), equal_to(33))
+        assert_that(original.length(), equal_to(32))
+        assert_that(sut.toPyList(), equal_to(list(range(33))))
+    def test_pop_back_to_empty(self):
+        sut = PersistentVector.fromIterable(range(1100))
+        for n in range(1100, 0, -1):
+            assert_that(sut.last(), equal_to(n - 1))
+            sut = sut.pop()
+        assert_that(sut.isEmpty(), equal_to(True))
+    def test_pop_empty_fails(self):
+        assert_that(calling(PersistentVector.empty().pop), raises(RuntimeError))
+
+class Test_slice:
+    def test_slice(self):
+        sut = PersistentVector.fromIterable(range(2000))[100:1500]
+        assert_that(sut.toPyList(), equal_to(list(range(100, 1500))))
+        assert_that(sut.get(0), equal_to(100))
+    def test_slice_then_update(self):
+        sut = PersistentVector.fromIterable(range(2000))[1000:1040].append(-1).pop().pop().set(0, -2)
+        assert_that(sut.toPyList(), equal_to([-2] + list(range(1001, 1039))))
+    def test_slice_with_step(self):
+        sut = PersistentVector.fromIterable(range(10))[::3]
+        assert_that(sut.toPyList(), equal_to([0, 3, 6, 9]))
+    def test_empty_slice(self):
+        assert_that(PersistentVector.vector(1, 2)[1:1].isEmpty(), equal_to(True))
+
+    def test_slice_of_slice(self):
+        sut = PersistentVector.fromIterable(range(1100)).slice(1024, 1090).slice(0, 10)
+        assert_that(sut.toPyList(), equal_to(list(range(1024, 1034))))
+    def test_slice_of_slice_then_append_and_pop(self):
+        sliced = PersistentVector.fromIterable(range(2000)).slice(1455, 1479).slice(16, 17)
+        sut = sliced
+        for x in range(40):
+            sut = sut.append(x)
+        assert_that(sut.toPyList(), equal_to([1471] + list(range(40))))
+        assert_that(sliced.toPyList(), equal_to([1471]))
+        popped = PersistentVector.fromIterable(range(1100)).slice(1043, 1095)
+        for _ in range(40):
+            popped = popped.pop()
+        assert_that(popped.slice(0, 10).toPyList(), equal_to(list(range(1043, 1053))))
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_operations_match_list(self, seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            size = rng.choice([0, 31, 33, 100, 1024, 1100, 2000, 33_000 if rng.random() < 0.1 else 1056])
+            sut, expected = PersistentVector.fromIterable(range(size)), list(range(size))
+            for _ in range(4):
+                operation = rng.random()
+                if operation < 0.5:
+                    start = rng.randint(0, len(expected))
+                    end = rng.randint(start, len(expected))
+                    sut, expected = sut.slice(start, end), expected[start:end]
+                elif operation < 0.7:
+                    for _ in range(rng.choice([1, 40])):
+                        sut, expected = sut.append(-1), expected + [-1]
+                elif expected and operation < 0.85:
+                    for _ in range(min(len(expected), rng.choice([1, 40]))):
+                        sut, expected = sut.pop(), expected[:-1]
+                elif expected:
+                    index = rng.randrange(len(expected))
+                    sut = sut.set(index, "x")
+                    expected[index] = "x"
+                assert_that(sut.toPyList(), equal_to(expected))
+                assert_that(sut.length(), equal_to(len(expected)))
+
+class Test_transient:
+    def test_builder(self):
+        builder = PersistentVector.builder()
+        for i in range(5000):
+            builder.append(i)
+        sut = builder.set(0, -1).persistent()
+        assert_that(sut.toPyList(), equal_to([-1] + list(range(1, 5000))))
+    def test_transient_does_not_change_original(self):
+        original = PersistentVector.fromIterable(range(100))
+        sut = original.transient().set(0, -1).append(100).persistent()
+        assert_that(original.get(0), equal_to(0))
+        assert_that(original.length(), equal_to(100))
+        assert_that(sut.get(0), equal_to(-1))
+    def test_use_after_persistent_fails(self):
+        transient = PersistentVector.builder()
+        transient.persistent()
+        assert_that(calling(transient.append).with_args(1), raises(RuntimeError))
+
+class Test_bulk:
+    def test_map(self):
+        sut = PersistentVector.vector(1, 2, 3).map(lambda x: x * 2)
+        assert_that(sut.toPyList(), equal_to([2, 4, 6]))
+    def test_foldLeft(self):
+        sut = PersistentVector.fromIterable(range(100)).foldLeft(0, lambda x: lambda y: x + y)
+        assert_that(sut, equal_to(4950))